@@ -0,0 +1,302 @@
+"""
+Benchmark of the compact response mode of ISS MOEX: bytes transferred and decode time of the full document and of the
+    document requested with `iss.meta=off`, `iss.only` and explicit columns, for the candles, the main information of
+    the instrument and the composition of the index.
+
+The full documents contain everything ISS MOEX returns without the compact parameters: the metadata of every block,
+    all columns and the blocks which are not used (e.g. the boards of the instrument). With `--fixtures` both documents
+    are requested from the local stand-in of ISS MOEX, which replays the recorded responses; `--record` records the
+    missing ones from ISS MOEX once. Without fixtures the documents are generated in the same shape.
+
+Run from the root of the repository: `python -m benchmarks.bench_compact --fixtures benchmarks/fixtures --record`.
+"""
+
+# standard library imports
+import json
+import asyncio
+import argparse
+from pathlib import Path
+from timeit import Timer
+from datetime import date, datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from collections.abc import Callable
+
+# third party imports
+import orjson
+import aiohttp
+
+# local imports
+from tech.candles import Candles
+from benchmarks.iss_stub import IssStub
+from values.constans import MOEX_REQUESTS
+
+DAY: date = date(2024, 10, 1)
+REQUESTS: dict[str, str] = {
+    'candles': MOEX_REQUESTS['DETAIL_INFO'].format('shares', 'SBER', DAY, DAY, 1),
+    'main_info': MOEX_REQUESTS['MAIN_INFO'].format('IMOEX'),
+    'composition': MOEX_REQUESTS['COMPOSITION_INFO'].format('index', 'IMOEX')
+}
+CANDLE_COLUMNS: dict[str, dict] = {
+    'open': {'type': 'double'},
+    'close': {'type': 'double'},
+    'high': {'type': 'double'},
+    'low': {'type': 'double'},
+    'value': {'type': 'double'},
+    'volume': {'type': 'double'},
+    'begin': {'type': 'datetime', 'bytes': 19, 'max_size': 0},
+    'end': {'type': 'datetime', 'bytes': 19, 'max_size': 0}
+}
+DESCRIPTION_COLUMNS: dict[str, dict] = {
+    'name': {'type': 'string', 'bytes': 189, 'max_size': 0},
+    'title': {'type': 'string', 'bytes': 765, 'max_size': 0},
+    'value': {'type': 'string', 'bytes': 765, 'max_size': 0},
+    'type': {'type': 'string', 'bytes': 33, 'max_size': 0},
+    'sort_order': {'type': 'int32'},
+    'is_hidden': {'type': 'int32'},
+    'precision': {'type': 'int32'}
+}
+BOARD_COLUMNS: dict[str, dict] = {
+    'secid': {'type': 'string', 'bytes': 36, 'max_size': 0},
+    'boardid': {'type': 'string', 'bytes': 12, 'max_size': 0},
+    'title': {'type': 'string', 'bytes': 381, 'max_size': 0},
+    'board_group_id': {'type': 'int32'},
+    'market_id': {'type': 'int32'},
+    'market': {'type': 'string', 'bytes': 45, 'max_size': 0},
+    'engine_id': {'type': 'int32'},
+    'engine': {'type': 'string', 'bytes': 45, 'max_size': 0},
+    'is_traded': {'type': 'int32'},
+    'decimals': {'type': 'int32'},
+    'history_from': {'type': 'date', 'bytes': 10, 'max_size': 0},
+    'history_till': {'type': 'date', 'bytes': 10, 'max_size': 0},
+    'listed_from': {'type': 'date', 'bytes': 10, 'max_size': 0},
+    'listed_till': {'type': 'date', 'bytes': 10, 'max_size': 0},
+    'is_primary': {'type': 'int32'},
+    'currencyid': {'type': 'string', 'bytes': 9, 'max_size': 0}
+}
+TICKER_COLUMNS: dict[str, dict] = {
+    'ticker': {'type': 'string', 'bytes': 36, 'max_size': 0},
+    'from': {'type': 'date', 'bytes': 10, 'max_size': 0},
+    'till': {'type': 'date', 'bytes': 10, 'max_size': 0},
+    'tradingsession': {'type': 'int32'}
+}
+CURSOR_COLUMNS: dict[str, dict] = {
+    'INDEX': {'type': 'int64'},
+    'TOTAL': {'type': 'int64'},
+    'PAGESIZE': {'type': 'int64'}
+}
+
+
+def make_block(metadata: dict[str, dict], data: list[list]) -> dict:
+    """
+    Function for creating the block of the full response of ISS MOEX.
+
+    Args:
+        metadata: types of the columns by names.
+        data: rows of the block.
+
+    Returns:
+        block with the metadata, the columns and the data.
+    """
+    return {'metadata': metadata, 'columns': list(metadata), 'data': data}
+
+
+def make_candles(size: int) -> dict[str, dict]:
+    """
+    Function for generating the full response with the candles.
+
+    Args:
+        size: number of candles.
+
+    Returns:
+        full response of ISS MOEX.
+    """
+    begin: datetime = datetime(2024, 1, 3, 10)
+    rows: list[list] = []
+    for num in range(size):
+        value: float = round(250 + (num % 97) * 0.37, 2)
+        rows.append([
+            value, round(value + 0.21, 2), round(value + 0.5, 2), round(value - 0.5, 2),
+            round(value * 10_000 * (num % 13 + 1), 1), float(10_000 * (num % 13 + 1)),
+            (begin + timedelta(minutes=num)).strftime('%Y-%m-%d %H:%M:%S'),
+            (begin + timedelta(minutes=num, seconds=59)).strftime('%Y-%m-%d %H:%M:%S')
+        ])
+    return {'candles': make_block(CANDLE_COLUMNS, rows)}
+
+
+def make_main_info(_: int) -> dict[str, dict]:
+    """
+    Function for generating the full response with the main information of the index and its boards.
+
+    Returns:
+        full response of ISS MOEX.
+    """
+    names: list[str] = [
+        'SECID', 'NAME', 'SHORTNAME', 'LATNAME', 'ISSUEDATE', 'INITIALVALUE', 'INITIALCAPITALIZATION', 'CURRENCYID',
+        'FREQUENCY', 'DESCRIPTION', 'TYPENAME', 'GROUP', 'TYPE', 'GROUPNAME', 'EMITTER_ID'
+    ]
+    description: list[list] = [
+        [name, f'Наименование поля {name}', f'Значение поля {name}', 'string', num, 0, None]
+        for num, name in enumerate(names)
+    ]
+    boards: list[list] = [
+        [
+            'IMOEX', f'SNDX{num:02}', f'Индексы фондового рынка, режим {num}', 9, 5, 'index', 1, 'stock',
+            num % 2, 2, '1997-09-22', '2024-10-01', '1997-09-22', '2024-10-01', int(num == 0), 'RUB'
+        ]
+        for num in range(12)
+    ]
+    return {'description': make_block(DESCRIPTION_COLUMNS, description), 'boards': make_block(BOARD_COLUMNS, boards)}
+
+
+def make_composition(_: int) -> dict[str, dict]:
+    """
+    Function for generating the full response with the first page of the composition of the index.
+
+    Returns:
+        full response of ISS MOEX.
+    """
+    tickers: list[list] = [[f'T{num:03}', '2010-01-01', '2024-10-01', 1] for num in range(100)]
+    return {
+        'tickers': make_block(TICKER_COLUMNS, tickers),
+        'tickers.cursor': make_block(CURSOR_COLUMNS, [[0, 300, 100]])
+    }
+
+
+GENERATORS: dict[str, Callable[[int], dict[str, dict]]] = {
+    'candles': make_candles,
+    'main_info': make_main_info,
+    'composition': make_composition
+}
+
+
+def get_full_url(url: str) -> str:
+    """
+    Function for removing the parameters of the compact response from the url.
+
+    Args:
+        url: url of the compact request.
+
+    Returns:
+        url of the full request.
+    """
+    parts = urlsplit(url)
+    query: list[tuple[str, str]] = [
+        (key, value) for key, value in parse_qsl(parts.query)
+        if not key.startswith('iss.') and not key.endswith('.columns')
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def make_compact(document: dict[str, dict], url: str) -> dict[str, dict]:
+    """
+    Function for reducing the full response the way ISS MOEX does for the compact request.
+
+    Args:
+        document: full response of ISS MOEX.
+        url: url of the compact request.
+
+    Returns:
+        compact response of ISS MOEX.
+    """
+    query: dict[str, str] = dict(parse_qsl(urlsplit(url).query))
+    compact: dict[str, dict] = {}
+    for block_name in query['iss.only'].split(','):
+        block: dict = document[block_name]
+        columns: list[str] = query.get(f'{block_name}.columns', ','.join(block['columns'])).split(',')
+        indexes: list[int] = [block['columns'].index(column) for column in columns]
+        compact[block_name] = {'columns': columns, 'data': [[row[index] for index in indexes] for row in block['data']]}
+    return compact
+
+
+def generate_documents(candles: int) -> dict[str, dict[str, bytes]]:
+    """
+    Function for generating the full and the compact responses. Both documents are encoded the same way as ISS MOEX
+        encodes them, so the difference in size comes only from the dropped blocks, columns and metadata.
+
+    Args:
+        candles: number of candles in the response with the candles.
+
+    Returns:
+        encoded full and compact documents by names of the requests.
+    """
+    documents: dict[str, dict[str, bytes]] = {}
+    for request_name, url in REQUESTS.items():
+        full: dict[str, dict] = GENERATORS[request_name](candles)
+        documents[request_name] = {
+            'full': json.dumps(full, ensure_ascii=False).encode(),
+            'compact': json.dumps(make_compact(full, url), ensure_ascii=False).encode()
+        }
+    return documents
+
+
+async def request_documents(base_url: str) -> dict[str, dict[str, bytes]]:
+    """
+    Async function for requesting the full and the compact responses from the local stand-in of ISS MOEX.
+
+    Args:
+        base_url: base url of the stand-in.
+
+    Returns:
+        full and compact documents by names of the requests.
+    """
+    documents: dict[str, dict[str, bytes]] = {}
+    async with aiohttp.ClientSession(base_url=base_url) as session:
+        for request_name, url in REQUESTS.items():
+            documents[request_name] = {}
+            for document_name, document_url in (('full', get_full_url(url)), ('compact', url)):
+                parts = urlsplit(document_url)
+                async with session.get(urlunsplit(('', '', parts.path, parts.query, ''))) as response:
+                    response.raise_for_status()
+                    documents[request_name][document_name] = await response.read()
+    return documents
+
+
+def measure(function: Callable, repeat: int) -> float:
+    """
+    Function for measuring the best time of one call.
+
+    Args:
+        function: measured function.
+        repeat: number of repetitions.
+
+    Returns:
+        best time of one call in seconds.
+    """
+    timer: Timer = Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fixtures', type=Path, default=None, help='directory of the recorded responses')
+    parser.add_argument('--record', action='store_true', help='record the missing fixtures from ISS MOEX')
+    parser.add_argument('--candles', type=int, default=500, help='number of generated candles without fixtures')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repetitions')
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.fixtures is None:
+        documents: dict[str, dict[str, bytes]] = generate_documents(args.candles)
+    else:
+        with IssStub(args.fixtures, args.record) as stub:
+            documents: dict[str, dict[str, bytes]] = asyncio.run(request_documents(stub.base_url))
+
+    decoders: dict[str, Callable[[bytes], dict]] = {'json': json.loads, 'orjson': orjson.loads}
+    print(f'{"request":<13}{"document":<10}{"decoder":<9}{"KiB":>8}{"decode µs":>11}{"to Candles µs":>15}')
+    for request_name, pair in documents.items():
+        for document_name, document in pair.items():
+            for decoder_name, decoder in decoders.items():
+                decode_time: float = measure(lambda: decoder(document), args.repeat)
+                candles_time: str = '-'
+                if request_name == 'candles':
+                    candles_time: str = '{:.0f}'.format(1e6 * measure(
+                        lambda: Candles.from_rows(decoder(document)['candles']['data']), args.repeat
+                    ))
+                print(
+                    f'{request_name:<13}{document_name:<10}{decoder_name:<9}{len(document) / 1024:>8.1f}'
+                    f'{decode_time * 1e6:>11.0f}{candles_time:>15}'
+                )
+
+
+if __name__ == '__main__':
+    main()
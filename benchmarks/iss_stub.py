@@ -0,0 +1,321 @@
+"""
+Local stand-in of ISS MOEX for benchmarks. Recorded responses are replayed from the fixtures directory, requests
+    without a fixture get synthetic responses of the same shape. In the record mode responses of the missing fixtures
+    are requested from ISS MOEX and saved, so the next runs are offline.
+
+Run from the root of the repository: `python -m benchmarks.iss_stub --port 8765`.
+"""
+
+# standard library imports
+import socket
+import asyncio
+import hashlib
+import argparse
+import threading
+from zlib import crc32
+from pathlib import Path
+from time import monotonic
+from functools import lru_cache
+from datetime import date, datetime, timedelta
+
+# third party imports
+import aiohttp
+from aiohttp import web
+
+# local imports
+from values.constans import CALENDAR, PAGINATION, TRANSPORT
+
+
+CANDLE_COLUMNS: list[str] = ['open', 'close', 'high', 'low', 'value', 'volume', 'begin', 'end']
+SESSION_START: int = 10 * 60
+SESSION_END: int = 18 * 60 + 40
+COMPOSITION_PAGE_SIZE: int = 100
+
+
+@lru_cache(maxsize=256)
+def make_candles(secid: str, period_from: date, period_to: date, interval: int) -> tuple[tuple, ...]:
+    """
+    Function for generating deterministic candles of the instrument.
+
+    Args:
+        secid: technical name of the instrument.
+        period_from: start date of the period.
+        period_to: end date of the period.
+        interval: value of the `interval=` parameter of ISS MOEX.
+
+    Returns:
+        candles represented by rows.
+    """
+    base: float = 100.0 + crc32(secid.encode()) % 200
+    rows: list[tuple] = []
+    day: date = period_from
+    while day <= period_to:
+        if day.weekday() < 5:
+            level: float = base + (day.toordinal() % 29) - 14
+            begin: datetime = datetime.combine(day, datetime.min.time())
+            if interval in (7, 24, 31):
+                steps: list[tuple[datetime, datetime]] = [(begin, begin + timedelta(hours=23, minutes=59, seconds=59))]
+            else:
+                steps: list[tuple[datetime, datetime]] = [
+                    (begin + timedelta(minutes=minute), begin + timedelta(minutes=minute + interval, seconds=-1))
+                    for minute in range(SESSION_START, SESSION_END, interval)
+                ]
+            for num, (candle_begin, candle_end) in enumerate(steps):
+                open_value: float = round(level + (num % 7) * 0.25, 2)
+                close_value: float = round(level + ((num + 3) % 11) * 0.15, 2)
+                rows.append((
+                    open_value, close_value, round(max(open_value, close_value) + 0.1, 2),
+                    round(min(open_value, close_value) - 0.1, 2), 1000.0 * (num + 1), 10 * (num + 1),
+                    candle_begin.strftime(CALENDAR.DATETIME_FRMT), candle_end.strftime(CALENDAR.DATETIME_FRMT)
+                ))
+        day += timedelta(days=1)
+    return tuple(rows)
+
+
+class IssStub:
+    """
+    Class for implementing local stand-in of ISS MOEX. The server runs in the own thread with the own event loop.
+        Every response is delayed by the latency, requests above the rate limit get the status 429, every request
+        with the number divisible by `error_every` gets the status 503.
+    """
+    def __init__(self,
+                 fixtures_dir: str | Path | None = None,
+                 record: bool = False,
+                 latency: float = 0.0,
+                 rate_limit: float | None = None,
+                 error_every: int | None = None,
+                 tickers: int = 40,
+                 host: str = '127.0.0.1',
+                 port: int = 0
+                 ) -> None:
+        self.__fixtures_dir: Path | None = Path(fixtures_dir) if fixtures_dir is not None else None
+        self.__record: bool = record
+        self.__latency: float = latency
+        self.__rate_limit: float | None = rate_limit
+        self.__error_every: int | None = error_every
+        self.__tickers: list[str] = ['SBER', 'GAZP', 'LKOH'] + [f'T{num:03d}' for num in range(max(tickers - 3, 0))]
+        self.__host: str = host
+        self.__port: int = port
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__runner: web.AppRunner | None = None
+        self.__thread: threading.Thread | None = None
+        self.__tokens: float = rate_limit or 0
+        self.__updated_at: float = monotonic()
+        self.requests: int = 0
+        self.throttled: int = 0
+        self.errors: int = 0
+
+    def __enter__(self) -> 'IssStub':
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    def __make_app(self) -> web.Application:
+        """
+        Function for creating the application with the routes of ISS MOEX.
+
+        Returns:
+            application of the server.
+        """
+        app: web.Application = web.Application(middlewares=[self.__middleware])
+        app.router.add_get('/iss/calendars/off_days.json', self.__calendar)
+        app.router.add_get('/iss/securities/{secid}.json', self.__securities)
+        app.router.add_get(
+            '/iss/statistics/engines/stock/markets/{market}/analytics/{index}/tickers.json', self.__composition
+        )
+        app.router.add_get('/iss/engines/stock/markets/{market}/securities/{secid}/candles.json', self.__candles)
+        return app
+
+    def __get_fixture_path(self, request: web.Request) -> Path | None:
+        """
+        Function for getting the path of the fixture of the request.
+
+        Args:
+            request: request to the server.
+
+        Returns:
+            path of the fixture. None if the fixtures directory is not specified.
+        """
+        if self.__fixtures_dir is None:
+            return None
+        return self.__fixtures_dir / f'{hashlib.sha1(request.path_qs.encode()).hexdigest()}.json'
+
+    def __is_throttled(self) -> bool:
+        """
+        Function for taking the token of the rate limit.
+
+        Returns:
+            True if there are no tokens left.
+        """
+        if self.__rate_limit is None:
+            return False
+        now: float = monotonic()
+        self.__tokens = min(self.__rate_limit, self.__tokens + (now - self.__updated_at) * self.__rate_limit)
+        self.__updated_at = now
+        if self.__tokens < 1:
+            return True
+        self.__tokens -= 1
+        return False
+
+    @web.middleware
+    async def __middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """
+        Middleware which applies the latency and the rate limit and replays or records the fixture of the request.
+        """
+        self.requests += 1
+        if self.__latency:
+            await asyncio.sleep(self.__latency)
+        if self.__is_throttled():
+            self.throttled += 1
+            return web.Response(status=429)
+        if self.__error_every and self.requests % self.__error_every == 0:
+            self.errors += 1
+            return web.Response(status=503)
+        if (fixture_path := self.__get_fixture_path(request)) is not None:
+            if fixture_path.exists():
+                return web.Response(body=fixture_path.read_bytes(), content_type='application/json')
+            if self.__record:
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(TRANSPORT.BASE_URL + request.path_qs) as response:
+                        response.raise_for_status()
+                        body: bytes = await response.read()
+                fixture_path.parent.mkdir(parents=True, exist_ok=True)
+                fixture_path.write_bytes(body)
+                return web.Response(body=body, content_type='application/json')
+        return await handler(request)
+
+    @staticmethod
+    async def __calendar(_: web.Request) -> web.Response:
+        """
+        Handler of the calendar: weekends of five years around the current one.
+        """
+        first_day: date = date(date.today().year - 3, 1, 1)
+        off_days: list[list] = [
+            [str(day), 0, 0, 0] for day in (first_day + timedelta(days=num) for num in range(366 * 5))
+            if day.weekday() >= 5
+        ]
+        columns: list[str] = ['tradedate', 'stock_workday', 'futures_workday', 'currency_workday']
+        return web.json_response({'off_days': {'columns': columns, 'data': off_days}})
+
+    @staticmethod
+    async def __securities(request: web.Request) -> web.Response:
+        """
+        Handler of the main information of the instrument.
+        """
+        secid: str = request.match_info['secid']
+        data: list[list[str]] = [
+            ['SECID', 'Код ценной бумаги', secid], ['NAME', 'Полное наименование', f'{secid} index'],
+            ['LATNAME', 'Английское наименование', secid], ['CURRENCYID', 'Валюта', 'RUB'],
+            ['INITIALVALUE', 'Начальное значение', '100'], ['ISSUEDATE', 'Дата начала торгов', '1997-09-22'],
+            ['INITIALCAPITALIZATION', 'Начальная капитализация', '1000000000']
+        ]
+        return web.json_response({'description': {'columns': ['name', 'title', 'value'], 'data': data}})
+
+    async def __composition(self, request: web.Request) -> web.Response:
+        """
+        Handler of the composition of the index with the `start=` parameter and the cursor block: all tickers are in
+            the actual composition.
+        """
+        today: str = str(date.today())
+        rows: list[list] = [[ticker_name, '2010-01-01', today, 1] for ticker_name in self.__tickers]
+        start: int = int(request.query.get('start', 0))
+        return web.json_response({
+            'tickers': {
+                'columns': ['ticker', 'from', 'till', 'tradingsession'],
+                'data': rows[start:start + COMPOSITION_PAGE_SIZE]
+            },
+            'tickers.cursor': {
+                'columns': ['INDEX', 'TOTAL', 'PAGESIZE'],
+                'data': [[start, len(rows), COMPOSITION_PAGE_SIZE]]
+            }
+        })
+
+    @staticmethod
+    async def __candles(request: web.Request) -> web.Response:
+        """
+        Handler of the candles with the `from=`, `till=`, `interval=` and `start=` parameters.
+        """
+        query = request.query
+        rows: tuple[tuple, ...] = make_candles(
+            request.match_info['secid'],
+            datetime.strptime(query['from'][:10], CALENDAR.DATE_FRMT).date(),
+            datetime.strptime(query['till'][:10], CALENDAR.DATE_FRMT).date(),
+            int(query.get('interval', 10))
+        )
+        if len(query['from']) > 10:
+            rows: tuple[tuple, ...] = tuple(row for row in rows if row[6] >= query['from'])
+        start: int = int(query.get('start', 0))
+        data: tuple[tuple, ...] = rows[start:start + PAGINATION.PAGE_SIZE]
+        return web.json_response({'candles': {'columns': CANDLE_COLUMNS, 'data': data}})
+
+    def start(self) -> str:
+        """
+        Function for starting the server in the background thread.
+
+        Returns:
+            base url of the server.
+        """
+        started: threading.Event = threading.Event()
+        server_socket: socket.socket = socket.create_server((self.__host, self.__port))
+        self.__port = server_socket.getsockname()[1]
+        self.__loop = asyncio.new_event_loop()
+        self.__runner = web.AppRunner(self.__make_app())
+
+        def serve() -> None:
+            asyncio.set_event_loop(self.__loop)
+            self.__loop.run_until_complete(self.__runner.setup())
+            self.__loop.run_until_complete(web.SockSite(self.__runner, server_socket).start())
+            started.set()
+            self.__loop.run_forever()
+
+        self.__thread = threading.Thread(target=serve, name='iss-stub', daemon=True)
+        self.__thread.start()
+        started.wait()
+        return self.base_url
+
+    def stop(self) -> None:
+        """
+        Function for stopping the server.
+
+        Returns:
+            None
+        """
+        if self.__loop is None or not self.__loop.is_running():
+            return
+        asyncio.run_coroutine_threadsafe(self.__runner.cleanup(), self.__loop).result()
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+        self.__loop.close()
+
+    @property
+    def base_url(self) -> str:
+        """
+        Property for get base_url.
+
+        Returns:
+            base url of the server.
+        """
+        return f'http://{self.__host}:{self.__port}'
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--port', type=int, default=8765, help='port of the server')
+    parser.add_argument('--fixtures', type=Path, default=None, help='directory of the recorded responses')
+    parser.add_argument('--record', action='store_true', help='record the missing fixtures from ISS MOEX')
+    parser.add_argument('--latency', type=float, default=0.0, help='delay of every response in seconds')
+    parser.add_argument('--rate-limit', type=float, default=None, help='requests per second before the status 429')
+    args: argparse.Namespace = parser.parse_args()
+
+    with IssStub(args.fixtures, args.record, args.latency, args.rate_limit, port=args.port) as stub:
+        print(f'ISS stand-in is listening on {stub.base_url}, press Ctrl+C to stop.')
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+"""
+Offline benchmark suite. All requests go to the local stand-in of ISS MOEX, results are printed or saved as JSON. If
+    the baseline is specified, scenarios which became slower or use more memory than the tolerance allows are reported
+    and the exit code is 1.
+
+Run from the root of the repository: `python -m benchmarks.run --output results.json`.
+"""
+
+# standard library imports
+import os
+import sys
+import json
+import platform
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+import subprocess
+from pathlib import Path
+from contextlib import chdir
+from time import perf_counter
+from datetime import datetime, timedelta
+from collections.abc import Callable
+
+# local imports
+from moex import MOEX
+from custom.candle_store import CandleStore
+from custom.transport import Transport
+from custom.custom_functions import Helper
+from benchmarks.iss_stub import IssStub
+
+
+class Context:
+    """
+    Class for creating objects of the MOEX class which send requests to the local stand-in and store candles in the
+        temporary directory.
+    """
+    def __init__(self, stub: IssStub, directory: Path) -> None:
+        self.__stub: IssStub = stub
+        self.__directory: Path = directory
+        self.__moex_objects: list[MOEX] = []
+        self.__candle_stores: list[CandleStore] = []
+
+    def new_moex(self) -> MOEX:
+        """
+        Function for creating object of the MOEX class with the empty candle store and the empty cache.
+
+        Returns:
+            object of the class MOEX.
+        """
+        file_descriptor, path = tempfile.mkstemp(suffix='.sqlite3', dir=self.__directory)
+        os.close(file_descriptor)
+        candle_store: CandleStore = CandleStore(Path(path))
+        self.__candle_stores.append(candle_store)
+        moex: MOEX = MOEX(candle_store=candle_store, transport=Transport(base_url=self.__stub.base_url))
+        self.__moex_objects.append(moex)
+        return moex
+
+    def close(self) -> None:
+        """
+        Function for closing created objects of the MOEX class and their candle stores.
+
+        Returns:
+            None
+        """
+        try:
+            for moex in self.__moex_objects:
+                moex.transport.close()
+        finally:
+            for candle_store in self.__candle_stores:
+                candle_store.close()
+            self.__moex_objects.clear()
+            self.__candle_stores.clear()
+
+
+def cold_start(context: Context) -> Callable[[], object]:
+    """
+    Scenario of loading the calendar, indices and composition by the new object of the MOEX class.
+    """
+    moex: MOEX = context.new_moex()
+    return moex.prefetch
+
+
+def interval(days: int, warm: bool = False) -> Callable[[Context], Callable[[], object]]:
+    """
+    Scenario of creating the interval of SBER for the number of days. If `warm`, the candle store is filled first.
+    """
+    def setup(context: Context) -> Callable[[], object]:
+        moex: MOEX = context.new_moex()
+        moex.prefetch()
+        period_from: str = Helper.from_date(Helper.to_date(moex.last_trade_day) - timedelta(days=days))
+        if warm:
+            moex.imoex.SBER.interval(period_from, soft_search='forward')
+        return lambda: moex.imoex.SBER.interval(period_from, soft_search='forward')
+    return setup
+
+
+def constituents(days: int) -> Callable[[Context], Callable[[], object]]:
+    """
+    Scenario of creating intervals of all constituents of IMOEX for the number of days in one batch.
+    """
+    def setup(context: Context) -> Callable[[], object]:
+        moex: MOEX = context.new_moex()
+        moex.prefetch()
+        period_from: str = Helper.from_date(Helper.to_date(moex.last_trade_day) - timedelta(days=days))
+        return lambda: moex.imoex.constituents_interval(period_from, soft_search='forward')
+    return setup
+
+
+def get_plot(context: Context) -> Callable[[], object]:
+    """
+    Scenario of rendering the plot of the interval of SBER for one month.
+    """
+    moex: MOEX = context.new_moex()
+    moex.prefetch()
+    period_from: str = Helper.from_date(Helper.to_date(moex.last_trade_day) - timedelta(days=30))
+    return moex.imoex.SBER.interval(period_from, soft_search='forward').get_plot
+
+
+SCENARIOS: dict[str, Callable[[Context], Callable[[], object]]] = {
+    'cold_start': cold_start,
+    'interval_1w': interval(7),
+    'interval_1m': interval(30),
+    'interval_1y': interval(365),
+    'interval_1y_warm': interval(365, warm=True),
+    'constituents_1m': constituents(30),
+    'get_plot': get_plot
+}
+
+
+def run_scenario(setup: Callable[[Context], Callable[[], object]],
+                 stub: IssStub,
+                 directory: Path,
+                 repeat: int
+                 ) -> dict:
+    """
+    Function for measuring the scenario. Every run starts from the new object of the MOEX class. Time is measured
+        without tracing, the peak of the memory is measured by the separate traced run.
+
+    Args:
+        setup: function which prepares the scenario and returns the measured function.
+        stub: local stand-in of ISS MOEX.
+        directory: temporary directory of the candle stores and plots.
+        repeat: number of the timed runs.
+
+    Returns:
+        results of the scenario.
+    """
+    context: Context = Context(stub, directory)
+    seconds: list[float] = []
+    requests: int = 0
+    try:
+        for _ in range(repeat):
+            measured: Callable[[], object] = setup(context)
+            requests_before: int = stub.requests
+            started_at: float = perf_counter()
+            measured()
+            seconds.append(perf_counter() - started_at)
+            requests: int = stub.requests - requests_before
+            context.close()
+
+        measured: Callable[[], object] = setup(context)
+        tracemalloc.start()
+        measured()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        context.close()
+
+    return {
+        'seconds': {
+            'min': min(seconds),
+            'median': statistics.median(seconds),
+            'max': max(seconds)
+        },
+        'requests': requests,
+        'peak_memory_bytes': peak_memory
+    }
+
+
+def get_revision() -> str | None:
+    """
+    Function for getting the revision of the repository.
+
+    Returns:
+        hash of the current commit. None if git is not available.
+    """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Function for comparing results with the baseline.
+
+    Args:
+        results: results of the current run.
+        baseline: results of the baseline run.
+        tolerance: allowed relative growth of the median time and of the peak of the memory.
+
+    Returns:
+        descriptions of the regressions.
+    """
+    regressions: list[str] = []
+    for name, result in results['scenarios'].items():
+        if (base := baseline['scenarios'].get(name)) is None:
+            continue
+        for metric, current, previous in (
+            ('median time', result['seconds']['median'], base['seconds']['median']),
+            ('peak memory', result['peak_memory_bytes'], base['peak_memory_bytes'])
+        ):
+            if previous and current > previous * (1 + tolerance):
+                regressions.append(f'{name}: {metric} {previous:.6g} -> {current:.6g} (+{current / previous - 1:.0%})')
+    return regressions
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=3, help='number of the timed runs of every scenario')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--latency', type=float, default=0.0, help='delay of every response in seconds')
+    parser.add_argument('--rate-limit', type=float, default=None, help='requests per second before the status 429')
+    parser.add_argument('--fixtures', type=Path, default=None, help='directory of the recorded responses')
+    parser.add_argument('--output', type=Path, default=None, help='file for the results. If None, stdout is used')
+    parser.add_argument('--baseline', type=Path, default=None, help='results of the previous run for comparison')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative regression')
+    args: argparse.Namespace = parser.parse_args()
+
+    results: dict = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'revision': get_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'latency': args.latency,
+            'rate_limit': args.rate_limit
+        },
+        'scenarios': {}
+    }
+    with IssStub(args.fixtures, latency=args.latency, rate_limit=args.rate_limit) as stub:
+        with tempfile.TemporaryDirectory() as directory, chdir(directory):
+            for name in args.scenarios:
+                results['scenarios'][name] = run_scenario(SCENARIOS[name], stub, Path(directory), args.repeat)
+                print(f'{name}: {results["scenarios"][name]["seconds"]["median"]:.4f} s', file=sys.stderr)
+
+    report: str = json.dumps(results, indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        args.output.write_text(report)
+
+    if args.baseline is not None:
+        if regressions := compare(results, json.loads(args.baseline.read_text()), args.tolerance):
+            print('Regressions:', *regressions, sep='\n  ', file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,4 @@
+"""
+Configuration of pytest. The root of the repository is added to the import path, so tests import modules as the
+    library does.
+"""
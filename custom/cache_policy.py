@@ -0,0 +1,93 @@
+"""
+Module for implementing policy of caching responses of ISS MOEX.
+"""
+
+# standard library imports
+import math
+from urllib.parse import SplitResult, urlsplit
+
+# local imports
+from values.constans import REQUEST_CACHE
+
+
+class CachePolicy:
+    """
+    Class for implementing policy of caching responses of ISS MOEX. Every request is classified by its url, every
+        class has the own time to live:
+        `candles` - candles, they are not saved by default. Finished trading days are kept by the SQLite candle store,
+            it is the history tier, and candles of the current day change until the end of the session;
+        `calendar` - calendar of the trading days;
+        `composition` - composition of the index;
+        `metadata` - main information of the instrument.
+    """
+    def __init__(self,
+                 ttl: dict[str, float | None] | None = None,
+                 max_size: int = REQUEST_CACHE.MAX_SIZE,
+                 max_bytes: int = REQUEST_CACHE.MAX_BYTES
+                 ) -> None:
+        self.__ttl: dict[str, float | None] = {**REQUEST_CACHE.TTL, **(ttl or {})}
+        self.__max_size: int = max_size
+        self.__max_bytes: int = max_bytes
+
+    @staticmethod
+    def classify(url: str) -> str:
+        """
+        Function for determining the class of the request.
+
+        Args:
+            url: url of the request.
+
+        Returns:
+            class of the request.
+        """
+        parts: SplitResult = urlsplit(url)
+        if parts.path.endswith('/candles.json'):
+            return 'candles'
+        if '/calendars/' in parts.path:
+            return 'calendar'
+        if '/analytics/' in parts.path:
+            return 'composition'
+        return 'metadata'
+
+    def get_ttl(self, cache_class: str) -> float:
+        """
+        Function for getting the time to live of the responses of the class.
+
+        Args:
+            cache_class: class of the request.
+
+        Returns:
+            time to live in seconds. Infinity if the responses never expire, 0 if they are not saved.
+        """
+        ttl: float | None = self.__ttl.get(cache_class, 0)
+        return math.inf if ttl is None else ttl
+
+    @property
+    def ttl(self) -> dict[str, float | None]:
+        """
+        Property for get ttl.
+
+        Returns:
+            time to live in seconds by classes of requests. None if the responses never expire.
+        """
+        return dict(self.__ttl)
+
+    @property
+    def max_size(self) -> int:
+        """
+        Property for get max_size.
+
+        Returns:
+            maximum number of cached responses.
+        """
+        return self.__max_size
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        Property for get max_bytes.
+
+        Returns:
+            maximum estimated size of cached responses in bytes.
+        """
+        return self.__max_bytes
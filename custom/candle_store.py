@@ -0,0 +1,188 @@
+"""
+Module for implementing persistent candle store.
+"""
+
+# standard library imports
+import os
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+# local imports
+from values.constans import RESOLUTION, STORE
+
+
+class CandleStore:
+    """
+    Class for implementing persistent candle store. Candles are stored by slices
+        `(tech_type, tech_name, resolution, day)`. If the path is not specified, the default path is used.
+    """
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.__path: Path = Path(path) if path is not None else self.get_default_path()
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        self.__connection: sqlite3.Connection = sqlite3.connect(self.__path, check_same_thread=False)
+        self.__migrate()
+
+    @staticmethod
+    def get_default_path() -> Path:
+        """
+        Function for determining the default path of the store: the environment variable `MOEX_STORE` if it is set,
+            otherwise `~/.cache/moexbuilder/candles.sqlite3`.
+
+        Returns:
+            default path of the store file.
+        """
+        if path := os.environ.get(STORE.ENV_VAR):
+            return Path(path).expanduser()
+        return Path(STORE.DIRECTORY_NAME, STORE.FILE_NAME).expanduser()
+
+    def __migrate(self) -> None:
+        """
+        Function for upgrading the schema of the store to the current version. Candles stored before the resolution
+            was added to the key were requested with the default resolution of ISS MOEX and are kept as `10m`.
+
+        Returns:
+            None
+        """
+        if self.__connection.execute('PRAGMA user_version').fetchone()[0] >= STORE.SCHEMA_VERSION:
+            return
+        tables: set[str] = {
+            name for name, in self.__connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        self.__connection.execute('DROP TABLE IF EXISTS candles_migration')
+        self.__connection.execute(
+            'CREATE TABLE candles_migration ('
+            'tech_type TEXT NOT NULL, '
+            'tech_name TEXT NOT NULL, '
+            'resolution TEXT NOT NULL, '
+            'day TEXT NOT NULL, '
+            'data TEXT NOT NULL, '
+            'PRIMARY KEY (tech_type, tech_name, resolution, day))'
+        )
+        if 'candles' in tables:
+            self.__connection.execute(
+                'INSERT INTO candles_migration (tech_type, tech_name, resolution, day, data) '
+                'SELECT tech_type, tech_name, ?, day, data FROM candles',
+                (RESOLUTION.DEFAULT, )
+            )
+            self.__connection.execute('DROP TABLE candles')
+        self.__connection.execute('ALTER TABLE candles_migration RENAME TO candles')
+        self.__connection.execute(f'PRAGMA user_version = {STORE.SCHEMA_VERSION}')
+        self.__connection.commit()
+
+    @staticmethod
+    def is_finished_day(day: datetime.date) -> bool:
+        """
+        Function to determine the specified day is finished and its candles will not change anymore.
+
+        Args:
+            day: specified date for check.
+
+        Returns:
+            result of check.
+        """
+        return day < datetime.today().date()
+
+    def load(self,
+             tech_type: str,
+             tech_name: str,
+             days: list[str],
+             resolution: str = RESOLUTION.DEFAULT
+             ) -> dict[str, list[list]]:
+        """
+        Function for loading stored candles of the instrument.
+
+        Args:
+            tech_type: technical type of the instrument.
+            tech_name: technical name of the instrument.
+            days: list of days in the string type.
+            resolution: resolution of candles.
+
+        Returns:
+            stored candles by days. Days which are not stored are absent.
+        """
+        result: dict[str, list[list]] = {}
+        for num in range(0, len(days), STORE.MAX_VARIABLES):
+            chunk: list[str] = days[num:num + STORE.MAX_VARIABLES]
+            cursor: sqlite3.Cursor = self.__connection.execute(
+                f'SELECT day, data FROM candles WHERE tech_type = ? AND tech_name = ? AND resolution = ? '
+                f'AND day IN ({", ".join("?" * len(chunk))})',
+                (tech_type, tech_name, resolution, *chunk)
+            )
+            result.update({day: json.loads(data) for day, data in cursor})
+        return result
+
+    def stored_days(self,
+                    tech_type: str,
+                    tech_name: str,
+                    days: list[str],
+                    resolution: str = RESOLUTION.DEFAULT
+                    ) -> set[str]:
+        """
+        Function for determining which days of the instrument are stored without loading their candles.
+
+        Args:
+            tech_type: technical type of the instrument.
+            tech_name: technical name of the instrument.
+            days: list of days in the string type.
+            resolution: resolution of candles.
+
+        Returns:
+            stored days.
+        """
+        result: set[str] = set()
+        for num in range(0, len(days), STORE.MAX_VARIABLES):
+            chunk: list[str] = days[num:num + STORE.MAX_VARIABLES]
+            cursor: sqlite3.Cursor = self.__connection.execute(
+                f'SELECT day FROM candles WHERE tech_type = ? AND tech_name = ? AND resolution = ? '
+                f'AND day IN ({", ".join("?" * len(chunk))})',
+                (tech_type, tech_name, resolution, *chunk)
+            )
+            result.update(day for day, in cursor)
+        return result
+
+    def save(self,
+             tech_type: str,
+             tech_name: str,
+             day_candles: dict[str, list[list]],
+             resolution: str = RESOLUTION.DEFAULT
+             ) -> None:
+        """
+        Function for saving candles of the instrument.
+
+        Args:
+            tech_type: technical type of the instrument.
+            tech_name: technical name of the instrument.
+            day_candles: candles by days. Key is a day in the string type.
+            resolution: resolution of candles.
+
+        Returns:
+            None
+        """
+        if not day_candles:
+            return
+        self.__connection.executemany(
+            'INSERT OR REPLACE INTO candles (tech_type, tech_name, resolution, day, data) VALUES (?, ?, ?, ?, ?)',
+            [(tech_type, tech_name, resolution, day, json.dumps(candles)) for day, candles in day_candles.items()]
+        )
+        self.__connection.commit()
+
+    def close(self) -> None:
+        """
+        Function for closing connection to the store.
+
+        Returns:
+            None
+        """
+        self.__connection.close()
+
+    @property
+    def path(self) -> Path:
+        """
+        Property for get path.
+
+        Returns:
+            path to the store file.
+        """
+        return self.__path
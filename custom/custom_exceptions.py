@@ -33,7 +33,34 @@ class IsNotValidPeriod(ValueError):
     """
 
 
+class NoCandlesOnDay(ValueError):
+    """
+    Custom exception which is raised if there are no candles ending on the specified day.
+    """
+
+
 class SomethingWentWrong(TypeError):
     """
     Custom exception which is raised if unexpected behavior is detected.
     """
+
+
+class EventLoopIsRunning(RuntimeError):
+    """
+    Custom exception which is raised if the synchronous API is called from the running event loop.
+    """
+
+
+class RequestsFailed(ConnectionError):
+    """
+    Custom exception which is raised if some of the requests to ISS MOEX failed. Results of the successful requests
+        are kept in `responses`, errors of the failed requests are kept in `failures`.
+    """
+    def __init__(self,
+                 message: str,
+                 responses: dict,
+                 failures: dict[str, BaseException]
+                 ) -> None:
+        super().__init__(message)
+        self.responses: dict = responses
+        self.failures: dict[str, BaseException] = failures
@@ -5,15 +5,20 @@ Module for implementing custom functions.
 # standard library imports
 import re
 import asyncio
+from functools import partial
+from time import perf_counter
 from datetime import datetime, timedelta
-from collections.abc import Generator
+from calendar import monthrange
 
 # third party imports
 import aiohttp
-from aiocache import cached, caches, Cache
+from orjson import loads
 
 # local imports
-from values.constans import CALENDAR, MOEX_REQUESTS
+from values.constans import CALENDAR, DYNAMICS, MOEX_REQUESTS, PAGINATION, RESOLUTION
+from custom.transport import Transport
+from custom.trading_calendar import TradingCalendar
+from custom.metrics import metrics
 import custom.custom_exceptions as ce
 
 
@@ -22,66 +27,194 @@ class Helper:
     Class for implementing custom functions.
     """
     @staticmethod
-    async def fetch(url: str, session: aiohttp.ClientSession) -> dict:
+    async def fetch(url: str,
+                    session: aiohttp.ClientSession,
+                    queued_at: float | None = None,
+                    cache: str = 'miss'
+                    ) -> dict:
         """
-        Async function which return response to the request in the format JSON.
+        Async function which return response to the request in the format JSON. The body is decoded from bytes with
+            orjson. The event of the request is passed to the metrics hooks.
 
         Args:
             url: url for send GET-request.
             session: client session from which the request is sent.
+            queued_at: moment when the attempt of the request was queued by the scheduler.
+            cache: `miss` if the response is cached, `bypass` otherwise.
 
         Returns:
             response to the request in the format JSON.
         """
-        async with session.get(url, ssl=False) as response:
-            return await response.json()
+        started_at: float = perf_counter()
+        queue_wait: float = started_at - queued_at if queued_at is not None else 0.0
+        status: int | None = None
+        try:
+            async with session.get(url, ssl=False) as response:
+                status: int = response.status
+                response.raise_for_status()
+                body: bytes = await response.read()
+        except BaseException:
+            metrics.emit_request(
+                url, status, queue_wait=queue_wait, network_time=perf_counter() - started_at, cache=cache
+            )
+            raise
+        fetched_at: float = perf_counter()
+        result: dict = loads(body)
+        if metrics.is_enabled:
+            metrics.emit_request(
+                url,
+                status,
+                size=len(body),
+                rows=sum(len(block.get('data', ())) for block in result.values() if isinstance(block, dict)),
+                queue_wait=queue_wait,
+                network_time=fetched_at - started_at,
+                decode_time=perf_counter() - fetched_at,
+                cache=cache
+            )
+        return result
+
+    @classmethod
+    async def request(cls,
+                      transport: Transport,
+                      url: str,
+                      cache: bool = False
+                      ) -> dict:
+        """
+        Async function which sends one GET-request to ISS MOEX through the cache and the scheduler of the transport.
+            The concurrent request of the same url is shared.
+
+        Args:
+            transport: transport whose client session is used to send the request.
+            url: url for send GET-request.
+            cache: flag for reading the cached response and saving the new one.
+
+        Returns:
+            response to the request in the format JSON.
+        """
+        session: aiohttp.ClientSession = await transport.get_session()
+        if cache and url in transport.cache:
+            metrics.emit_request(url, 200, cache='hit')
+        fetching: partial = partial(
+            transport.scheduler.run,
+            partial(cls.fetch, transport.get_url(url), session, cache='miss' if cache else 'bypass')
+        )
+        return await transport.cache.get(url, fetching, cache)
 
     @classmethod
-    @cached(ttl=30, cache=Cache.MEMORY)
     async def generate_requests(cls,
+                                transport: Transport,
                                 urls: dict[str, str],
-                                additional_params: dict[str, list[str]] = None
+                                additional_params: dict[str, list[str]] = None,
+                                cache: bool = True
                                 ) -> dict[str, dict]:
         """
-        Async function which generates some tasks to create GET-request to ISS MOEX.
+        Async function which generates some tasks to create GET-request to ISS MOEX. Responses are cached by urls,
+            concurrent requests of the same url are shared.
 
         Args:
+            transport: transport whose client session is used to send the requests.
             urls: Each of element defines the name of the task and the url to use additional parameters to create
                 GET-requests.
             additional_params: dictionary that specifies which additional parameters to use when creating GET-request.
+            cache: flag for reading the cached responses and saving the new ones.
 
         Returns:
             result of the task group execution.
-        """
-        connector = aiohttp.TCPConnector(limit=1000)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            tasks: list[asyncio.Task] = []
-            for task_name, url in urls.items():
-                if re.search(r'{\d*}', url):
-                    url: str = url.format(*additional_params[task_name])
-                tasks.append(asyncio.create_task(cls.fetch(url, session), name=task_name))
-            await asyncio.gather(*tasks)
-        all_response: dict[str, dict] = {task.get_name(): task.result() for task in tasks}
+
+        Raises:
+            RequestsFailed: if some of the requests failed after all retries. Responses to the successful requests
+                are kept in the exception.
+        """
+        tasks: list[asyncio.Task] = []
+        for task_name, url in urls.items():
+            if re.search(r'{\d*}', url):
+                url: str = url.format(*additional_params[task_name])
+            tasks.append(asyncio.create_task(cls.request(transport, url, cache), name=task_name))
+        await asyncio.gather(*tasks, return_exceptions=True)
+        all_response: dict[str, dict] = {
+            task.get_name(): task.result() for task in tasks if task.exception() is None
+        }
+        if failures := {task.get_name(): task.exception() for task in tasks if task.exception() is not None}:
+            raise ce.RequestsFailed(
+                f'{len(failures)} of {len(tasks)} requests to ISS MOEX failed: {", ".join(failures)}.',
+                responses=all_response,
+                failures=failures
+            )
         return all_response
 
     @classmethod
-    def is_not_trade_date(cls,
-                          weekends: list[str],
-                          workdays: list[str],
+    async def generate_paged_requests(cls,
+                                      transport: Transport,
+                                      url: str,
+                                      params: list[str],
+                                      block: str,
+                                      page_size: int | None = PAGINATION.PAGE_SIZE,
+                                      cache: bool = True
+                                      ) -> list[list]:
+        """
+        Async function which follows the `start=` cursor of ISS MOEX until the pages run out. If the response contains
+            the cursor block, the remaining pages are requested concurrently at once, otherwise they are requested
+            concurrently by waves until the first incomplete page.
+
+        Args:
+            transport: transport whose client session is used to send the requests.
+            url: url with the last placeholder for the `start=` parameter.
+            params: parameters for filling the url except the `start=` parameter.
+            block: name of the data block in the response.
+            page_size: number of rows in the full page of the block. If None and the response has no cursor block,
+                the length of the first page is used.
+            cache: flag for reading the cached responses and saving the new ones.
+
+        Returns:
+            data of all pages.
+        """
+        first_page: dict[str, dict] = (
+            await cls.generate_requests(
+                transport=transport, urls={'0': url}, additional_params={'0': [*params, 0]}, cache=cache
+            )
+        )['0']
+        data: list[list] = list(first_page[block]['data'])
+        if cursor := first_page.get(f'{block}.cursor', {}).get('data'):
+            index, total, page_size = cursor[0][:3]
+            starts: list[int] = list(range(index + page_size, total, page_size))
+        elif not data or page_size is not None and len(data) < page_size:
+            return data
+        else:
+            page_size: int = page_size or len(data)
+            starts: list[int] = [page_size * num for num in range(1, PAGINATION.WAVE_SIZE + 1)]
+
+        while starts:
+            pages: dict[str, dict] = await cls.generate_requests(
+                transport=transport,
+                urls={str(start): url for start in starts},
+                additional_params={str(start): [*params, start] for start in starts},
+                cache=cache
+            )
+            for start in starts:
+                page_data: list[list] = pages[str(start)][block]['data']
+                data.extend(page_data)
+                if not cursor and len(page_data) < page_size:
+                    return data
+            if cursor:
+                break
+            starts: list[int] = [start + page_size * PAGINATION.WAVE_SIZE for start in starts]
+        return data
+
+    @staticmethod
+    def is_not_trade_date(calendar: TradingCalendar,
                           check_date: datetime.date,
                           ) -> bool:
         """
         Function to determine the specified day is a trading day or not.
 
         Args:
-            weekends: list of weekends
-            workdays: list of workdays
+            calendar: trading calendar.
             check_date: specified date for check.
 
         Returns:
             result of check.
         """
-        return check_date in weekends or (datetime.weekday(check_date) in (5, 6) and check_date not in workdays)
+        return not calendar.is_trading_day(check_date)
 
     @staticmethod
     def to_date(date_str: str) -> datetime.date:
@@ -154,70 +287,49 @@ class Helper:
             f'The specified variable type `{type(raw_datetime)}` is not supported by this function.'
         )
 
-    @staticmethod
-    def get_next_date_for_check(check_date: datetime.date, go_back: bool = True) -> datetime.date:
-        """
-        Function to determine the next check_date.
-
-        Args:
-            check_date: day to start check.
-            go_back: flag that determines the direction of the check_date search
-
-        Returns:
-            next check_date.
-        """
-        if go_back:
-            check_date: datetime.date = check_date - timedelta(1)
-        else:
-            check_date: datetime.date = check_date + timedelta(1)
-        return check_date
-
     @classmethod
     def get_last_trade_day(cls,
-                           weekends: list[str],
-                           workdays: list[str],
-                           start_dt: datetime = datetime.now()
+                           calendar: TradingCalendar,
+                           start_dt: datetime | None = None
                            ) -> dict:
         """
         Function which determines last trading day and flag for trading at the moment.
 
         Args:
-            weekends: list of weekends
-            workdays: list of workdays
-            start_dt: day to start check.
+            calendar: trading calendar.
+            start_dt: day to start check. If None, the current moment is used.
 
         Returns:
             First element: last trading day.
 
             Second element: flag for trading at the moment.
         """
-        if (trade_date := cls.datetime_format(start_dt)) <= cls.datetime_format(CALENDAR.FIRST_TRADE_DAY):
+        if (trade_date := cls.datetime_format(start_dt or datetime.now())) <= cls.datetime_format(
+                CALENDAR.FIRST_TRADE_DAY
+        ):
             raise ce.InitialDateLessFirstDate(f'First trading day in the year `{CALENDAR.FIRST_TRADE_DAY}`.')
-        if trade_date.time() < cls.to_time(CALENDAR.TIME_DAY_START):
-            trade_date: datetime.date = trade_date - timedelta(1)
-        for _ in range(CALENDAR.MAX_DAYS_WEEKENDS):
-            if cls.is_not_trade_date(weekends, workdays, trade_date):
-                trade_date: datetime.date = cls.get_next_date_for_check(trade_date)
-            else:
-                is_today_trade_day: bool = trade_date.date() == datetime.today().date()
-                is_trading_now: bool = is_today_trade_day and (
-                        cls.to_time(CALENDAR.TIME_DAY_START) < trade_date.time() < cls.to_time(CALENDAR.TIME_DAY_OVER)
-                )
-                result = {
-                    'last_trade_day': cls.from_date(trade_date),
-                    'is_trading_now': is_trading_now
-                }
-                return result
-        raise ce.TooManyDaysOffInARow(
-            f'The number of consecutive days off cannot exceed `{CALENDAR.MAX_DAYS_WEEKENDS}` days.'
+        last_trade_day: datetime.date = calendar.prev_trading_day(
+            trade_date.date(), inclusive=trade_date.time() >= cls.to_time(CALENDAR.TIME_DAY_START)
+        )
+        if (trade_date.date() - last_trade_day).days > CALENDAR.MAX_DAYS_WEEKENDS:
+            raise ce.TooManyDaysOffInARow(
+                f'The number of consecutive days off cannot exceed `{CALENDAR.MAX_DAYS_WEEKENDS}` days.'
+            )
+        is_trading_now: bool = last_trade_day == datetime.today().date() and (
+                cls.to_time(CALENDAR.TIME_DAY_START) < trade_date.time() < cls.to_time(CALENDAR.TIME_DAY_OVER)
         )
+        return {
+            'last_trade_day': cls.from_date(last_trade_day),
+            'is_trading_now': is_trading_now
+        }
 
     @classmethod
     def get_composition_moex(cls,
                              data: list[list[str]]
                              ) -> dict[str, dict[str, dict]]:
         """
-        Function for determining the composition of the MOEX.
+        Function for determining the composition of the MOEX. If the ticker has several intervals, the latest one
+            is kept.
 
         Args:
             data: data received from MOEX ISS.
@@ -232,19 +344,21 @@ class Helper:
         """
         full_result: dict = {}
         actual_result: dict = {}
-        ticker_names: list = []
-        max_date_to: str = max(data, key=lambda x: x[1])[2]
+        max_date_to: str = max(stock[2] for stock in data)
 
         for stock in data:
             ticker_name, from_dt, to_dt, *_ = stock
+            if ticker_name in full_result and full_result[ticker_name]['from'] >= from_dt:
+                continue
             full_result[ticker_name]: dict[str, dict[str, str]] = {'from': from_dt, 'to': to_dt}
             if to_dt == max_date_to:
                 actual_result[ticker_name]: dict[str, dict[str, str]] = {'from': from_dt, 'to': to_dt}
-                ticker_names.append(ticker_name)
+            else:
+                actual_result.pop(ticker_name, None)
         result = {
             'full_result': full_result,
             'actual_result': actual_result,
-            'ticker_names': ticker_names
+            'ticker_names': list(actual_result)
         }
         return result
 
@@ -274,48 +388,39 @@ class Helper:
 
     @classmethod
     def loop_check_date(cls,
-                        weekends: list[str],
-                        workdays: list[str],
+                        calendar: TradingCalendar,
                         soft_search: str,
                         period: datetime.date
-                        ) -> tuple[datetime.date, datetime.date]:
+                        ) -> datetime.date:
         """
-        Function for iterating through the check dates in the specified direction until the moment of determining
-            the trading date.
+        Function for determining the closest trading date in the specified direction.
         Args:
-            weekends: list of weekends.
-            workdays: list of workdays.
+            calendar: trading calendar.
             soft_search: If not None, the search will be applied until the next trading day.
                 `forward` - the closest forward, `back` - the closest from behind.
-            period: string value of the start or end date of the period.
+            period: start or end date of the period.
 
         Returns:
-            tuple with the start and end dates of the period.
+            the closest trading date.
         """
         match soft_search:
             case 'forward':
-                go_back = False
+                trading_day: datetime.date = calendar.next_trading_day(period, inclusive=True)
             case 'back':
-                go_back = True
+                trading_day: datetime.date = calendar.prev_trading_day(period, inclusive=True)
             case _:
                 raise ce.SomethingWentWrong('Unexpected value.')
 
-        for _ in range(CALENDAR.MAX_DAYS_WEEKENDS):
-            if cls.is_not_trade_date(weekends, workdays, period):
-                period: datetime = cls.get_next_date_for_check(period, go_back=go_back)
-            else:
-                break
-        else:
+        if abs((trading_day - period).days) >= CALENDAR.MAX_DAYS_WEEKENDS:
             raise ce.TooManyDaysOffInARow(
                 f'The number of consecutive days off cannot exceed `{CALENDAR.MAX_DAYS_WEEKENDS}` days.'
             )
-        return period
+        return trading_day
 
     @classmethod
     def check_date(cls,
                    last_trade_day: str,
-                   weekends: list[str],
-                   workdays: list[str],
+                   calendar: TradingCalendar,
                    soft_search: None | str,
                    period_from: str,
                    period_to: str | None = None
@@ -325,8 +430,7 @@ class Helper:
             specified dates are trading days.
         Args:
             last_trade_day: set to `period_to` if `period_to` is not passed.
-            weekends: lisf of weekends.
-            workdays: list of workdays.
+            calendar: trading calendar.
             soft_search: If not None, the search will be applied until the next trading day.
                 `forward` - the closest forward, `back` - the closest from behind.
             period_from: string value of the start date of the period.
@@ -352,8 +456,8 @@ class Helper:
         if not Helper.is_valid_period(period_from, period_to):
             raise ce.IsNotValidPeriod('Please enter a valid date range.')
 
-        from_flag: bool = Helper.is_not_trade_date(weekends, workdays, period_from)
-        to_flag: bool = Helper.is_not_trade_date(weekends, workdays, period_to)
+        from_flag: bool = Helper.is_not_trade_date(calendar, period_from)
+        to_flag: bool = Helper.is_not_trade_date(calendar, period_to)
 
         if from_flag and to_flag:
             if soft_search is None:
@@ -362,8 +466,8 @@ class Helper:
                     f'`{Helper.from_date(period_to)}` are not trading days.'
                 )
             period_from, period_to = (
-                cls.loop_check_date(weekends, workdays, soft_search, period_from),
-                cls.loop_check_date(weekends, workdays, soft_search, period_to)
+                cls.loop_check_date(calendar, soft_search, period_from),
+                cls.loop_check_date(calendar, soft_search, period_to)
             )
 
         elif from_flag:
@@ -371,14 +475,14 @@ class Helper:
                 raise ce.SpecifiedDayIsNotTradingDay(
                     f'The specified day `{Helper.from_date(period_from)}` is not a trading day.'
                 )
-            period_from = cls.loop_check_date(weekends, workdays, soft_search, period_from)
+            period_from = cls.loop_check_date(calendar, soft_search, period_from)
 
         elif to_flag:
             if soft_search is None:
                 raise ce.SpecifiedDayIsNotTradingDay(
                     f'The specified day `{Helper.from_date(period_to)}` is not a trading day.'
                 )
-            period_to = cls.loop_check_date(weekends, workdays, soft_search, period_to)
+            period_to = cls.loop_check_date(calendar, soft_search, period_to)
 
         return period_from, period_to
 
@@ -399,32 +503,107 @@ class Helper:
         """
         return period_from <= datetime.today().date() >= period_to
 
-    @classmethod
-    def interval_trading_days(cls,
-                              weekends: list[str],
-                              workdays: list[str],
+    @staticmethod
+    def interval_trading_days(calendar: TradingCalendar,
                               period_from: datetime.date,
                               period_to: datetime.date
                               ) -> tuple[datetime.date]:
         """
         Function for filtering interval by the trading day flag.
         Args:
-            weekends: lisf of weekends.
-            workdays: list of workdays.
+            calendar: trading calendar.
             period_from: start date of the period.
             period_to: end date of the period.
 
         Returns:
             interval containing only trading days.
         """
-        full_interval: Generator = (period_from + timedelta(delta)
-                                    for delta in range((period_to - period_from).days + 1))
-        return tuple(filter(lambda x: not cls.is_not_trade_date(weekends, workdays, x), full_interval))
+        return tuple(calendar.trading_days(period_from, period_to).tolist())
+
+    @staticmethod
+    def shift_months(day: datetime.date, months: int) -> datetime.date:
+        """
+        Function for shifting the date back by the number of months. The day is clamped to the length of the month.
+
+        Args:
+            day: specified date.
+            months: number of months.
+
+        Returns:
+            shifted date.
+        """
+        year, month = divmod(day.year * 12 + day.month - 1 - months, 12)
+        return day.replace(year=year, month=month + 1, day=min(day.day, monthrange(year, month + 1)[1]))
+
+    @classmethod
+    def get_period_bounds(cls,
+                          calendar: TradingCalendar,
+                          period: str | tuple[str, str],
+                          period_to: datetime.date
+                          ) -> tuple[datetime.date, datetime.date]:
+        """
+        Function for converting the period of dynamics to its start and end trading days. Relative periods are counted
+            back from the end date, every bound is snapped to the closest trading day from behind.
+
+        Args:
+            calendar: trading calendar.
+            period: relative period (`1D`, `1W`, `2W`, `1M`, `3M`, `6M`, `1Y`, `YTD`) or tuple with string values of
+                the start and end dates.
+            period_to: end trading day of relative periods.
+
+        Returns:
+            tuple with the start and end trading days of the period.
+        """
+        match period:
+            case (str(), str()):
+                try:
+                    period_from, period_to = (cls.to_date(bound) for bound in period)
+                except ValueError as exc:
+                    raise ce.IsNotValidDate(f'The specified value `{period=}` is not a valid period.') from exc
+                if not cls.is_valid_period(period_from, period_to):
+                    raise ce.IsNotValidPeriod('Please enter a valid date range.')
+                period_from: datetime.date = calendar.prev_trading_day(period_from, inclusive=True)
+                period_to: datetime.date = calendar.prev_trading_day(period_to, inclusive=True)
+            case '1D':
+                period_from: datetime.date = calendar.prev_trading_day(period_to)
+            case 'YTD':
+                period_from: datetime.date = calendar.prev_trading_day(period_to.replace(month=1, day=1))
+            case str() if period in DYNAMICS.DAYS:
+                period_from: datetime.date = calendar.prev_trading_day(
+                    period_to - timedelta(days=DYNAMICS.DAYS[period]), inclusive=True
+                )
+            case str() if period in DYNAMICS.MONTHS:
+                period_from: datetime.date = calendar.prev_trading_day(
+                    cls.shift_months(period_to, DYNAMICS.MONTHS[period]), inclusive=True
+                )
+            case _:
+                raise ce.SomethingWentWrong(f'Unexpected value `{period=}`.')
+        if period_from >= period_to:
+            raise ce.IsNotValidPeriod(f'The period `{period}` does not contain two trading days.')
+        return period_from, period_to
+
+    @staticmethod
+    def get_candle_interval(resolution: str) -> int:
+        """
+        Function for converting resolution of candles to the `interval=` parameter of ISS MOEX.
+
+        Args:
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Returns:
+            value of the `interval=` parameter.
+        """
+        if resolution not in RESOLUTION.INTERVALS:
+            raise ce.SomethingWentWrong(
+                f'Unexpected value `{resolution=}`. Expected one of: {", ".join(RESOLUTION.INTERVALS)}.'
+            )
+        return RESOLUTION.INTERVALS[resolution]
 
     @staticmethod
     def full_requests_params(trading_days: tuple[datetime.date] | tuple[datetime.date, datetime.date],
                              tech_name: str,
-                             tech_type: str
+                             tech_type: str,
+                             resolution: str = RESOLUTION.DEFAULT
                              ) -> tuple[dict[str, str], dict[str, list[str]]]:
         """
         Function for filling requests parameters.
@@ -433,6 +612,7 @@ class Helper:
             trading_days: interval containing only trading days.
             tech_name: technical name for filling the url request
             tech_type: technical type for filling the url request
+            resolution: resolution of candles.
 
         Returns:
             filled objects with requests parameters.
@@ -448,62 +628,69 @@ class Helper:
                 tech_type,
                 tech_name,
                 Helper.from_date(trading_day),
-                Helper.from_date(trading_day)
+                Helper.from_date(trading_day),
+                Helper.get_candle_interval(resolution)
             ]
         return urls, additional_params
 
     @staticmethod
-    def get_unique_dates(interval_info: list[list]) -> list[datetime.date]:
+    def trading_days_runs(trading_days: tuple[datetime.date, ...],
+                          missing_days: tuple[datetime.date, ...]
+                          ) -> list[tuple[datetime.date, datetime.date]]:
         """
-        Function for determining unique trading days.
+        Function for grouping missing trading days into runs of consecutive trading days.
 
         Args:
-            interval_info: data on trading results.
+            trading_days: interval containing only trading days.
+            missing_days: trading days from the interval which need to be requested.
 
         Returns:
-            list of unique trading days.
-        """
-        dates: list[datetime.date] = []
-        for item in interval_info:
-            dt: datetime.date = Helper.to_date(item[7][:10])
-            if dt not in dates:
-                dates.append(dt)
-        return dates
+            list of runs. Each run is represented by its first and last trading day.
+        """
+        runs: list[list[datetime.date]] = []
+        missing: set[datetime.date] = set(missing_days)
+        is_previous_missing: bool = False
+        for trading_day in trading_days:
+            is_missing: bool = trading_day in missing
+            if is_missing and is_previous_missing:
+                runs[-1][1] = trading_day
+            elif is_missing:
+                runs.append([trading_day, trading_day])
+            is_previous_missing: bool = is_missing
+        return [(run_from, run_to) for run_from, run_to in runs]
 
     @staticmethod
-    def get_close_values(interval_info: list[list],
-                         dates: list[datetime.date]
-                         ) -> list[float]:
+    def split_by_day(data: list[list],
+                     days: list[str]
+                     ) -> dict[str, list[list]]:
         """
-        Function for determining the closing values of the trading day.
+        Function for splitting candles by trading days.
 
         Args:
-            interval_info: data on trading results.
-            dates: list of unique trading days.
+            data: candles for the several trading days.
+            days: list of trading days in the string type.
 
         Returns:
-            list of close values.
+            candles by trading days. Key is a trading day in the string type.
         """
-        values: list[float] = []
-        for cdt in dates:
-            temp_filtered_data = [dt for dt in interval_info if Helper.to_date(dt[7][:10]) == cdt]
-            max_item: dict[str, float] = Helper.get_last_value(temp_filtered_data)
-            values.append(max_item['close'])
-        return values
+        result: dict[str, list[list]] = {day: [] for day in days}
+        for item in data:
+            if (day := item[6][:10]) in result:
+                result[day].append(item)
+        return result
 
     @staticmethod
-    def from_raw(raw_data: dict[str, dict],
-                 additional_params: dict[str, list[str]]
-                 ) -> list[list]:
+    def from_raw_by_day(raw_data: dict[str, dict],
+                        additional_params: dict[str, list[str]]
+                        ) -> dict[str, list[list]]:
         """
-        Function for consolidating raw data.
+        Function for splitting raw data by trading days.
 
         Args:
-            raw_data: data that needs to be consolidated
-            additional_params: additional parameters that are necessary for consolidation.
+            raw_data: data that needs to be split.
+            additional_params: additional parameters with which the requests were created.
 
         Returns:
-            consolidated data.
+            data by trading days. Key is a trading day in the string type.
         """
-        clean_data = [raw_data[task_name]['candles']['data'] for task_name in additional_params]
-        return sum(clean_data, [])
+        return {params[2]: raw_data[task_name]['candles']['data'] for task_name, params in additional_params.items()}
@@ -0,0 +1,292 @@
+"""
+Module for implementing metrics of requests to ISS MOEX and of calculations.
+"""
+
+# standard library imports
+import threading
+from collections import namedtuple, defaultdict
+from urllib.parse import urlsplit
+
+# third party imports
+import numpy as np
+
+
+RequestEvent: type = namedtuple(
+    'RequestEvent',
+    [
+        'endpoint', 'url', 'status', 'bytes', 'rows',
+        'queue_wait', 'network_time', 'decode_time', 'cache'
+    ]
+)
+RequestEvent.__doc__ = """
+    Event of one request to ISS MOEX. Times are in seconds. `cache` is `hit` for the response from the cache, `miss`
+        for the request whose response is cached and `bypass` for the request which is not cached. `status` is None if
+        the request failed without response.
+"""
+
+ComputeEvent: type = namedtuple(
+    'ComputeEvent',
+    ['name', 'tech_name', 'duration', 'rows']
+)
+ComputeEvent.__doc__ = """
+    Event of one calculation. `duration` is in seconds, `rows` is the number of processed candles.
+"""
+
+
+class MetricsHook:
+    """
+    Class for implementing receiver of events. Subclasses override the methods of the events which they need.
+    """
+    def on_request(self, event: RequestEvent) -> None:
+        """
+        Function which is called for every request to ISS MOEX.
+
+        Args:
+            event: event of the request.
+
+        Returns:
+            None
+        """
+
+    def on_compute(self, event: ComputeEvent) -> None:
+        """
+        Function which is called for every calculation.
+
+        Args:
+            event: event of the calculation.
+
+        Returns:
+            None
+        """
+
+
+class Metrics:
+    """
+    Class for implementing dispatcher of events to the registered hooks. If there are no hooks, events are not created.
+    """
+    def __init__(self) -> None:
+        self.__hooks: tuple[MetricsHook, ...] = ()
+
+    @staticmethod
+    def get_endpoint(url: str) -> str:
+        """
+        Function for determining the endpoint of ISS MOEX by the url.
+
+        Args:
+            url: url of the request.
+
+        Returns:
+            name of the endpoint: `MAIN_INFO`, `COMPOSITION_INFO`, `DETAIL_INFO` or `CALENDAR`.
+        """
+        path: str = urlsplit(url).path
+        if path.endswith('/candles.json'):
+            return 'DETAIL_INFO'
+        if '/calendars/' in path:
+            return 'CALENDAR'
+        if '/analytics/' in path:
+            return 'COMPOSITION_INFO'
+        return 'MAIN_INFO'
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        """
+        Function for registering the hook.
+
+        Args:
+            hook: receiver of events.
+
+        Returns:
+            None
+        """
+        self.__hooks = (*self.__hooks, hook)
+
+    def remove_hook(self, hook: MetricsHook) -> None:
+        """
+        Function for removing the registered hook.
+
+        Args:
+            hook: receiver of events.
+
+        Returns:
+            None
+        """
+        self.__hooks = tuple(registered for registered in self.__hooks if registered is not hook)
+
+    def emit_request(self,
+                     url: str,
+                     status: int | None,
+                     size: int = 0,
+                     rows: int = 0,
+                     queue_wait: float = 0.0,
+                     network_time: float = 0.0,
+                     decode_time: float = 0.0,
+                     cache: str = 'miss'
+                     ) -> None:
+        """
+        Function for passing the event of the request to the hooks.
+
+        Args:
+            url: url of the request.
+            status: HTTP status of the response.
+            size: size of the body of the response in bytes.
+            rows: number of rows in the response.
+            queue_wait: time from the queuing of the attempt by the scheduler to its start.
+            network_time: time of sending the request and reading the response.
+            decode_time: time of decoding the response.
+            cache: `hit`, `miss` or `bypass`.
+
+        Returns:
+            None
+        """
+        if not self.__hooks:
+            return
+        event: RequestEvent = RequestEvent(
+            self.get_endpoint(url), url, status, size, rows, queue_wait, network_time, decode_time, cache
+        )
+        for hook in self.__hooks:
+            hook.on_request(event)
+
+    def emit_compute(self,
+                     name: str,
+                     tech_name: str | None,
+                     duration: float,
+                     rows: int = 0
+                     ) -> None:
+        """
+        Function for passing the event of the calculation to the hooks.
+
+        Args:
+            name: name of the calculation.
+            tech_name: technical name of the instrument.
+            duration: time of the calculation.
+            rows: number of processed candles.
+
+        Returns:
+            None
+        """
+        if not self.__hooks:
+            return
+        event: ComputeEvent = ComputeEvent(name, tech_name, duration, rows)
+        for hook in self.__hooks:
+            hook.on_compute(event)
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        Property for get is_enabled.
+
+        Returns:
+            flag for registered hooks.
+        """
+        return bool(self.__hooks)
+
+    @property
+    def hooks(self) -> tuple[MetricsHook, ...]:
+        """
+        Property for get hooks.
+
+        Returns:
+            registered hooks.
+        """
+        return self.__hooks
+
+
+class MetricsAggregator(MetricsHook):
+    """
+    Class for implementing in-process aggregation of events. Reports percentiles of times by endpoints of ISS MOEX
+        and by names of calculations.
+    """
+    def __init__(self, percentiles: tuple[float, ...] = (50, 90, 99)) -> None:
+        self.__percentiles: tuple[float, ...] = percentiles
+        self.__lock: threading.Lock = threading.Lock()
+        self.__requests: defaultdict[str, list[RequestEvent]] = defaultdict(list)
+        self.__computes: defaultdict[str, list[ComputeEvent]] = defaultdict(list)
+
+    def on_request(self, event: RequestEvent) -> None:
+        """
+        Function for collecting the event of the request.
+
+        Args:
+            event: event of the request.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__requests[event.endpoint].append(event)
+
+    def on_compute(self, event: ComputeEvent) -> None:
+        """
+        Function for collecting the event of the calculation.
+
+        Args:
+            event: event of the calculation.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__computes[event.name].append(event)
+
+    def __summarize(self, values: list[float]) -> dict[str, float]:
+        """
+        Function for calculating percentiles and maximum of the values.
+
+        Args:
+            values: measured values.
+
+        Returns:
+            percentiles and maximum by names. For example: `p50`, `p90`, `max`.
+        """
+        if not values:
+            return {}
+        result: list[float] = np.percentile(values, self.__percentiles).tolist()
+        return {
+            **{f'p{percentile:g}': value for percentile, value in zip(self.__percentiles, result)},
+            'max': max(values)
+        }
+
+    def report(self) -> dict[str, dict[str, dict]]:
+        """
+        Function for creating the report of the collected events.
+
+        Returns:
+            statistics of requests by endpoints and statistics of calculations by names.
+        """
+        with self.__lock:
+            requests: dict[str, list[RequestEvent]] = {name: list(events) for name, events in self.__requests.items()}
+            computes: dict[str, list[ComputeEvent]] = {name: list(events) for name, events in self.__computes.items()}
+        report: dict[str, dict[str, dict]] = {'requests': {}, 'computes': {}}
+        for endpoint, events in requests.items():
+            sent: list[RequestEvent] = [event for event in events if event.cache != 'hit']
+            report['requests'][endpoint] = {
+                'count': len(events),
+                'errors': sum(event.status is None or event.status >= 400 for event in sent),
+                'cache_hits': len(events) - len(sent),
+                'cache_misses': len(sent),
+                'bytes': sum(event.bytes for event in sent),
+                'rows': sum(event.rows for event in events),
+                'queue_wait': self.__summarize([event.queue_wait for event in sent]),
+                'network_time': self.__summarize([event.network_time for event in sent]),
+                'decode_time': self.__summarize([event.decode_time for event in sent])
+            }
+        for name, events in computes.items():
+            report['computes'][name] = {
+                'count': len(events),
+                'rows': sum(event.rows for event in events),
+                'duration': self.__summarize([event.duration for event in events])
+            }
+        return report
+
+    def reset(self) -> None:
+        """
+        Function for removing the collected events.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__requests.clear()
+            self.__computes.clear()
+
+
+metrics: Metrics = Metrics()
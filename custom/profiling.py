@@ -0,0 +1,173 @@
+"""
+Module for implementing profiling of public entry points.
+"""
+
+# standard library imports
+import io
+import os
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from pathlib import Path
+from itertools import count
+from datetime import datetime
+from functools import wraps
+from time import perf_counter
+from collections.abc import Callable
+
+# local imports
+from values.constans import PROFILING
+
+
+class Profiler:
+    """
+    Class for implementing profiling of calls with cProfile and tracemalloc. Every profiled call writes the profile
+        `<name>.prof` which is readable by pstats and the report `<name>.txt` with the top of functions by cumulative
+        time and the top of lines by allocated memory. Only one call is profiled at a time by all profilers, nested
+        and concurrent calls are not profiled separately, they are included in the profile of the outer call.
+    """
+    __lock: threading.Lock = threading.Lock()
+
+    def __init__(self, directory: str | Path | None = None, top_n: int = PROFILING.TOP_N) -> None:
+        self.__directory: Path | None = Path(directory) if directory else None
+        self.__top_n: int = top_n
+        self.__counter: count = count(1)
+
+    def enable(self, directory: str | Path, top_n: int | None = None) -> None:
+        """
+        Function for enabling profiling.
+
+        Args:
+            directory: directory of the profiles and reports. It is created if it does not exist.
+            top_n: number of rows in the tops of the report. If None, the current value is kept.
+
+        Returns:
+            None
+        """
+        self.__directory: Path = Path(directory)
+        if top_n is not None:
+            self.__top_n: int = top_n
+
+    def disable(self) -> None:
+        """
+        Function for disabling profiling.
+
+        Returns:
+            None
+        """
+        self.__directory: Path | None = None
+
+    def __write(self,
+                name: str,
+                profile: cProfile.Profile,
+                snapshots: tuple[tracemalloc.Snapshot, tracemalloc.Snapshot],
+                duration: float,
+                peak_memory: int
+                ) -> None:
+        """
+        Function for writing the profile and the report of the call.
+
+        Args:
+            name: name of the call.
+            profile: collected profile.
+            snapshots: snapshots of memory before and after the call.
+            duration: duration of the call in seconds.
+            peak_memory: peak of memory traced during the call in bytes.
+
+        Returns:
+            None
+        """
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        file_name: str = f'{datetime.now():%Y%m%d_%H%M%S}_{next(self.__counter):04d}_{name}'
+        profile.dump_stats(self.__directory / f'{file_name}.prof')
+
+        stream: io.StringIO = io.StringIO()
+        stream.write(f'{name}: {duration:.6f} s, peak memory {peak_memory} B\n\n')
+        pstats.Stats(profile, stream=stream).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.__top_n)
+        stream.write(f'Top {self.__top_n} allocations:\n')
+        for statistic in snapshots[1].compare_to(snapshots[0], 'lineno')[:self.__top_n]:
+            stream.write(f'{statistic}\n')
+        (self.__directory / f'{file_name}.txt').write_text(stream.getvalue())
+
+    def run(self, name: str, func: Callable, *args, **kwargs):
+        """
+        Function for calling the function under profiling. If profiling is disabled or another call is profiled,
+            the function is called as is.
+
+        Args:
+            name: name of the call, used in file names.
+            func: called function.
+            *args: positional arguments of the function.
+            **kwargs: keyword arguments of the function.
+
+        Returns:
+            result of the function.
+        """
+        if self.__directory is None or not self.__lock.acquire(blocking=False):
+            return func(*args, **kwargs)
+        try:
+            is_own_tracing: bool = not tracemalloc.is_tracing()
+            if is_own_tracing:
+                tracemalloc.start(PROFILING.FRAMES)
+            tracemalloc.reset_peak()
+            snapshot_before: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+            profile: cProfile.Profile = cProfile.Profile()
+            started_at: float = perf_counter()
+            try:
+                result = profile.runcall(func, *args, **kwargs)
+            finally:
+                duration: float = perf_counter() - started_at
+                snapshot_after: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+                _, peak_memory = tracemalloc.get_traced_memory()
+                if is_own_tracing:
+                    tracemalloc.stop()
+                self.__write(name, profile, (snapshot_before, snapshot_after), duration, peak_memory)
+            return result
+        finally:
+            self.__lock.release()
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        Property for get is_enabled.
+
+        Returns:
+            flag for enabled profiling.
+        """
+        return self.__directory is not None
+
+    @property
+    def directory(self) -> Path | None:
+        """
+        Property for get directory.
+
+        Returns:
+            directory of the profiles and reports. None if profiling is disabled.
+        """
+        return self.__directory
+
+
+def profiled(name: str) -> Callable[[Callable], Callable]:
+    """
+    Function for creating decorator of the method which profiles every call by the profiler of the object when
+        profiling is enabled. The object must have the `profiler` property.
+
+    Args:
+        name: name of the call, used in file names.
+
+    Returns:
+        decorator.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(instance, *args, **kwargs):
+            instance_profiler: Profiler = instance.profiler
+            if not instance_profiler.is_enabled:
+                return func(instance, *args, **kwargs)
+            return instance_profiler.run(name, func, instance, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+default_profiler: Profiler = Profiler(os.environ.get(PROFILING.ENV_VAR))
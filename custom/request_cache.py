@@ -0,0 +1,249 @@
+"""
+Module for implementing cache of responses of ISS MOEX.
+"""
+
+# standard library imports
+import math
+import asyncio
+from sys import getsizeof
+from time import monotonic
+from functools import partial
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Coroutine
+
+# local imports
+from custom.cache_policy import CachePolicy
+
+
+class RequestCache:
+    """
+    Class for implementing cache of responses of ISS MOEX keyed by url. Concurrent requests of the same url share one
+        in-flight task, so the url is requested once. Finished responses are kept for the time to live of the class of
+        the request. Candle pages are only shared in flight and are not saved, overlapping intervals reuse finished
+        trading days from the candle store instead. The number and the estimated size of responses are bounded, expired
+        responses are removed first and the least recently used ones are evicted after them.
+    """
+    def __init__(self, policy: CachePolicy | None = None) -> None:
+        self.__policy: CachePolicy = policy or CachePolicy()
+        self.__responses: OrderedDict[str, tuple[float, int, dict]] = OrderedDict()
+        self.__size: int = 0
+        self.__next_expiry: float = math.inf
+        self.__in_flight: dict[str, asyncio.Task] = {}
+        self.__hits: Counter = Counter()
+        self.__misses: Counter = Counter()
+        self.__evictions: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self.__responses)
+
+    def __contains__(self, url: str) -> bool:
+        return (entry := self.__responses.get(url)) is not None and entry[0] > monotonic()
+
+    @staticmethod
+    def get_size(response: dict | list | object) -> int:
+        """
+        Function for estimating the size of the response in memory.
+
+        Args:
+            response: response to the request or its part.
+
+        Returns:
+            estimated size in bytes.
+        """
+        if isinstance(response, dict):
+            return getsizeof(response) + sum(
+                getsizeof(key) + RequestCache.get_size(value) for key, value in response.items()
+            )
+        if isinstance(response, list):
+            return getsizeof(response) + sum(RequestCache.get_size(value) for value in response)
+        return getsizeof(response)
+
+    def __remove(self, url: str) -> None:
+        """
+        Function for removing the cached response.
+
+        Args:
+            url: url of the request.
+
+        Returns:
+            None
+        """
+        _, size, _ = self.__responses.pop(url)
+        self.__size -= size
+
+    def __remove_expired(self) -> None:
+        """
+        Function for removing all expired responses. The responses are scanned only after the earliest of them has
+            expired.
+
+        Returns:
+            None
+        """
+        if (now := monotonic()) < self.__next_expiry:
+            return
+        for url in [url for url, (expires_at, _, _) in self.__responses.items() if expires_at <= now]:
+            self.__remove(url)
+        self.__next_expiry: float = min(
+            (expires_at for expires_at, _, _ in self.__responses.values()), default=math.inf
+        )
+
+    def __lookup(self, url: str) -> dict | None:
+        """
+        Function for getting the cached response which has not expired yet. The response becomes the most recently
+            used one.
+
+        Args:
+            url: url of the request.
+
+        Returns:
+            cached response. None if the url is not cached or the response has expired.
+        """
+        if (entry := self.__responses.get(url)) is None:
+            return None
+        expires_at, _, response = entry
+        if expires_at <= monotonic():
+            self.__remove(url)
+            return None
+        self.__responses.move_to_end(url)
+        return response
+
+    def __store(self, url: str, cache_class: str, response: dict) -> None:
+        """
+        Function for saving the response. Expired responses are removed, then the least recently used responses are
+            evicted until the number and the estimated size of responses fit the policy. The response which is larger
+            than the whole cache is not saved.
+
+        Args:
+            url: url of the request.
+            cache_class: class of the request.
+            response: response to the request.
+
+        Returns:
+            None
+        """
+        if (ttl := self.__policy.get_ttl(cache_class)) <= 0:
+            return
+        if url in self.__responses:
+            self.__remove(url)
+        self.__remove_expired()
+        if (size := self.get_size(response)) > self.__policy.max_bytes:
+            return
+        expires_at: float = monotonic() + ttl
+        self.__responses[url] = (expires_at, size, response)
+        self.__size += size
+        self.__next_expiry: float = min(self.__next_expiry, expires_at)
+        while len(self.__responses) > self.__policy.max_size or self.__size > self.__policy.max_bytes:
+            evicted_url: str = next(iter(self.__responses))
+            self.__remove(evicted_url)
+            self.__evictions[self.__policy.classify(evicted_url)] += 1
+
+    def __on_done(self, url: str, cache_class: str | None, task: asyncio.Task) -> None:
+        """
+        Function which is called when the in-flight task of the url is done.
+
+        Args:
+            url: url of the request.
+            cache_class: class of the request. None if the response must not be saved.
+            task: finished task.
+
+        Returns:
+            None
+        """
+        if self.__in_flight.get(url) is task:
+            del self.__in_flight[url]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if cache_class is not None:
+            self.__store(url, cache_class, task.result())
+
+    async def get(self,
+                  url: str,
+                  fetch: Callable[[], Coroutine],
+                  cache: bool = True
+                  ) -> dict:
+        """
+        Async function for getting the response to the request. The cached response is returned if it has not
+            expired, the in-flight request of the same url is awaited if there is one, otherwise the request is sent.
+
+        Args:
+            url: url of the request.
+            fetch: function which creates coroutine for sending the request.
+            cache: flag for reading the cached response and saving the new one. In-flight requests are shared anyway.
+
+        Returns:
+            response to the request.
+        """
+        cache_class: str = self.__policy.classify(url)
+        if cache:
+            if (response := self.__lookup(url)) is not None:
+                self.__hits[cache_class] += 1
+                return response
+            self.__misses[cache_class] += 1
+        if (task := self.__in_flight.get(url)) is None:
+            task: asyncio.Task = asyncio.ensure_future(fetch())
+            task.add_done_callback(partial(self.__on_done, url, cache_class if cache else None))
+            self.__in_flight[url] = task
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """
+        Function for removing all cached responses.
+
+        Returns:
+            None
+        """
+        self.__responses.clear()
+        self.__size: int = 0
+        self.__next_expiry: float = math.inf
+
+    @property
+    def policy(self) -> CachePolicy:
+        """
+        Property for get policy.
+
+        Returns:
+            policy of caching.
+        """
+        return self.__policy
+
+    @property
+    def size(self) -> int:
+        """
+        Property for get size.
+
+        Returns:
+            estimated size of the cached responses in bytes.
+        """
+        return self.__size
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Property for get in_flight.
+
+        Returns:
+            number of the requests in flight.
+        """
+        return len(self.__in_flight)
+
+    @property
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Property for get stats.
+
+        Returns:
+            numbers of hits, misses and evictions by classes of requests. Key `total` contains the sums.
+        """
+        stats: dict[str, dict[str, int]] = {
+            cache_class: {
+                'hits': self.__hits[cache_class],
+                'misses': self.__misses[cache_class],
+                'evictions': self.__evictions[cache_class]
+            } for cache_class in self.__policy.ttl
+        }
+        stats['total'] = {
+            'hits': self.__hits.total(),
+            'misses': self.__misses.total(),
+            'evictions': self.__evictions.total()
+        }
+        return stats
@@ -0,0 +1,122 @@
+"""
+Module for implementing scheduler of requests to ISS MOEX.
+"""
+
+# standard library imports
+import random
+import asyncio
+from time import perf_counter
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+# third party imports
+import aiohttp
+
+# local imports
+from values.constans import SCHEDULER
+
+
+class TokenBucket:
+    """
+    Class for implementing token bucket limiter of requests per second.
+    """
+    def __init__(self,
+                 rate: float,
+                 capacity: int
+                 ) -> None:
+        self.__rate: float = rate
+        self.__capacity: int = capacity
+        self.__tokens: float = capacity
+        self.__updated_at: float | None = None
+        self.__lock: asyncio.Lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Async function which waits until the token is available and takes it.
+
+        Returns:
+            None
+        """
+        async with self.__lock:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            while True:
+                now: float = loop.time()
+                if self.__updated_at is not None:
+                    self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated_at) * self.__rate)
+                self.__updated_at = now
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.__tokens) / self.__rate)
+
+
+class RequestScheduler:
+    """
+    Class for implementing scheduler of requests to ISS MOEX. Limits the number of requests in flight and the number
+        of requests per second, applies timeout to every request and retries failed requests with jittered
+        exponential backoff.
+    """
+    def __init__(self,
+                 max_in_flight: int = SCHEDULER.MAX_IN_FLIGHT,
+                 requests_per_second: float = SCHEDULER.REQUESTS_PER_SECOND,
+                 burst: int = SCHEDULER.BURST,
+                 timeout: float = SCHEDULER.TIMEOUT,
+                 retries: int = SCHEDULER.RETRIES,
+                 backoff_base: float = SCHEDULER.BACKOFF_BASE,
+                 backoff_max: float = SCHEDULER.BACKOFF_MAX
+                 ) -> None:
+        self.__semaphore: asyncio.Semaphore = asyncio.Semaphore(max_in_flight)
+        self.__token_bucket: TokenBucket = TokenBucket(requests_per_second, burst)
+        self.__timeout: float = timeout
+        self.__retries: int = retries
+        self.__backoff_base: float = backoff_base
+        self.__backoff_max: float = backoff_max
+
+    @staticmethod
+    def is_retryable(exc: BaseException) -> bool:
+        """
+        Function to determine the request which failed with the specified error can be retried.
+
+        Args:
+            exc: error of the request.
+
+        Returns:
+            result of check.
+        """
+        if isinstance(exc, aiohttp.ClientResponseError):
+            return exc.status in SCHEDULER.RETRY_STATUSES
+        return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError, ConnectionResetError))
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Function for determining the delay before the next attempt. Full jitter is applied to the exponential delay.
+
+        Args:
+            attempt: number of the failed attempt starting from zero.
+
+        Returns:
+            delay in seconds.
+        """
+        return random.uniform(0, min(self.__backoff_max, self.__backoff_base * 2 ** attempt))
+
+    async def run(self, request: Callable[[float], Coroutine]) -> Any:
+        """
+        Async function which executes the request according to the limits of the scheduler.
+
+        Args:
+            request: function which creates coroutine of the request. Called again for every attempt with the moment
+                when the attempt was queued, so the wait in the queue does not include previous attempts and backoff.
+
+        Returns:
+            result of the request.
+        """
+        for attempt in range(self.__retries + 1):
+            queued_at: float = perf_counter()
+            await self.__token_bucket.acquire()
+            try:
+                async with self.__semaphore:
+                    return await asyncio.wait_for(request(queued_at), self.__timeout)
+            except Exception as exc:
+                if attempt == self.__retries or not self.is_retryable(exc):
+                    raise
+            await asyncio.sleep(self.get_backoff(attempt))
@@ -0,0 +1,112 @@
+"""
+Module for implementing startup snapshot of MOEX.
+"""
+
+# standard library imports
+import os
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+
+# local imports
+from values.constans import CALENDAR, SNAPSHOT
+from custom.trading_calendar import TradingCalendar
+
+
+class Snapshot:
+    """
+    Class for implementing startup snapshot of MOEX. The snapshot keeps the responses of ISS MOEX which do not change
+        during the trading session: the calendar, main information of indices and compositions of indices. The snapshot
+        is valid until the start of the next trading session.
+    """
+    def __init__(self, path: str | Path) -> None:
+        self.__path: Path = Path(path)
+
+    @staticmethod
+    def get_valid_until(calendar: TradingCalendar, moment: datetime | None = None) -> datetime:
+        """
+        Function for determining the end of the validity window of the snapshot created at the specified moment.
+
+        Args:
+            calendar: trading calendar.
+            moment: moment of creating the snapshot. If None, the current moment is used.
+
+        Returns:
+            start of the next trading session.
+        """
+        moment: datetime = moment or datetime.now()
+        day_start: datetime.time = datetime.strptime(CALENDAR.TIME_DAY_START, CALENDAR.TIME_FRMT).time()
+        next_session_day: datetime.date = calendar.next_trading_day(moment.date(), inclusive=moment.time() < day_start)
+        return datetime.combine(next_session_day, day_start)
+
+    @staticmethod
+    def is_valid(data: dict, moment: datetime | None = None) -> bool:
+        """
+        Function to determine the snapshot is valid at the specified moment.
+
+        Args:
+            data: content of the snapshot.
+            moment: moment for check. If None, the current moment is used.
+
+        Returns:
+            result of check.
+        """
+        return (moment or datetime.now()) < datetime.strptime(data['valid_until'], CALENDAR.DATETIME_FRMT)
+
+    def load(self) -> dict | None:
+        """
+        Function for loading the snapshot.
+
+        Returns:
+            content of the snapshot. None if the snapshot does not exist, is damaged or has other version.
+        """
+        try:
+            with open(self.__path, 'rb') as file:
+                data: dict = json.loads(file.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('version') != SNAPSHOT.VERSION:
+            return None
+        return data
+
+    def save(self,
+             off_days: list[list],
+             main_info: dict[str, dict[str, str]],
+             composition: dict[str, list[list]]
+             ) -> dict:
+        """
+        Function for saving the snapshot. The file is replaced atomically, so concurrent readers never see partial
+            content.
+
+        Args:
+            off_days: days off of the calendar of ISS MOEX.
+            main_info: main information by indices.
+            composition: composition data by indices.
+
+        Returns:
+            content of the snapshot.
+        """
+        data: dict = {
+            'version': SNAPSHOT.VERSION,
+            'valid_until': self.get_valid_until(TradingCalendar(off_days)).strftime(CALENDAR.DATETIME_FRMT),
+            'off_days': off_days,
+            'main_info': main_info,
+            'composition': composition
+        }
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = self.__path.with_name(f'{self.__path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, separators=(',', ':'))
+        os.replace(temp_path, self.__path)
+        return data
+
+    @property
+    def path(self) -> Path:
+        """
+        Property for get path.
+
+        Returns:
+            path of the snapshot file.
+        """
+        return self.__path
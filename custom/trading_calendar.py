@@ -0,0 +1,204 @@
+"""
+Module for implementing trading calendar.
+"""
+
+# standard library imports
+from datetime import date
+
+# third party imports
+import numpy as np
+
+
+class TradingCalendar:
+    """
+    Class for implementing trading calendar. Built once from the days off of ISS MOEX. Stores the bitmap of trading
+        days for the covered years, prefix counts of trading days and the sorted array of trading days. Days outside
+        the covered years are considered trading days from Monday to Friday.
+    """
+    __slots__: tuple = (
+        '__weekends',
+        '__workdays',
+        '__first_day',
+        '__last_day',
+        '__flags',
+        '__prefix_counts',
+        '__trading_days'
+    )
+
+    def __init__(self, off_days: list[list]) -> None:
+        self.__weekends: list[str] = [day_info[0] for day_info in off_days if day_info[3] == 0]
+        self.__workdays: list[str] = [day_info[0] for day_info in off_days if day_info[3] == 1]
+        listed_days: np.ndarray = np.array([day_info[0] for day_info in off_days], dtype='datetime64[D]')
+        first_year: int = listed_days.min().astype(date).year if listed_days.size else date.today().year
+        last_year: int = listed_days.max().astype(date).year if listed_days.size else date.today().year
+        self.__first_day: np.datetime64 = np.datetime64(date(first_year, 1, 1), 'D')
+        self.__last_day: np.datetime64 = np.datetime64(date(last_year, 12, 31), 'D')
+        all_days: np.ndarray = np.arange(
+            self.__first_day, self.__last_day + np.timedelta64(1, 'D'), dtype='datetime64[D]'
+        )
+        self.__flags: np.ndarray = np.is_busday(all_days)
+        self.__flags[(np.array(self.__weekends, dtype='datetime64[D]') - self.__first_day).astype(np.int64)] = False
+        self.__flags[(np.array(self.__workdays, dtype='datetime64[D]') - self.__first_day).astype(np.int64)] = True
+        self.__prefix_counts: np.ndarray = np.concatenate(([0], np.cumsum(self.__flags)))
+        self.__trading_days: np.ndarray = all_days[self.__flags]
+
+    def __repr__(self) -> str:
+        return (
+            f'{__class__.__name__}('
+            f'from={self.__first_day}, '
+            f'to={self.__last_day}, '
+            f'trading_days={self.__trading_days.size})'
+        )
+
+    def __index(self, day: date) -> int:
+        """
+        Function for determining the index of the day in the bitmap.
+
+        Args:
+            day: specified date.
+
+        Returns:
+            index of the day. May be outside the bitmap.
+        """
+        return int((np.datetime64(day, 'D') - self.__first_day).astype(np.int64))
+
+    def is_trading_day(self, day: date) -> bool:
+        """
+        Function to determine the specified day is a trading day or not.
+
+        Args:
+            day: specified date for check.
+
+        Returns:
+            result of check.
+        """
+        if 0 <= (index := self.__index(day)) < self.__flags.size:
+            return bool(self.__flags[index])
+        return bool(np.is_busday(np.datetime64(day, 'D')))
+
+    def next_trading_day(self, day: date, inclusive: bool = False) -> date:
+        """
+        Function for determining the closest trading day after the specified day.
+
+        Args:
+            day: specified date.
+            inclusive: flag for returning the specified day if it is a trading day.
+
+        Returns:
+            the closest trading day.
+        """
+        first: np.datetime64 = np.datetime64(day, 'D') + np.timedelta64(0 if inclusive else 1, 'D')
+        if first < self.__first_day:
+            candidate: np.datetime64 = np.busday_offset(first, 0, roll='forward')
+            if candidate < self.__first_day:
+                return candidate.astype(date)
+            first: np.datetime64 = self.__first_day
+        position: int = int(np.searchsorted(self.__trading_days, first, side='left'))
+        if position < self.__trading_days.size:
+            return self.__trading_days[position].astype(date)
+        return np.busday_offset(max(first, self.__last_day + np.timedelta64(1, 'D')), 0, roll='forward').astype(date)
+
+    def prev_trading_day(self, day: date, inclusive: bool = False) -> date:
+        """
+        Function for determining the closest trading day before the specified day.
+
+        Args:
+            day: specified date.
+            inclusive: flag for returning the specified day if it is a trading day.
+
+        Returns:
+            the closest trading day.
+        """
+        last: np.datetime64 = np.datetime64(day, 'D') - np.timedelta64(0 if inclusive else 1, 'D')
+        if last > self.__last_day:
+            candidate: np.datetime64 = np.busday_offset(last, 0, roll='backward')
+            if candidate > self.__last_day:
+                return candidate.astype(date)
+            last: np.datetime64 = self.__last_day
+        position: int = int(np.searchsorted(self.__trading_days, last, side='right')) - 1
+        if position >= 0:
+            return self.__trading_days[position].astype(date)
+        return np.busday_offset(min(last, self.__first_day - np.timedelta64(1, 'D')), 0, roll='backward').astype(date)
+
+    def count_trading_days(self, period_from: date, period_to: date) -> int:
+        """
+        Function for counting trading days in the period including its bounds.
+
+        Args:
+            period_from: start date of the period.
+            period_to: end date of the period.
+
+        Returns:
+            number of trading days.
+        """
+        start: int = self.__index(period_from)
+        stop: int = self.__index(period_to) + 1
+        if stop <= start:
+            return 0
+        inner_start: int = min(max(start, 0), self.__flags.size)
+        inner_stop: int = min(max(stop, 0), self.__flags.size)
+        count: int = int(self.__prefix_counts[inner_stop] - self.__prefix_counts[inner_start])
+        if start < 0:
+            count += int(np.busday_count(
+                self.__first_day + np.timedelta64(start, 'D'), self.__first_day + np.timedelta64(min(stop, 0), 'D')
+            ))
+        if stop > self.__flags.size:
+            count += int(np.busday_count(
+                self.__first_day + np.timedelta64(max(start, self.__flags.size), 'D'),
+                self.__first_day + np.timedelta64(stop, 'D')
+            ))
+        return count
+
+    def trading_days(self, period_from: date, period_to: date) -> np.ndarray:
+        """
+        Function for expanding the period into trading days.
+
+        Args:
+            period_from: start date of the period.
+            period_to: end date of the period.
+
+        Returns:
+            array of trading days of the period.
+        """
+        first: np.datetime64 = np.datetime64(period_from, 'D')
+        last: np.datetime64 = np.datetime64(period_to, 'D')
+        parts: list[np.ndarray] = []
+        if first < self.__first_day:
+            before: np.ndarray = np.arange(
+                first, min(last + np.timedelta64(1, 'D'), self.__first_day), dtype='datetime64[D]'
+            )
+            parts.append(before[np.is_busday(before)])
+        parts.append(
+            self.__trading_days[
+                np.searchsorted(self.__trading_days, first, side='left'):
+                np.searchsorted(self.__trading_days, last, side='right')
+            ]
+        )
+        if last > self.__last_day:
+            after: np.ndarray = np.arange(
+                max(first, self.__last_day + np.timedelta64(1, 'D')),
+                last + np.timedelta64(1, 'D'),
+                dtype='datetime64[D]'
+            )
+            parts.append(after[np.is_busday(after)])
+        return np.concatenate(parts)
+
+    @property
+    def weekends(self) -> list[str]:
+        """
+        Property for get weekends.
+
+        Returns:
+            list of weekends.
+        """
+        return self.__weekends
+
+    @property
+    def workdays(self) -> list[str]:
+        """
+        Property for get workdays.
+
+        Returns:
+            list of workdays.
+        """
+        return self.__workdays
@@ -0,0 +1,188 @@
+"""
+Module for implementing transport layer to ISS MOEX.
+"""
+
+# standard library imports
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+# third party imports
+import aiohttp
+
+# local imports
+from values.constans import TRANSPORT
+from custom.scheduler import RequestScheduler
+from custom.request_cache import RequestCache
+import custom.custom_exceptions as ce
+
+
+class Transport:
+    """
+    Class for implementing transport layer to ISS MOEX. Owns one pooled keep-alive client session and one cache of
+        responses which are shared by all requests. Synchronous API runs coroutines in the own event loop of the
+        transport, asynchronous API uses the event loop of the caller. One transport must not be used from several
+        event loops.
+    """
+    def __init__(self,
+                 base_url: str = TRANSPORT.BASE_URL,
+                 limit: int = TRANSPORT.LIMIT,
+                 limit_per_host: int = TRANSPORT.LIMIT_PER_HOST,
+                 ttl_dns_cache: int = TRANSPORT.TTL_DNS_CACHE,
+                 keepalive_timeout: float = TRANSPORT.KEEPALIVE_TIMEOUT,
+                 scheduler: RequestScheduler | None = None,
+                 cache: RequestCache | None = None
+                 ) -> None:
+        self.__base_url: str = base_url.rstrip('/')
+        self.__limit: int = limit
+        self.__limit_per_host: int = limit_per_host
+        self.__ttl_dns_cache: int = ttl_dns_cache
+        self.__keepalive_timeout: float = keepalive_timeout
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__session: aiohttp.ClientSession | None = None
+        self.__scheduler: RequestScheduler = scheduler or RequestScheduler()
+        self.__cache: RequestCache = cache if cache is not None else RequestCache()
+
+    def __enter__(self) -> 'Transport':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    async def __aenter__(self) -> 'Transport':
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close_async()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Async function which returns client session. The session is created on the first call.
+
+        Returns:
+            client session from which the requests are sent.
+        """
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.__limit,
+                limit_per_host=self.__limit_per_host,
+                ttl_dns_cache=self.__ttl_dns_cache,
+                use_dns_cache=True,
+                keepalive_timeout=self.__keepalive_timeout
+            )
+            self.__session = aiohttp.ClientSession(connector=connector)
+        return self.__session
+
+    def get_url(self, url: str) -> str:
+        """
+        Function for replacing the address of ISS MOEX in the url by the base url of the transport.
+
+        Args:
+            url: url of the request to ISS MOEX.
+
+        Returns:
+            url of the request to the base url.
+        """
+        if self.__base_url == TRANSPORT.BASE_URL or not url.startswith(TRANSPORT.BASE_URL):
+            return url
+        return self.__base_url + url[len(TRANSPORT.BASE_URL):]
+
+    @staticmethod
+    def is_loop_running() -> bool:
+        """
+        Function to determine the event loop is running in the current thread.
+
+        Returns:
+            result of check.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """
+        Function for running coroutine in the event loop of the transport.
+
+        Args:
+            coroutine: coroutine to run.
+
+        Returns:
+            result of the coroutine.
+
+        Raises:
+            EventLoopIsRunning: if the function is called from the running event loop. The coroutine is closed.
+        """
+        if self.is_loop_running():
+            coroutine.close()
+            raise ce.EventLoopIsRunning(
+                'The synchronous API cannot be used from the running event loop, use the asynchronous API instead.'
+            )
+        if self.__loop is None:
+            self.__loop = asyncio.new_event_loop()
+        return self.__loop.run_until_complete(coroutine)
+
+    async def close_async(self) -> None:
+        """
+        Async function for closing client session of the transport.
+
+        Returns:
+            None
+        """
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+
+    def close(self) -> None:
+        """
+        Function for closing client session and event loop of the transport. Transport which was used only from
+            the event loop of the caller must be closed by `close_async`.
+
+        Returns:
+            None
+        """
+        if self.__loop is None or self.__loop.is_closed():
+            return
+        self.__loop.run_until_complete(self.close_async())
+        self.__loop.run_until_complete(self.__loop.shutdown_asyncgens())
+        self.__loop.close()
+
+    @property
+    def base_url(self) -> str:
+        """
+        Property for get base_url.
+
+        Returns:
+            address of ISS MOEX or of its replacement.
+        """
+        return self.__base_url
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """
+        Property for get scheduler.
+
+        Returns:
+            scheduler of the requests.
+        """
+        return self.__scheduler
+
+    @property
+    def cache(self) -> RequestCache:
+        """
+        Property for get cache.
+
+        Returns:
+            cache of the responses.
+        """
+        return self.__cache
+
+    @property
+    def is_closed(self) -> bool:
+        """
+        Property for get is_closed.
+
+        Returns:
+            flag for closed transport.
+        """
+        return self.__loop is not None and self.__loop.is_closed()
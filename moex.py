@@ -4,42 +4,321 @@ Module for working with Moscow Exchange.
 
 # standard library imports
 import asyncio
+import threading
+from pathlib import Path
 
 # local imports
 from tech.imoex import IMOEX
 from tech.rgbi import RGBI
 from custom.custom_functions import Helper
+from custom.candle_store import CandleStore
+from custom.transport import Transport
+from custom.trading_calendar import TradingCalendar
+from custom.snapshot import Snapshot
+from custom.profiling import Profiler, default_profiler
 from values.constans import MOEX_REQUESTS
+import custom.custom_exceptions as ce
 
 
-class MOEX:
+class AsyncMOEX:
     """
-    Class for working with Moscow Exchange.
+    Class for working with Moscow Exchange from the event loop of the caller. Object is created by `AsyncMOEX.create`.
+        If the path of the snapshot is specified, the calendar, main information and composition of indices are
+        restored from the snapshot. Stale snapshot is used as is and refreshed in the background. If the directory of
+        profiles is specified, the object gets the own profiler and creation of the object, `interval`, `dynamics` and
+        `get_plot` of its instruments are profiled with cProfile and tracemalloc. Other objects are not affected. If the
+        directory is not specified, the default profiler is used, it is enabled by the environment variable
+        `MOEX_PROFILE`.
     """
-    def __init__(self):
-        self.__tech_full_info: dict[str, dict] = asyncio.run(
-            Helper.generate_requests(urls={'CALENDAR': MOEX_REQUESTS['CALENDAR']})
-        )
-        self.__off_days: list[list[str]] = self.__tech_full_info['CALENDAR']['off_days']['data']
-        self.__weekends: list[str] = [day_info[0] for day_info in self.__off_days if day_info[3] == 0]
-        self.__workdays: list[str] = [day_info[0] for day_info in self.__off_days if day_info[3] == 1]
-        self.__last_trade_day_info: dict[str, str | bool] = Helper.get_last_trade_day(
-            self.__weekends,
-            self.__workdays
+    def __init__(self,
+                 candle_store: CandleStore | None = None,
+                 transport: Transport | None = None,
+                 snapshot_path: str | Path | None = None,
+                 profile: str | Path | None = None
+                 ) -> None:
+        self.__profiler: Profiler = Profiler(profile) if profile is not None else default_profiler
+        self.__profiler.run('MOEX.__init__', self.__setup, candle_store, transport, snapshot_path)
+
+    def __setup(self,
+                candle_store: CandleStore | None,
+                transport: Transport | None,
+                snapshot_path: str | Path | None
+                ) -> None:
+        """
+        Function for initializing the state of the object.
+
+        Args:
+            candle_store: candle store shared by all instruments. If None, the store at the default path is used.
+            transport: transport shared by all instruments. If None, the own transport is created.
+            snapshot_path: path of the snapshot file. If None, the snapshot is not used.
+
+        Returns:
+            None
+        """
+        self.__is_own_candle_store: bool = candle_store is None
+        self.__candle_store: CandleStore = candle_store or CandleStore()
+        self.__is_own_transport: bool = transport is None
+        self.__transport: Transport = transport or Transport()
+        self.__snapshot: Snapshot | None = Snapshot(snapshot_path) if snapshot_path is not None else None
+        self.__snapshot_data: dict | None = None
+        self.__snapshot_refresh: threading.Thread | None = None
+        self.__off_days: list[list] | None = None
+        self.__calendar: TradingCalendar | None = None
+        self.__last_trade_day: str | None = None
+        self.__is_trading_now: bool | None = None
+        self.__imoex: IMOEX | None = None
+        self.__rgbi: RGBI | None = None
+        if self.__snapshot is not None:
+            self.__restore_snapshot()
+
+    @classmethod
+    async def create(cls,
+                     candle_store: CandleStore | None = None,
+                     transport: Transport | None = None,
+                     prefetch: bool = True,
+                     snapshot_path: str | Path | None = None,
+                     profile: str | Path | None = None
+                     ) -> 'AsyncMOEX':
+        """
+        Async function for creating object of the AsyncMOEX class.
+
+        Args:
+            candle_store: candle store shared by all instruments. If None, the store at the default path is used.
+            transport: transport shared by all instruments. If None, the own transport is created.
+            prefetch: flag for loading all information at once. If False, the calendar and indices are loaded from
+                the event loop of the caller by `load_calendar_async`, `get_imoex_async` and `get_rgbi_async`.
+            snapshot_path: path of the snapshot file. If None, the snapshot is not used.
+            profile: directory of profiles. If None, the environment variable `MOEX_PROFILE` is used.
+
+        Returns:
+            object of the AsyncMOEX class.
+        """
+        moex: AsyncMOEX = cls(
+            candle_store=candle_store, transport=transport, snapshot_path=snapshot_path, profile=profile
         )
-        self.__last_trade_day: str = self.__last_trade_day_info['last_trade_day']
-        self.__is_trading_now: bool = self.__last_trade_day_info['is_trading_now']
-        self.__imoex: IMOEX = IMOEX(
-            last_trade_day=self.__last_trade_day,
-            weekends=self.__weekends,
-            workdays=self.__workdays,
+        if prefetch:
+            await moex.prefetch_async()
+        return moex
+
+    async def __aenter__(self) -> 'AsyncMOEX':
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close_async()
+
+    async def load_calendar_async(self) -> None:
+        """
+        Async function for loading the calendar and determining the last trading day.
+
+        Returns:
+            None
+        """
+        tech_full_info: dict[str, dict] = await Helper.generate_requests(
+            transport=self.__transport,
+            urls={'CALENDAR': MOEX_REQUESTS['CALENDAR']}
         )
-        self.__rgbi: RGBI = RGBI(
-            last_trade_day=self.__last_trade_day,
-            weekends=self.__weekends,
-            workdays=self.__workdays,
+        self.__set_calendar(tech_full_info['CALENDAR']['off_days']['data'])
+
+    def __set_calendar(self, off_days: list[list]) -> None:
+        """
+        Function for creating the calendar and determining the last trading day.
+
+        Args:
+            off_days: days off of the calendar of ISS MOEX.
+
+        Returns:
+            None
+        """
+        self.__off_days: list[list] = off_days
+        self.__calendar: TradingCalendar = TradingCalendar(off_days)
+        last_trade_day_info: dict[str, str | bool] = Helper.get_last_trade_day(self.__calendar)
+        self.__last_trade_day: str = last_trade_day_info['last_trade_day']
+        self.__is_trading_now: bool = last_trade_day_info['is_trading_now']
+
+    def __restore_snapshot(self) -> None:
+        """
+        Function for restoring the calendar, main information and composition of indices from the snapshot. Stale
+            snapshot is refreshed in the background thread with the own transport.
+
+        Returns:
+            None
+        """
+        if (snapshot_data := self.__snapshot.load()) is None:
+            return
+        self.__snapshot_data: dict = snapshot_data
+        self.__set_calendar(snapshot_data['off_days'])
+        self.imoex.restore_main_info(snapshot_data['main_info']['IMOEX'])
+        self.imoex.restore_composition(snapshot_data['composition']['IMOEX'])
+        self.rgbi.restore_main_info(snapshot_data['main_info']['RGBI'])
+        if not Snapshot.is_valid(snapshot_data):
+            self.__snapshot_refresh: threading.Thread = threading.Thread(
+                target=self.__refresh_snapshot, name='moex-snapshot-refresh'
+            )
+            self.__snapshot_refresh.start()
+
+    def __refresh_snapshot(self) -> None:
+        """
+        Function for refreshing the snapshot from ISS MOEX. Runs in the background thread, so the information is
+            loaded by the separate object with the own transport and the current object is not changed.
+
+        Returns:
+            None
+        """
+        with Transport(base_url=self.__transport.base_url) as transport:
+            fresh_moex: AsyncMOEX = AsyncMOEX(candle_store=self.__candle_store, transport=transport)
+            transport.run(fresh_moex.load_snapshot_info_async())
+            self.__snapshot.save(**fresh_moex.__get_snapshot_info())
+
+    def __get_snapshot_info(self) -> dict:
+        """
+        Function for collecting loaded information which is kept in the snapshot.
+
+        Returns:
+            days off of the calendar, main information and composition of indices.
+        """
+        return {
+            'off_days': self.__off_days,
+            'main_info': {'IMOEX': self.imoex._main_info, 'RGBI': self.rgbi._main_info},
+            'composition': {'IMOEX': self.imoex._composition_data}
+        }
+
+    async def load_snapshot_info_async(self) -> None:
+        """
+        Async function for loading all not yet loaded information which is kept in the snapshot. After the calendar
+            main information and composition of indices are loaded concurrently in one batch.
+
+        Returns:
+            None
+        """
+        if self.__last_trade_day is None:
+            await self.load_calendar_async()
+        await asyncio.gather(
+            self.imoex.load_async(last_detail_info=False),
+            self.rgbi.load_async(last_detail_info=False)
         )
 
+    async def save_snapshot_async(self) -> None:
+        """
+        Async function for saving the calendar, main information and composition of indices to the snapshot.
+            Information which is not yet loaded is loaded before saving.
+
+        Returns:
+            None
+        """
+        if self.__snapshot is None:
+            raise ce.SomethingWentWrong('The path of the snapshot is not specified.')
+        await self.load_snapshot_info_async()
+        self.__snapshot_data: dict = self.__snapshot.save(**self.__get_snapshot_info())
+
+    def save_snapshot(self) -> None:
+        """
+        Function for saving the calendar, main information and composition of indices to the snapshot. Information
+            which is not yet loaded is loaded before saving.
+
+        Returns:
+            None
+        """
+        self.__transport.run(self.save_snapshot_async())
+
+    async def prefetch_async(self) -> None:
+        """
+        Async function for loading all information at once. After the calendar IMOEX with composition and RGBI are
+            loaded concurrently in one batch. If the snapshot is specified but does not exist, it is saved.
+
+        Returns:
+            None
+        """
+        if self.__last_trade_day is None:
+            await self.load_calendar_async()
+        await asyncio.gather(self.imoex.load_async(), self.rgbi.load_async())
+        if self.__snapshot is not None and self.__snapshot_data is None:
+            await self.save_snapshot_async()
+
+    def prefetch(self) -> None:
+        """
+        Function for loading all information at once. After the calendar IMOEX with composition and RGBI are loaded
+            concurrently in one batch. If the snapshot is specified but does not exist, it is saved.
+
+        Returns:
+            None
+        """
+        self.__transport.run(self.prefetch_async())
+
+    def __get_calendar_info(self) -> None:
+        """
+        Function for loading the calendar on the first access.
+
+        Returns:
+            None
+
+        Raises:
+            EventLoopIsRunning: if the calendar is not loaded and the function is called from the running event loop.
+        """
+        if self.__last_trade_day is not None:
+            return
+        if Transport.is_loop_running():
+            raise ce.EventLoopIsRunning(
+                'The calendar is not loaded and cannot be loaded from the running event loop. '
+                'Use `await AsyncMOEX.create()` or `await moex.load_calendar_async()` first.'
+            )
+        self.__transport.run(self.load_calendar_async())
+
+    async def get_imoex_async(self) -> IMOEX:
+        """
+        Async function for getting IMOEX. The calendar, main information and composition of the index are loaded if
+            they are not loaded yet, so constituents can be accessed from the event loop of the caller.
+
+        Returns:
+            IMOEX.
+        """
+        if self.__last_trade_day is None:
+            await self.load_calendar_async()
+        await self.imoex.load_async(last_detail_info=False)
+        return self.imoex
+
+    async def get_rgbi_async(self) -> RGBI:
+        """
+        Async function for getting RGBI. The calendar and main information of the index are loaded if they are not
+            loaded yet.
+
+        Returns:
+            RGBI.
+        """
+        if self.__last_trade_day is None:
+            await self.load_calendar_async()
+        await self.rgbi.load_async(last_detail_info=False)
+        return self.rgbi
+
+    async def close_async(self) -> None:
+        """
+        Async function for closing transport and candle store of the MOEX. Transport and candle store passed from
+            outside are left open. The candle store is closed after the background refresh of the snapshot.
+
+        Returns:
+            None
+        """
+        if self.__is_own_transport:
+            await self.__transport.close_async()
+        if self.__is_own_candle_store:
+            if self.__snapshot_refresh is not None:
+                await asyncio.to_thread(self.__snapshot_refresh.join)
+            self.__candle_store.close()
+
+    def close(self) -> None:
+        """
+        Function for closing transport and candle store of the MOEX. Transport and candle store passed from outside
+            are left open. The candle store is closed after the background refresh of the snapshot.
+
+        Returns:
+            None
+        """
+        if self.__is_own_transport:
+            self.__transport.close()
+        if self.__is_own_candle_store:
+            if self.__snapshot_refresh is not None:
+                self.__snapshot_refresh.join()
+            self.__candle_store.close()
+
     @property
     def imoex(self) -> IMOEX:
         """
@@ -48,6 +327,14 @@ class MOEX:
         Returns:
             IMOEX.
         """
+        if self.__imoex is None:
+            self.__imoex: IMOEX = IMOEX(
+                last_trade_day=self.last_trade_day,
+                calendar=self.calendar,
+                candle_store=self.__candle_store,
+                transport=self.__transport,
+                profiler=self.__profiler
+            )
         return self.__imoex
 
     @property
@@ -58,8 +345,46 @@ class MOEX:
         Returns:
             RGBI.
         """
+        if self.__rgbi is None:
+            self.__rgbi: RGBI = RGBI(
+                last_trade_day=self.last_trade_day,
+                calendar=self.calendar,
+                candle_store=self.__candle_store,
+                transport=self.__transport,
+                profiler=self.__profiler
+            )
         return self.__rgbi
 
+    @property
+    def candle_store(self) -> CandleStore:
+        """
+        Property for get candle_store.
+
+        Returns:
+            candle_store shared by all instruments.
+        """
+        return self.__candle_store
+
+    @property
+    def profiler(self) -> Profiler:
+        """
+        Property for get profiler.
+
+        Returns:
+            profiler of the object and its instruments.
+        """
+        return self.__profiler
+
+    @property
+    def transport(self) -> Transport:
+        """
+        Property for get transport.
+
+        Returns:
+            transport shared by all instruments.
+        """
+        return self.__transport
+
     @property
     def last_trade_day(self) -> str:
         """
@@ -68,6 +393,7 @@ class MOEX:
         Returns:
             last_trade_day instrument.
         """
+        self.__get_calendar_info()
         return self.__last_trade_day
 
     @property
@@ -78,8 +404,40 @@ class MOEX:
         Returns:
             is_trading_now instrument.
         """
+        self.__get_calendar_info()
         return self.__is_trading_now
 
+    @property
+    def snapshot(self) -> Snapshot | None:
+        """
+        Property for get snapshot.
+
+        Returns:
+            snapshot of MOEX. None if the snapshot is not used.
+        """
+        return self.__snapshot
+
+    @property
+    def snapshot_refresh(self) -> threading.Thread | None:
+        """
+        Property for get snapshot_refresh.
+
+        Returns:
+            background thread refreshing the stale snapshot. None if the snapshot was not refreshed.
+        """
+        return self.__snapshot_refresh
+
+    @property
+    def calendar(self) -> TradingCalendar:
+        """
+        Property for get calendar.
+
+        Returns:
+            trading calendar shared by all instruments.
+        """
+        self.__get_calendar_info()
+        return self.__calendar
+
     @property
     def weekends(self) -> list[str]:
         """
@@ -88,7 +446,8 @@ class MOEX:
         Returns:
             list of weekends.
         """
-        return self.__weekends
+        self.__get_calendar_info()
+        return self.__calendar.weekends
 
     @property
     def workdays(self) -> list[str]:
@@ -98,4 +457,16 @@ class MOEX:
         Returns:
             list of workdays.
         """
-        return self.__workdays
+        self.__get_calendar_info()
+        return self.__calendar.workdays
+
+
+class MOEX(AsyncMOEX):
+    """
+    Class for working with Moscow Exchange. Information is loaded on the first access or at once by `prefetch`.
+    """
+    def __enter__(self) -> 'MOEX':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
@@ -4,50 +4,127 @@ Module for working with indices.
 
 # standard library imports
 import asyncio
+from collections.abc import Coroutine
 
 # local imports
-from values.constans import MOEX_REQUESTS
+from values.constans import MOEX_REQUESTS, RESOLUTION
 from tech.base_instrument import BaseInstrument
 from custom.custom_functions import Helper
+from custom.candle_store import CandleStore
+from custom.trading_calendar import TradingCalendar
+from custom.transport import Transport
+from custom.profiling import Profiler
 
 
 class BaseIndex(BaseInstrument):
     """
     Class for working with indices.
     """
+    __slots__: tuple = (
+        '__main_info',
+        '__last_detail_info'
+    )
 
     def __init__(self,
                  tech_name: str,
                  last_trade_day: str,
-                 weekends: list[str],
-                 workdays: list[str]
+                 calendar: TradingCalendar,
+                 candle_store: CandleStore,
+                 transport: Transport,
+                 profiler: Profiler | None = None
                  ) -> None:
         super().__init__(
             tech_name=tech_name,
             tech_type='index',
             last_trade_day=last_trade_day,
-            weekends=weekends,
-            workdays=workdays
+            calendar=calendar,
+            candle_store=candle_store,
+            transport=transport,
+            profiler=profiler
         )
-        additional_params: dict[str, list[str]] = {
-            'MAIN_INFO': [self.tech_name],
-            'DETAIL_INFO': [self.tech_type, self.tech_name, last_trade_day, last_trade_day]
-        }
-        urls: dict[str, str] = {
-            url_name: url for url_name, url in MOEX_REQUESTS.items() if url_name in additional_params.keys()
-        }
-        self.__tech_full_info: dict[str, dict] = asyncio.run(
-            Helper.generate_requests(
-                urls=urls,
-                additional_params=additional_params
-            )
+        self.__main_info: dict[str, str] | None = None
+        self.__last_detail_info: dict[str, str | float] | None = None
+
+    async def load_main_info_async(self) -> None:
+        """
+        Async function for loading main information of the index.
+
+        Returns:
+            None
+        """
+        tech_full_info: dict[str, dict] = await Helper.generate_requests(
+            transport=self.transport,
+            urls={'MAIN_INFO': MOEX_REQUESTS['MAIN_INFO']},
+            additional_params={'MAIN_INFO': [self.tech_name]}
+        )
+        tech_main_data: list[list[str]] = tech_full_info['MAIN_INFO']['description']['data']
+        self.__main_info: dict[str, str] = {item[0]: item[2] for item in tech_main_data}
+
+    async def load_last_detail_info_async(self) -> None:
+        """
+        Async function for loading the last candle of the index.
+
+        Returns:
+            None
+        """
+        tech_full_info: dict[str, dict] = await Helper.generate_requests(
+            transport=self.transport,
+            urls={'DETAIL_INFO': MOEX_REQUESTS['DETAIL_INFO']},
+            additional_params={
+                'DETAIL_INFO': [
+                    self.tech_type,
+                    self.tech_name,
+                    self.last_trade_day,
+                    self.last_trade_day,
+                    Helper.get_candle_interval(RESOLUTION.DEFAULT)
+                ]
+            }
         )
-        self.__tech_main_data: list[list[str]] = self.__tech_full_info['MAIN_INFO']['description']['data']
-        self._main_info: dict[str, str] = {item[0]: item[2] for item in self.__tech_main_data}
         self.__last_detail_info: dict[str, str | float] = (
-            Helper.get_last_value(self.__tech_full_info['DETAIL_INFO']['candles']['data'])
+            Helper.get_last_value(tech_full_info['DETAIL_INFO']['candles']['data'])
         )
 
+    async def load_async(self, last_detail_info: bool = True) -> None:
+        """
+        Async function for concurrent loading of all not yet loaded information of the index.
+
+        Args:
+            last_detail_info: flag for loading the last candle of the index.
+
+        Returns:
+            None
+        """
+        loaders: list[Coroutine] = []
+        if self.__main_info is None:
+            loaders.append(self.load_main_info_async())
+        if last_detail_info and self.__last_detail_info is None:
+            loaders.append(self.load_last_detail_info_async())
+        await asyncio.gather(*loaders)
+
+    def restore_main_info(self, main_info: dict[str, str]) -> None:
+        """
+        Function for restoring main information of the index from the snapshot.
+
+        Args:
+            main_info: main information of the index.
+
+        Returns:
+            None
+        """
+        self.__main_info: dict[str, str] = main_info
+
+    @property
+    def _main_info(self) -> dict[str, str]:
+        """
+        Property for get main information. Loaded on the first access.
+
+        Returns:
+            main information of index.
+        """
+        if self.__main_info is None:
+            self.transport.run(self.load_main_info_async())
+        return self.__main_info
+
     @property
     def secid(self) -> str:
         """
@@ -116,4 +193,6 @@ class BaseIndex(BaseInstrument):
         Returns:
             last_detail_info of index.
         """
+        if self.__last_detail_info is None:
+            self.transport.run(self.load_last_detail_info_async())
         return self.__last_detail_info
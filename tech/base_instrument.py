@@ -4,39 +4,480 @@ Module for working with MOEX instrument.
 
 # standard library imports
 import asyncio
-from datetime import datetime
+from time import perf_counter
+from datetime import date, datetime
+from collections.abc import AsyncIterator, Coroutine, Iterator
+
+# third party imports
+import numpy as np
 
 # local imports
 from tech.dynamics import Dynamics
 from tech.interval import Interval
+from tech.candles import Candles, DailyCandles
 from custom.custom_functions import Helper
+from custom.candle_store import CandleStore
+from custom.trading_calendar import TradingCalendar
+from custom.transport import Transport
+from custom.profiling import Profiler, default_profiler, profiled
+from custom.metrics import metrics
+from values.constans import MOEX_REQUESTS, PAGINATION, RESOLUTION
+import custom.custom_exceptions as ce
 
 
 class BaseInstrument:
     """
     Class for working with MOEX instrument.
     """
+    __slots__: tuple = (
+        '__tech_name',
+        '__tech_type',
+        '__last_trade_day',
+        '__calendar',
+        '__candle_store',
+        '__transport',
+        '__profiler'
+    )
+
     def __init__(self,
                  tech_name: str,
                  tech_type: str,
                  last_trade_day: str,
-                 weekends: list[str],
-                 workdays: list[str]
+                 calendar: TradingCalendar,
+                 candle_store: CandleStore,
+                 transport: Transport,
+                 profiler: Profiler | None = None
                  ) -> None:
         self.__tech_name: str = tech_name
         self.__tech_type: str = tech_type
         self.__last_trade_day: str = last_trade_day
-        self.__weekends: list[str] = weekends
-        self.__workdays: list[str] = workdays
+        self.__calendar: TradingCalendar = calendar
+        self.__candle_store: CandleStore = candle_store
+        self.__transport: Transport = transport
+        self.__profiler: Profiler = profiler or default_profiler
 
-    def dynamics(self,
-                 period_from: str,
-                 period_to: str | None = None,
-                 return_date_str: bool = True,
-                 soft_search: None | str = None
-                 ) -> Dynamics:
+    async def __fetch_range(self,
+                            period_from: datetime.date,
+                            period_to: datetime.date,
+                            resolution: str
+                            ) -> list[list]:
         """
-        Function for getting data to generate the correct period for creating object of the Dynamics class.
+        Async function for requesting candles of the instrument for the whole period with ISS MOEX pagination.
+            Responses are not cached, finished trading days are kept by the candle store.
+
+        Args:
+            period_from: start date of the period.
+            period_to: end date of the period.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Returns:
+            candles for the period.
+        """
+        return await Helper.generate_paged_requests(
+            transport=self.__transport,
+            url=MOEX_REQUESTS['DETAIL_INFO_PAGE'],
+            params=[
+                self.__tech_type,
+                self.__tech_name,
+                Helper.from_date(period_from),
+                Helper.from_date(period_to),
+                Helper.get_candle_interval(resolution)
+            ],
+            block='candles',
+            cache=False
+        )
+
+    async def __fetch_days(self,
+                           missing_days: tuple[datetime.date, ...],
+                           resolution: str
+                           ) -> dict[str, list[list]]:
+        """
+        Async function for requesting candles of the instrument with one request per trading day. Responses are not
+            cached, finished trading days are kept by the candle store.
+
+        Args:
+            missing_days: trading days which need to be requested.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Returns:
+            candles by trading days. Key is a trading day in the string type.
+
+        Raises:
+            RequestsFailed: if some of the trading days failed. Candles of the successful days are kept in the
+                exception by trading days.
+        """
+        urls, additional_params = Helper.full_requests_params(
+            missing_days, self.__tech_name, self.__tech_type, resolution
+        )
+        try:
+            candles_raw: dict[str, dict] = await Helper.generate_requests(
+                transport=self.__transport,
+                urls=urls,
+                additional_params=additional_params,
+                cache=False
+            )
+        except ce.RequestsFailed as exc:
+            exc.responses = Helper.from_raw_by_day(
+                exc.responses,
+                {task_name: params for task_name, params in additional_params.items() if task_name in exc.responses}
+            )
+            exc.failures = {additional_params[task_name][2]: error for task_name, error in exc.failures.items()}
+            raise
+        return Helper.from_raw_by_day(candles_raw, additional_params)
+
+    async def __fetch_ranges(self,
+                             trading_days: tuple[datetime.date, ...],
+                             missing_days: tuple[datetime.date, ...],
+                             resolution: str
+                             ) -> dict[str, list[list]]:
+        """
+        Async function for requesting candles of the instrument with one paginated request per run of consecutive
+            missing trading days. The runs are requested concurrently.
+
+        Args:
+            trading_days: interval containing only trading days.
+            missing_days: trading days from the interval which need to be requested.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Returns:
+            candles by trading days. Key is a trading day in the string type.
+
+        Raises:
+            RequestsFailed: if some of the runs failed. Candles of the successful runs are kept in the exception by
+                trading days.
+        """
+        runs: list[tuple[datetime.date, datetime.date]] = Helper.trading_days_runs(trading_days, missing_days)
+        ranges_data: list[list[list] | BaseException] = await asyncio.gather(
+            *(self.__fetch_range(period_from, period_to, resolution) for period_from, period_to in runs),
+            return_exceptions=True
+        )
+        days: list[str] = [Helper.from_date(missing_day) for missing_day in missing_days]
+        failures: dict[str, BaseException] = {}
+        for (period_from, period_to), range_data in zip(runs, ranges_data):
+            if isinstance(range_data, BaseException):
+                failures[f'{Helper.from_date(period_from)}_{Helper.from_date(period_to)}'] = range_data
+                days: list[str] = [day for day in days if not period_from <= Helper.to_date(day) <= period_to]
+        result: dict[str, list[list]] = Helper.split_by_day(
+            sum((range_data for range_data in ranges_data if not isinstance(range_data, BaseException)), []),
+            days
+        )
+        if failures:
+            raise ce.RequestsFailed(
+                f'{len(failures)} of {len(runs)} periods failed: {", ".join(failures)}.',
+                responses=result,
+                failures=failures
+            )
+        return result
+
+    def __save_finished(self, day_candles: dict[str, list[list]], resolution: str) -> None:
+        """
+        Function for saving candles of the finished trading days to the candle store.
+
+        Args:
+            day_candles: candles by trading days. Key is a trading day in the string type.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Returns:
+            None
+        """
+        self.__candle_store.save(
+            self.__tech_type,
+            self.__tech_name,
+            {day: candles for day, candles in day_candles.items() if CandleStore.is_finished_day(Helper.to_date(day))},
+            resolution
+        )
+
+    def __to_candles(self, rows: list[list]) -> Candles:
+        """
+        Function for converting rows of ISS MOEX to candles. The event of the conversion is passed to the metrics hooks.
+
+        Args:
+            rows: candles represented by rows.
+
+        Returns:
+            candles in the columnar format.
+        """
+        started_at: float = perf_counter()
+        candles: Candles = Candles.from_rows(rows)
+        metrics.emit_compute('Candles.from_rows', self.__tech_name, perf_counter() - started_at, len(candles))
+        return candles
+
+    async def __get_candles_async(self,
+                                  trading_days: tuple[datetime.date, ...],
+                                  fetch_mode: str = 'day',
+                                  resolution: str = RESOLUTION.DEFAULT
+                                  ) -> Candles:
+        """
+        Async function for getting candles of the instrument. Days which are already in the candle store are served
+            from it, only missing days are requested from ISS MOEX. If some of the requests failed, candles of the
+            successful days are saved to the candle store before the error is raised. Weekly and monthly candles do not
+            belong to one day, so they are requested for the whole period and are not stored.
+
+        Args:
+            trading_days: interval containing only trading days.
+            fetch_mode: `day` - one request per trading day, `range` - one paginated request per run of consecutive
+                missing trading days.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Returns:
+            candles for the specified trading days.
+        """
+        if resolution not in RESOLUTION.STORED:
+            return self.__to_candles(await self.__fetch_range(min(trading_days), max(trading_days), resolution))
+        days: list[str] = list(dict.fromkeys(Helper.from_date(trading_day) for trading_day in trading_days))
+        stored_candles: dict[str, list[list]] = self.__candle_store.load(
+            self.__tech_type, self.__tech_name, days, resolution
+        )
+        missing_days: tuple[datetime.date, ...] = tuple(
+            Helper.to_date(day) for day in days if day not in stored_candles
+        )
+        fetched_candles: dict[str, list[list]] = {}
+        if missing_days:
+            match fetch_mode:
+                case 'day':
+                    fetching: Coroutine = self.__fetch_days(missing_days, resolution)
+                case 'range':
+                    fetching: Coroutine = self.__fetch_ranges(trading_days, missing_days, resolution)
+                case _:
+                    raise ce.SomethingWentWrong(f'Unexpected value `{fetch_mode=}`.')
+            try:
+                fetched_candles: dict[str, list[list]] = await fetching
+            except ce.RequestsFailed as exc:
+                self.__save_finished(exc.responses, resolution)
+                raise
+            self.__save_finished(fetched_candles, resolution)
+        return self.__to_candles(
+            sum((stored_candles[day] if day in stored_candles else fetched_candles[day] for day in days), [])
+        )
+
+    async def __stream_run(self,
+                           run_days: list[str],
+                           resolution: str,
+                           save: bool = True
+                           ) -> AsyncIterator[Candles]:
+        """
+        Async generator which requests candles of the run of consecutive trading days page by page and yields every
+            page as it arrives. The next page is requested while the current one is processed. Finished trading days
+            are saved to the candle store as soon as they are complete.
+
+        Args:
+            run_days: consecutive trading days in the string type.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+            save: flag for saving finished trading days to the candle store.
+
+        Yields:
+            candles of one page.
+        """
+        url: str = MOEX_REQUESTS['DETAIL_INFO_PAGE']
+        params: list[str] = [
+            self.__tech_type,
+            self.__tech_name,
+            run_days[0],
+            run_days[-1],
+            Helper.get_candle_interval(resolution)
+        ]
+        start: int = 0
+        next_page: asyncio.Future | None = asyncio.ensure_future(
+            Helper.request(self.__transport, url.format(*params, start))
+        )
+        seen_days: set[str] = set()
+        current_day: str | None = None
+        current_rows: list[list] = []
+        try:
+            while next_page is not None:
+                page_data: list[list] = (await next_page)['candles']['data']
+                start += PAGINATION.PAGE_SIZE
+                next_page: asyncio.Future | None = asyncio.ensure_future(
+                    Helper.request(self.__transport, url.format(*params, start))
+                ) if len(page_data) == PAGINATION.PAGE_SIZE else None
+                for row in page_data if save else ():
+                    if (day := row[6][:10]) != current_day:
+                        if current_day is not None:
+                            self.__save_finished({current_day: current_rows}, resolution)
+                        current_day, current_rows = day, []
+                        seen_days.add(day)
+                    current_rows.append(row)
+                yield self.__to_candles(page_data)
+            if save:
+                if current_day is not None:
+                    self.__save_finished({current_day: current_rows}, resolution)
+                self.__save_finished({day: [] for day in run_days if day not in seen_days}, resolution)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def __iter_candles_async(self,
+                                   trading_days: tuple[datetime.date, ...],
+                                   resolution: str = RESOLUTION.DEFAULT
+                                   ) -> AsyncIterator[Candles]:
+        """
+        Async generator which yields candles of the instrument in chronological chunks. Stored trading days are
+            yielded one by one from the candle store, runs of missing trading days are requested page by page, so
+            only one chunk is kept in memory. Weekly and monthly candles are requested for the whole period.
+
+        Args:
+            trading_days: interval containing only trading days.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Yields:
+            candles of one stored trading day or of one page.
+        """
+        days: list[str] = list(dict.fromkeys(Helper.from_date(trading_day) for trading_day in trading_days))
+        if resolution not in RESOLUTION.STORED:
+            async for candles in self.__stream_run([min(days), max(days)], resolution, save=False):
+                yield candles
+            return
+        stored_days: set[str] = self.__candle_store.stored_days(self.__tech_type, self.__tech_name, days, resolution)
+        runs: list[tuple[datetime.date, datetime.date]] = Helper.trading_days_runs(
+            tuple(Helper.to_date(day) for day in days),
+            tuple(Helper.to_date(day) for day in days if day not in stored_days)
+        )
+        run_ends: dict[str, str] = {
+            Helper.from_date(run_from): Helper.from_date(run_to) for run_from, run_to in runs
+        }
+        index: int = 0
+        while index < len(days):
+            if (day := days[index]) in run_ends:
+                run_days: list[str] = days[index:days.index(run_ends[day], index) + 1]
+                async for candles in self.__stream_run(run_days, resolution):
+                    yield candles
+                index += len(run_days)
+            else:
+                yield self.__to_candles(
+                    self.__candle_store.load(self.__tech_type, self.__tech_name, [day], resolution)[day]
+                )
+                index += 1
+
+    async def candles_since_async(self,
+                                  since: np.datetime64 | datetime,
+                                  period_to: date | None = None,
+                                  resolution: str = RESOLUTION.DEFAULT
+                                  ) -> Candles:
+        """
+        Async function for requesting candles of the instrument which begin at or after the specified moment. The
+            responses are not cached, so every call returns the newest candles.
+
+        Args:
+            since: moment from which the candles are requested. For example, begin of the last known candle.
+            period_to: end date of the period. If None, the last trading day is used.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Returns:
+            candles which begin at or after the specified moment.
+        """
+        url: str = MOEX_REQUESTS['DETAIL_INFO_PAGE']
+        params: list[str] = [
+            self.__tech_type,
+            self.__tech_name,
+            Candles.to_str(np.datetime64(since, 's')),
+            Helper.from_date(period_to) if period_to is not None else self.__last_trade_day,
+            Helper.get_candle_interval(resolution)
+        ]
+        data: list[list] = []
+        start: int = 0
+        while True:
+            page_data: list[list] = (
+                await Helper.request(self.__transport, url.format(*params, start))
+            )['candles']['data']
+            data.extend(page_data)
+            if len(page_data) < PAGINATION.PAGE_SIZE:
+                break
+            start += PAGINATION.PAGE_SIZE
+        candles: Candles = self.__to_candles(data)
+        return candles[candles.begin >= np.datetime64(since, 's')]
+
+    async def candles_stream_async(self,
+                                   period_from: str,
+                                   period_to: str | None = None,
+                                   soft_search: None | str = None,
+                                   resolution: str = RESOLUTION.DEFAULT
+                                   ) -> AsyncIterator[Candles]:
+        """
+        Async generator which yields candles of the instrument for the period in chronological chunks as they arrive.
+
+        Args:
+            period_from: start date of the period.
+            period_to: end date of the period.
+            soft_search: If not None, the search will be applied until the next trading day.
+                `forward` - the closest forward, `back` - the closest from behind.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Yields:
+            candles of one stored trading day or of one page.
+        """
+        period_from, period_to = Helper.check_date(
+            self.__last_trade_day,
+            self.__calendar,
+            soft_search,
+            period_from,
+            period_to
+        )
+        trading_days: tuple = Helper.interval_trading_days(self.__calendar, period_from, period_to)
+        async for candles in self.__iter_candles_async(trading_days, resolution):
+            yield candles
+
+    def candles_stream(self,
+                       period_from: str,
+                       period_to: str | None = None,
+                       soft_search: None | str = None,
+                       resolution: str = RESOLUTION.DEFAULT
+                       ) -> Iterator[Candles]:
+        """
+        Generator which yields candles of the instrument for the period in chronological chunks as they arrive.
+
+        Args:
+            period_from: start date of the period.
+            period_to: end date of the period.
+            soft_search: If not None, the search will be applied until the next trading day.
+                `forward` - the closest forward, `back` - the closest from behind.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Yields:
+            candles of one stored trading day or of one page.
+        """
+        stream: AsyncIterator[Candles] = self.candles_stream_async(
+            period_from, period_to, soft_search, resolution
+        )
+        try:
+            while True:
+                try:
+                    yield self.__transport.run(anext(stream))
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.__transport.run(stream.aclose())
+
+    async def daily_async(self,
+                          period_from: date,
+                          period_to: date,
+                          resolution: str = RESOLUTION.CLOSES
+                          ) -> DailyCandles:
+        """
+        Async function for getting candles of the instrument aggregated by trading days. The period is requested
+            with one paginated request per run of missing trading days.
+
+        Args:
+            period_from: start date of the period.
+            period_to: end date of the period.
+            resolution: resolution of candles. Daily candles are requested by default.
+
+        Returns:
+            object of the class DailyCandles.
+        """
+        trading_days: tuple = Helper.interval_trading_days(self.__calendar, period_from, period_to)
+        if not trading_days:
+            return DailyCandles.empty()
+        return (await self.__get_candles_async(trading_days, 'range', resolution)).daily()
+
+    async def dynamics_async(self,
+                             period_from: str,
+                             period_to: str | None = None,
+                             return_date_str: bool = True,
+                             soft_search: None | str = None,
+                             resolution: str = RESOLUTION.CLOSES
+                             ) -> Dynamics:
+        """
+        Async function for getting data to generate the correct period for creating object of the Dynamics class.
 
         Args:
             period_from: start date of the period for calculating the dynamics.
@@ -45,36 +486,64 @@ class BaseInstrument:
                 True is a string, False is an object of the date class.
             soft_search: If not None, the search will be applied until the next trading day.
                 `forward` - the closest forward, `back` - the closest from behind.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`. Only close values are used, so daily
+                candles are requested by default. Weekly and monthly candles do not end on the specified days.
 
         Returns:
             object of the class Dynamics.
         """
+        if resolution not in RESOLUTION.STORED:
+            raise ce.SomethingWentWrong(
+                f'Unexpected value `{resolution=}`. Expected one of: {", ".join(RESOLUTION.STORED)}.'
+            )
         period: tuple[datetime.date, datetime.date] = Helper.check_date(
             self.__last_trade_day,
-            self.__weekends,
-            self.__workdays,
+            self.__calendar,
             soft_search,
             period_from,
             period_to
         )
-        urls, additional_params = Helper.full_requests_params(period, self.__tech_name, self.__tech_type)
-        dynamics_info_raw: dict[str, dict] = asyncio.run(
-            Helper.generate_requests(
-                urls=urls,
-                additional_params=additional_params
-            )
-        )
-        dynamics_info: list[list] = Helper.from_raw(dynamics_info_raw, additional_params)
+        dynamics_info: Candles = await self.__get_candles_async(period, resolution=resolution)
         return Dynamics(dynamics_info, period, return_date_str)
 
-    def interval(self,
+    @profiled('dynamics')
+    def dynamics(self,
                  period_from: str,
                  period_to: str | None = None,
-                 return_datetime_str: bool = True,
-                 soft_search: None | str = None
-                 ) -> Interval:
+                 return_date_str: bool = True,
+                 soft_search: None | str = None,
+                 resolution: str = RESOLUTION.CLOSES
+                 ) -> Dynamics:
         """
-        Function for getting data to generate the correct period for creating object of the Interval class.
+        Function for getting data to generate the correct period for creating object of the Dynamics class.
+
+        Args:
+            period_from: start date of the period for calculating the dynamics.
+            period_to: end date of the period for calculating the dynamics.
+            return_date_str: flag for specifying the type of date to be returned.
+                True is a string, False is an object of the date class.
+            soft_search: If not None, the search will be applied until the next trading day.
+                `forward` - the closest forward, `back` - the closest from behind.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`. Only close values are used, so daily
+                candles are requested by default. Weekly and monthly candles do not end on the specified days.
+
+        Returns:
+            object of the class Dynamics.
+        """
+        return self.__transport.run(
+            self.dynamics_async(period_from, period_to, return_date_str, soft_search, resolution)
+        )
+
+    async def interval_async(self,
+                             period_from: str,
+                             period_to: str | None = None,
+                             return_datetime_str: bool = True,
+                             soft_search: None | str = None,
+                             fetch_mode: str = 'range',
+                             resolution: str = RESOLUTION.DEFAULT
+                             ) -> Interval:
+        """
+        Async function for getting data to generate the correct period for creating object of the Interval class.
 
         Args:
             period_from: start date of the period for calculating the interval.
@@ -83,34 +552,71 @@ class BaseInstrument:
                 True is a string, False is an object of the date class.
             soft_search: If not None, the search will be applied until the next trading day.
                 `forward` - the closest forward, `back` - the closest from behind.
+            fetch_mode: `range` - one paginated request for the whole period, `day` - one request per trading day,
+                `stream` - pages are requested one by one and statistics are calculated online.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`. For long periods daily
+                candles reduce the number of requests.
 
         Returns:
             object of the class Interval.
         """
         period_from, period_to = Helper.check_date(
             self.__last_trade_day,
-            self.__weekends,
-            self.__workdays,
+            self.__calendar,
             soft_search,
             period_from,
             period_to
         )
         period: dict[str, datetime.date] = {'period_from': period_from, 'period_to': period_to}
-        trading_days: tuple = Helper.interval_trading_days(self.__weekends, self.__workdays, period_from, period_to)
-        urls, additional_params = Helper.full_requests_params(trading_days, self.__tech_name, self.__tech_type)
-
-        interval_info_raw: dict[str, dict] = asyncio.run(
-            Helper.generate_requests(
-                urls=urls,
-                additional_params=additional_params
+        trading_days: tuple = Helper.interval_trading_days(self.__calendar, period_from, period_to)
+        if fetch_mode == 'stream':
+            return await Interval.from_stream(
+                self.__tech_name,
+                self.__iter_candles_async(trading_days, resolution),
+                period,
+                return_datetime_str,
+                source=self,
+                resolution=resolution
             )
-        )
-        interval_info: list[list] = Helper.from_raw(interval_info_raw, additional_params)
+        interval_info: Candles = await self.__get_candles_async(trading_days, fetch_mode, resolution)
         return Interval(
             self.__tech_name,
             interval_info,
             period,
-            return_datetime_str
+            return_datetime_str,
+            source=self,
+            resolution=resolution
+        )
+
+    @profiled('interval')
+    def interval(self,
+                 period_from: str,
+                 period_to: str | None = None,
+                 return_datetime_str: bool = True,
+                 soft_search: None | str = None,
+                 fetch_mode: str = 'range',
+                 resolution: str = RESOLUTION.DEFAULT
+                 ) -> Interval:
+        """
+        Function for getting data to generate the correct period for creating object of the Interval class.
+
+        Args:
+            period_from: start date of the period for calculating the interval.
+            period_to: end date of the period for calculating the interval.
+            return_datetime_str: flag for specifying the type of date to be returned.
+                True is a string, False is an object of the date class.
+            soft_search: If not None, the search will be applied until the next trading day.
+                `forward` - the closest forward, `back` - the closest from behind.
+            fetch_mode: `range` - one paginated request for the whole period, `day` - one request per trading day,
+                `stream` - pages are requested one by one and statistics are calculated online.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`. For long periods daily
+                candles reduce the number of requests.
+
+        Returns:
+            object of the class Interval.
+        """
+        return self.__transport.run(
+            self.interval_async(period_from, period_to, return_datetime_str, soft_search, fetch_mode, resolution)
         )
 
     @property
@@ -132,3 +638,53 @@ class BaseInstrument:
             tech_type instrument.
         """
         return self.__tech_type
+
+    @property
+    def last_trade_day(self) -> str:
+        """
+        Property for get last_trade_day.
+
+        Returns:
+            last_trade_day instrument.
+        """
+        return self.__last_trade_day
+
+    @property
+    def calendar(self) -> TradingCalendar:
+        """
+        Property for get calendar.
+
+        Returns:
+            trading calendar.
+        """
+        return self.__calendar
+
+    @property
+    def candle_store(self) -> CandleStore:
+        """
+        Property for get candle_store.
+
+        Returns:
+            candle_store instrument.
+        """
+        return self.__candle_store
+
+    @property
+    def transport(self) -> Transport:
+        """
+        Property for get transport.
+
+        Returns:
+            transport instrument.
+        """
+        return self.__transport
+
+    @property
+    def profiler(self) -> Profiler:
+        """
+        Property for get profiler.
+
+        Returns:
+            profiler of the public entry points.
+        """
+        return self.__profiler
@@ -0,0 +1,484 @@
+"""
+Module for working with candles.
+"""
+
+# standard library imports
+from datetime import date, datetime
+
+# third party imports
+import numpy as np
+
+# local imports
+import custom.custom_exceptions as ce
+
+
+class Candles:
+    """
+    Class for working with candles. Candles are stored by columns in arrays sorted by the begin of the candle.
+    """
+    __slots__: tuple = (
+        '__open',
+        '__close',
+        '__high',
+        '__low',
+        '__value',
+        '__volume',
+        '__begin',
+        '__end'
+    )
+
+    def __init__(self,
+                 open_values: np.ndarray,
+                 close_values: np.ndarray,
+                 high_values: np.ndarray,
+                 low_values: np.ndarray,
+                 values: np.ndarray,
+                 volumes: np.ndarray,
+                 begin: np.ndarray,
+                 end: np.ndarray
+                 ) -> None:
+        order: np.ndarray | slice = slice(None)
+        if begin.size > 1 and np.any(begin[1:] < begin[:-1]):
+            order: np.ndarray = np.argsort(begin, kind='stable')
+        self.__open: np.ndarray = open_values[order]
+        self.__close: np.ndarray = close_values[order]
+        self.__high: np.ndarray = high_values[order]
+        self.__low: np.ndarray = low_values[order]
+        self.__value: np.ndarray = values[order]
+        self.__volume: np.ndarray = volumes[order]
+        self.__begin: np.ndarray = begin[order]
+        self.__end: np.ndarray = end[order]
+
+    def __len__(self) -> int:
+        return self.__close.size
+
+    def __repr__(self) -> str:
+        return f'{__class__.__name__}(size={len(self)})'
+
+    def __getitem__(self, item: slice | np.ndarray) -> 'Candles':
+        return Candles(
+            self.__open[item],
+            self.__close[item],
+            self.__high[item],
+            self.__low[item],
+            self.__value[item],
+            self.__volume[item],
+            self.__begin[item],
+            self.__end[item]
+        )
+
+    @classmethod
+    def from_rows(cls, rows: list[list]) -> 'Candles':
+        """
+        Function for creating candles from the rows of ISS MOEX. Columns of the row: open, close, high, low, value,
+            volume, begin, end.
+
+        Args:
+            rows: candles represented by rows.
+
+        Returns:
+            object of the class Candles.
+        """
+        if not rows:
+            return cls.empty()
+        columns: list[tuple] = list(zip(*rows))
+        return cls(
+            *(np.array(column, dtype=np.float64) for column in columns[:6]),
+            np.array(columns[6], dtype='datetime64[s]'),
+            np.array(columns[7], dtype='datetime64[s]')
+        )
+
+    @classmethod
+    def empty(cls) -> 'Candles':
+        """
+        Function for creating empty candles.
+
+        Returns:
+            object of the class Candles.
+        """
+        return cls(
+            *(np.empty(0, dtype=np.float64) for _ in range(6)),
+            np.empty(0, dtype='datetime64[s]'),
+            np.empty(0, dtype='datetime64[s]')
+        )
+
+    @classmethod
+    def concat(cls, candles_list: list['Candles']) -> 'Candles':
+        """
+        Function for concatenating several candles into one.
+
+        Args:
+            candles_list: list of candles.
+
+        Returns:
+            object of the class Candles.
+        """
+        if not candles_list:
+            return cls.empty()
+        return cls(
+            np.concatenate([candles.open for candles in candles_list]),
+            np.concatenate([candles.close for candles in candles_list]),
+            np.concatenate([candles.high for candles in candles_list]),
+            np.concatenate([candles.low for candles in candles_list]),
+            np.concatenate([candles.value for candles in candles_list]),
+            np.concatenate([candles.volume for candles in candles_list]),
+            np.concatenate([candles.begin for candles in candles_list]),
+            np.concatenate([candles.end for candles in candles_list])
+        )
+
+    @staticmethod
+    def to_str(value: np.datetime64) -> str:
+        """
+        Function for converting datetime of the candle to string datetime: 'YYYY-MM-DD HH:MM:SS'.
+
+        Args:
+            value: datetime of the candle.
+
+        Returns:
+            datetime converted to string datetime.
+        """
+        return str(value).replace('T', ' ')
+
+    @staticmethod
+    def to_datetime(value: np.datetime64) -> datetime:
+        """
+        Function for converting datetime of the candle to object of datetime class.
+
+        Args:
+            value: datetime of the candle.
+
+        Returns:
+            datetime converted to object of datetime class.
+        """
+        return value.astype(datetime)
+
+    def last_index(self, day: date | None = None) -> int:
+        """
+        Function for determining the index of the latest candle. If the day is specified, only candles ending on this
+            day are considered.
+
+        Args:
+            day: day for searching the latest candle.
+
+        Returns:
+            index of the latest candle.
+
+        Raises:
+            NoCandlesOnDay: if there are no candles or no candles ending on the specified day.
+        """
+        if day is None:
+            if not len(self):
+                raise ce.NoCandlesOnDay('There are no candles.')
+            return int(np.argmax(self.__end))
+        indices: np.ndarray = np.flatnonzero(self.days == np.datetime64(day, 'D'))
+        if not indices.size:
+            raise ce.NoCandlesOnDay(f'There are no candles ending on `{day}`.')
+        return int(indices[np.argmax(self.__end[indices])])
+
+    def get_last_value(self, day: date | None = None) -> dict[str, str | float]:
+        """
+        Function for determining the latest available information about the trading. If the day is specified, only
+            candles ending on this day are considered.
+
+        Args:
+            day: day for searching the latest candle.
+
+        Returns:
+            latest trading results.
+        """
+        index: int = self.last_index(day)
+        return {
+            'from': self.to_str(self.__begin[index]),
+            'to': self.to_str(self.__end[index]),
+            'open': float(self.__open[index]),
+            'close': float(self.__close[index]),
+            'high': float(self.__high[index]),
+            'low': float(self.__low[index])
+        }
+
+    def daily(self) -> 'DailyCandles':
+        """
+        Function for aggregating candles by trading days in one pass.
+
+        Returns:
+            object of the class DailyCandles.
+        """
+        if not len(self):
+            return DailyCandles.empty()
+        days: np.ndarray = self.days
+        starts: np.ndarray = np.flatnonzero(np.concatenate(([True], days[1:] != days[:-1])))
+        lasts: np.ndarray = np.concatenate((starts[1:], [days.size])) - 1
+        return DailyCandles(
+            days[starts],
+            self.__open[starts],
+            self.__close[lasts],
+            np.maximum.reduceat(self.__high, starts),
+            np.minimum.reduceat(self.__low, starts),
+            np.add.reduceat(self.__value, starts),
+            np.add.reduceat(self.__volume, starts),
+            self.__end[lasts]
+        )
+
+    @property
+    def open(self) -> np.ndarray:
+        """
+        Property for get open.
+
+        Returns:
+            open values of candles.
+        """
+        return self.__open
+
+    @property
+    def close(self) -> np.ndarray:
+        """
+        Property for get close.
+
+        Returns:
+            close values of candles.
+        """
+        return self.__close
+
+    @property
+    def high(self) -> np.ndarray:
+        """
+        Property for get high.
+
+        Returns:
+            high values of candles.
+        """
+        return self.__high
+
+    @property
+    def low(self) -> np.ndarray:
+        """
+        Property for get low.
+
+        Returns:
+            low values of candles.
+        """
+        return self.__low
+
+    @property
+    def value(self) -> np.ndarray:
+        """
+        Property for get value.
+
+        Returns:
+            trading values of candles.
+        """
+        return self.__value
+
+    @property
+    def volume(self) -> np.ndarray:
+        """
+        Property for get volume.
+
+        Returns:
+            trading volumes of candles.
+        """
+        return self.__volume
+
+    @property
+    def begin(self) -> np.ndarray:
+        """
+        Property for get begin.
+
+        Returns:
+            begin datetimes of candles.
+        """
+        return self.__begin
+
+    @property
+    def end(self) -> np.ndarray:
+        """
+        Property for get end.
+
+        Returns:
+            end datetimes of candles.
+        """
+        return self.__end
+
+    @property
+    def days(self) -> np.ndarray:
+        """
+        Property for get days.
+
+        Returns:
+            trading days of candles by their end.
+        """
+        return self.__end.astype('datetime64[D]')
+
+
+class DailyCandles:
+    """
+    Class for working with candles aggregated by trading days.
+    """
+    __slots__: tuple = (
+        '__days',
+        '__open',
+        '__close',
+        '__high',
+        '__low',
+        '__value',
+        '__volume',
+        '__last_end'
+    )
+
+    def __init__(self,
+                 days: np.ndarray,
+                 open_values: np.ndarray,
+                 close_values: np.ndarray,
+                 high_values: np.ndarray,
+                 low_values: np.ndarray,
+                 values: np.ndarray,
+                 volumes: np.ndarray,
+                 last_end: np.ndarray
+                 ) -> None:
+        self.__days: np.ndarray = days
+        self.__open: np.ndarray = open_values
+        self.__close: np.ndarray = close_values
+        self.__high: np.ndarray = high_values
+        self.__low: np.ndarray = low_values
+        self.__value: np.ndarray = values
+        self.__volume: np.ndarray = volumes
+        self.__last_end: np.ndarray = last_end
+
+    def __len__(self) -> int:
+        return self.__days.size
+
+    def __repr__(self) -> str:
+        return f'{__class__.__name__}(size={len(self)})'
+
+    @classmethod
+    def empty(cls) -> 'DailyCandles':
+        """
+        Function for creating empty daily candles.
+
+        Returns:
+            object of the class DailyCandles.
+        """
+        return cls(
+            np.empty(0, dtype='datetime64[D]'),
+            *(np.empty(0, dtype=np.float64) for _ in range(6)),
+            np.empty(0, dtype='datetime64[s]')
+        )
+
+    @classmethod
+    def concat(cls, daily_list: list['DailyCandles']) -> 'DailyCandles':
+        """
+        Function for concatenating several chronologically ordered daily candles into one. The trading day which is
+            split between neighbouring daily candles is merged into one.
+
+        Args:
+            daily_list: list of daily candles.
+
+        Returns:
+            object of the class DailyCandles.
+        """
+        daily_list: list[DailyCandles] = [daily for daily in daily_list if len(daily)]
+        if not daily_list:
+            return cls.empty()
+        days: np.ndarray = np.concatenate([daily.days for daily in daily_list])
+        starts: np.ndarray = np.flatnonzero(np.concatenate(([True], days[1:] != days[:-1])))
+        lasts: np.ndarray = np.concatenate((starts[1:], [days.size])) - 1
+        return cls(
+            days[starts],
+            np.concatenate([daily.open for daily in daily_list])[starts],
+            np.concatenate([daily.close for daily in daily_list])[lasts],
+            np.maximum.reduceat(np.concatenate([daily.high for daily in daily_list]), starts),
+            np.minimum.reduceat(np.concatenate([daily.low for daily in daily_list]), starts),
+            np.add.reduceat(np.concatenate([daily.value for daily in daily_list]), starts),
+            np.add.reduceat(np.concatenate([daily.volume for daily in daily_list]), starts),
+            np.concatenate([daily.last_end for daily in daily_list])[lasts]
+        )
+
+    @property
+    def dates(self) -> list[date]:
+        """
+        Property for get dates.
+
+        Returns:
+            trading days represented by objects of the date class.
+        """
+        return self.__days.tolist()
+
+    @property
+    def days(self) -> np.ndarray:
+        """
+        Property for get days.
+
+        Returns:
+            trading days.
+        """
+        return self.__days
+
+    @property
+    def open(self) -> np.ndarray:
+        """
+        Property for get open.
+
+        Returns:
+            open values of trading days.
+        """
+        return self.__open
+
+    @property
+    def close(self) -> np.ndarray:
+        """
+        Property for get close.
+
+        Returns:
+            close values of trading days.
+        """
+        return self.__close
+
+    @property
+    def high(self) -> np.ndarray:
+        """
+        Property for get high.
+
+        Returns:
+            high values of trading days.
+        """
+        return self.__high
+
+    @property
+    def low(self) -> np.ndarray:
+        """
+        Property for get low.
+
+        Returns:
+            low values of trading days.
+        """
+        return self.__low
+
+    @property
+    def value(self) -> np.ndarray:
+        """
+        Property for get value.
+
+        Returns:
+            trading values of trading days.
+        """
+        return self.__value
+
+    @property
+    def volume(self) -> np.ndarray:
+        """
+        Property for get volume.
+
+        Returns:
+            trading volumes of trading days.
+        """
+        return self.__volume
+
+    @property
+    def last_end(self) -> np.ndarray:
+        """
+        Property for get last_end.
+
+        Returns:
+            end datetimes of the last candles of trading days.
+        """
+        return self.__last_end
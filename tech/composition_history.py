@@ -0,0 +1,161 @@
+"""
+Module for working with history of the composition of the index.
+"""
+
+# standard library imports
+from datetime import date, timedelta
+from collections import Counter, defaultdict
+
+# third party imports
+import numpy as np
+
+# local imports
+from custom.custom_functions import Helper
+import custom.custom_exceptions as ce
+
+
+class CompositionHistory:
+    """
+    Class for working with history of the composition of the index. Membership intervals of tickers are swept once into
+        the sorted dates of changes with the composition after every change, so the composition as of the date and the
+        changes between dates are found by the binary search. Tickers whose interval ends on the last date of the data
+        are members of the actual composition, their intervals are open.
+    """
+    __slots__: tuple = (
+        '__dates',
+        '__compositions',
+        '__changes'
+    )
+
+    def __init__(self,
+                 dates: np.ndarray,
+                 compositions: list[frozenset[str]],
+                 changes: list[tuple[tuple[str, ...], tuple[str, ...]]]
+                 ) -> None:
+        self.__dates: np.ndarray = dates
+        self.__compositions: list[frozenset[str]] = compositions
+        self.__changes: list[tuple[tuple[str, ...], tuple[str, ...]]] = changes
+
+    def __repr__(self) -> str:
+        return f'{__class__.__name__}(changes={len(self.__dates)}, tickers={len(self.tickers)})'
+
+    def __len__(self) -> int:
+        return len(self.__dates)
+
+    @classmethod
+    def from_rows(cls, data: list[list[str]]) -> 'CompositionHistory':
+        """
+        Function for creating object of the CompositionHistory class from the composition data of ISS MOEX. Ticker
+            enters the composition on the `from` date and leaves it on the next day after the `till` date. Overlapping
+            and adjacent intervals of the ticker are merged.
+
+        Args:
+            data: composition data of ISS MOEX: ticker, `from` date, `till` date and other columns.
+
+        Returns:
+            object of the class CompositionHistory.
+        """
+        if not data:
+            return cls(np.array([], dtype='datetime64[D]'), [], [])
+        max_date_to: str = max(row[2] for row in data)
+        deltas: defaultdict[date, Counter] = defaultdict(Counter)
+        for ticker_name, from_dt, to_dt, *_ in data:
+            deltas[Helper.to_date(from_dt)][ticker_name] += 1
+            if to_dt != max_date_to:
+                deltas[Helper.to_date(to_dt) + timedelta(days=1)][ticker_name] -= 1
+
+        dates: list[date] = []
+        compositions: list[frozenset[str]] = []
+        changes: list[tuple[tuple[str, ...], tuple[str, ...]]] = []
+        intervals: Counter = Counter()
+        members: frozenset[str] = frozenset()
+        for day in sorted(deltas):
+            intervals.update(deltas[day])
+            current: frozenset[str] = frozenset(ticker_name for ticker_name, num in intervals.items() if num > 0)
+            if current == members:
+                continue
+            dates.append(day)
+            compositions.append(current)
+            changes.append((tuple(sorted(current - members)), tuple(sorted(members - current))))
+            members: frozenset[str] = current
+        return cls(np.array(dates, dtype='datetime64[D]'), compositions, changes)
+
+    @staticmethod
+    def __to_datetime64(day: str | date) -> np.datetime64:
+        """
+        Function for converting the date to the type of the dates of changes.
+
+        Args:
+            day: date represented in the string type or object of the date class.
+
+        Returns:
+            date converted to numpy.datetime64.
+        """
+        try:
+            return np.datetime64(Helper.to_date(day) if isinstance(day, str) else day, 'D')
+        except ValueError as exc:
+            raise ce.IsNotValidDate(f'The specified value `{day=}` is not a valid date.') from exc
+
+    def as_of(self, day: str | date) -> list[str]:
+        """
+        Function for getting the composition of the index as of the date.
+
+        Args:
+            day: date of the composition.
+
+        Returns:
+            sorted tickers of the composition. Empty list if the date is earlier than the history.
+        """
+        position: int = int(np.searchsorted(self.__dates, self.__to_datetime64(day), side='right')) - 1
+        return sorted(self.__compositions[position]) if position >= 0 else []
+
+    def changes(self,
+                period_from: str | date,
+                period_to: str | date,
+                return_date_str: bool = True
+                ) -> list[dict[str, str | date | list[str]]]:
+        """
+        Function for getting changes of the composition of the index after the start date up to the end date
+            inclusive. Applying them to the composition as of the start date gives the composition as of the end date.
+
+        Args:
+            period_from: start date of the period.
+            period_to: end date of the period.
+            return_date_str: flag for specifying the type of date to be returned.
+                True is a string, False is an object of the date class.
+
+        Returns:
+            changes by dates: date, added tickers and removed tickers.
+        """
+        first: int = int(np.searchsorted(self.__dates, self.__to_datetime64(period_from), side='right'))
+        last: int = int(np.searchsorted(self.__dates, self.__to_datetime64(period_to), side='right'))
+        result: list[dict[str, str | date | list[str]]] = []
+        for position in range(first, last):
+            day: date = self.__dates[position].astype(date)
+            added, removed = self.__changes[position]
+            result.append({
+                'date': Helper.from_date(day) if return_date_str else day,
+                'added': list(added),
+                'removed': list(removed)
+            })
+        return result
+
+    @property
+    def dates(self) -> list[str]:
+        """
+        Property for get dates.
+
+        Returns:
+            dates of changes of the composition.
+        """
+        return [Helper.from_date(day) for day in self.__dates.astype(date)]
+
+    @property
+    def tickers(self) -> list[str]:
+        """
+        Property for get tickers.
+
+        Returns:
+            sorted tickers which have ever been in the composition.
+        """
+        return sorted(set().union(*self.__compositions))
@@ -0,0 +1,90 @@
+"""
+Module for working with constituents of the index.
+"""
+
+# standard library imports
+from collections.abc import Iterable, Iterator
+
+# local imports
+from tech.shares_imoex import SharesIMOEX
+from custom.candle_store import CandleStore
+from custom.trading_calendar import TradingCalendar
+from custom.transport import Transport
+from custom.profiling import Profiler
+
+
+class Constituents:
+    """
+    Class for implementing registry of the constituents of the index. Contains tickers of the actual and historical
+        composition, object of the SharesIMOEX class is created on the first access to the ticker and cached.
+    """
+    __slots__: tuple = (
+        '__shares',
+        '__last_trade_day',
+        '__calendar',
+        '__candle_store',
+        '__transport',
+        '__profiler'
+    )
+
+    def __init__(self,
+                 tickers: Iterable[str],
+                 last_trade_day: str,
+                 calendar: TradingCalendar,
+                 candle_store: CandleStore,
+                 transport: Transport,
+                 profiler: Profiler | None = None
+                 ) -> None:
+        self.__shares: dict[str, SharesIMOEX | None] = dict.fromkeys(tickers)
+        self.__last_trade_day: str = last_trade_day
+        self.__calendar: TradingCalendar = calendar
+        self.__candle_store: CandleStore = candle_store
+        self.__transport: Transport = transport
+        self.__profiler: Profiler | None = profiler
+
+    def __repr__(self) -> str:
+        return f'{__class__.__name__}(tickers={len(self.__shares)}, loaded={len(self.loaded)})'
+
+    def __len__(self) -> int:
+        return len(self.__shares)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__shares)
+
+    def __contains__(self, ticker_name: str) -> bool:
+        return ticker_name in self.__shares
+
+    def __getitem__(self, ticker_name: str) -> SharesIMOEX:
+        if ticker_name not in self.__shares:
+            raise KeyError(f'Ticker `{ticker_name}` has never been in the composition of the index.')
+        if (shares := self.__shares[ticker_name]) is None:
+            shares: SharesIMOEX = SharesIMOEX(
+                ticker_name,
+                self.__last_trade_day,
+                self.__calendar,
+                self.__candle_store,
+                self.__transport,
+                self.__profiler
+            )
+            self.__shares[ticker_name] = shares
+        return shares
+
+    @property
+    def tickers(self) -> list[str]:
+        """
+        Property for get tickers.
+
+        Returns:
+            tickers of the actual and historical composition.
+        """
+        return list(self.__shares)
+
+    @property
+    def loaded(self) -> list[str]:
+        """
+        Property for get loaded.
+
+        Returns:
+            tickers whose objects of the SharesIMOEX class are already created.
+        """
+        return [ticker_name for ticker_name, shares in self.__shares.items() if shares is not None]
@@ -3,10 +3,13 @@ Module for working with dynamics.
 """
 
 # standard library imports
+from time import perf_counter
 from datetime import datetime
 
 # local imports
+from tech.candles import Candles
 from custom.custom_functions import Helper
+from custom.metrics import metrics
 
 
 class Dynamics:
@@ -21,13 +24,13 @@ class Dynamics:
     )
 
     def __init__(self,
-                 dynamics_info: list[list[str | float | int]],
+                 candles: Candles,
                  period: tuple[datetime.date, datetime.date],
                  return_date_str: bool
                  ) -> None:
-
-        first_value = Helper.get_last_value([dt for dt in dynamics_info if Helper.to_date(dt[7][:10]) == period[0]])
-        second_value = Helper.get_last_value([dt for dt in dynamics_info if Helper.to_date(dt[7][:10]) == period[1]])
+        started_at: float = perf_counter()
+        first_value = candles.get_last_value(period[0])
+        second_value = candles.get_last_value(period[1])
 
         if return_date_str:
             period_from: str = first_value['to'][:10]
@@ -46,6 +49,7 @@ class Dynamics:
         }
         self.__first_close_value: float = first_value['close']
         self.__second_close_value: float = second_value['close']
+        metrics.emit_compute('Dynamics', None, perf_counter() - started_at, len(candles))
 
     def __repr__(self) -> str:
         return f'{__class__.__name__}(value={self.value}, percent={self.percent})'
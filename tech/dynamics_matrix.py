@@ -0,0 +1,137 @@
+"""
+Module for working with dynamics of several instruments over several periods.
+"""
+
+# standard library imports
+from datetime import date
+
+# third party imports
+import numpy as np
+
+# local imports
+from tech.candles import DailyCandles
+from custom.custom_functions import Helper
+
+
+class DynamicsMatrix:
+    """
+    Class for working with dynamics of several instruments over several periods. Rows of the matrices are
+        instruments, columns are periods.
+    """
+    __slots__: tuple = (
+        '__tickers',
+        '__periods',
+        '__first_values',
+        '__second_values',
+        '__return_date_str'
+    )
+
+    def __init__(self,
+                 tickers: list[str],
+                 periods: dict[str, tuple[date, date]],
+                 first_values: np.ndarray,
+                 second_values: np.ndarray,
+                 return_date_str: bool
+                 ) -> None:
+        self.__tickers: list[str] = tickers
+        self.__periods: dict[str, tuple[date, date]] = periods
+        self.__first_values: np.ndarray = first_values
+        self.__second_values: np.ndarray = second_values
+        self.__return_date_str: bool = return_date_str
+
+    def __repr__(self) -> str:
+        return f'{__class__.__name__}(tickers={len(self.__tickers)}, periods={list(self.__periods)})'
+
+    @classmethod
+    def from_daily(cls,
+                   daily: dict[str, DailyCandles],
+                   periods: dict[str, tuple[date, date]],
+                   return_date_str: bool
+                   ) -> 'DynamicsMatrix':
+        """
+        Function for creating object of the DynamicsMatrix class from daily candles of the instruments. The close
+            value of the bound is the last close value on or before it. If the instrument was not traded before the
+            bound, the value is NaN.
+
+        Args:
+            daily: daily candles by tickers.
+            periods: start and end trading days by names of periods.
+            return_date_str: flag for specifying the type of date to be returned.
+                True is a string, False is an object of the date class.
+
+        Returns:
+            object of the class DynamicsMatrix.
+        """
+        bounds: np.ndarray = np.array(list(periods.values()), dtype='datetime64[D]').reshape(-1, 2)
+        first_values: np.ndarray = np.full((len(daily), len(periods)), np.nan)
+        second_values: np.ndarray = np.full((len(daily), len(periods)), np.nan)
+        for row, daily_candles in enumerate(daily.values()):
+            if not len(daily_candles):
+                continue
+            positions: np.ndarray = np.searchsorted(daily_candles.days, bounds, side='right') - 1
+            closes: np.ndarray = np.where(positions >= 0, daily_candles.close[np.maximum(positions, 0)], np.nan)
+            first_values[row], second_values[row] = closes[:, 0], closes[:, 1]
+        return cls(list(daily), periods, first_values, second_values, return_date_str)
+
+    @property
+    def tickers(self) -> list[str]:
+        """
+        Property for get tickers.
+
+        Returns:
+            tickers of rows.
+        """
+        return self.__tickers
+
+    @property
+    def periods(self) -> dict[str, tuple[str | date, str | date]]:
+        """
+        Property for get periods.
+
+        Returns:
+            start and end trading days by names of periods of columns.
+        """
+        if not self.__return_date_str:
+            return dict(self.__periods)
+        return {
+            name: (Helper.from_date(period_from), Helper.from_date(period_to))
+            for name, (period_from, period_to) in self.__periods.items()
+        }
+
+    @property
+    def value(self) -> np.ndarray:
+        """
+        Property for get value.
+
+        Returns:
+            values of dynamics by tickers and periods.
+        """
+        return np.round(self.__second_values - self.__first_values, 2)
+
+    @property
+    def percent(self) -> np.ndarray:
+        """
+        Property for get percent.
+
+        Returns:
+            values of dynamics as a percentage by tickers and periods.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.round((self.__second_values - self.__first_values) / self.__first_values * 100, 2)
+
+    @property
+    def full_info(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Property for get full_info.
+
+        Returns:
+            values of dynamics by tickers and names of periods.
+        """
+        values: list[list[float]] = self.value.tolist()
+        percents: list[list[float]] = self.percent.tolist()
+        return {
+            ticker_name: {
+                name: {'value': values[row][column], 'percent': percents[row][column]}
+                for column, name in enumerate(self.__periods)
+            } for row, ticker_name in enumerate(self.__tickers)
+        }
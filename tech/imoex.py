@@ -4,50 +4,391 @@ Module for working with IMOEX.
 
 # standard library imports
 import asyncio
+from datetime import date, datetime
+from collections.abc import Coroutine
 
 # local imports
-from values.constans import MOEX_REQUESTS
+from values.constans import DYNAMICS, MOEX_REQUESTS, RESOLUTION, SUBSCRIBER
 from tech.base_index import BaseIndex
 from tech.shares_imoex import SharesIMOEX
+from tech.constituents import Constituents
+from tech.composition_history import CompositionHistory
+from tech.interval import Interval
+from tech.candles import DailyCandles
+from tech.dynamics_matrix import DynamicsMatrix
+from tech.subscriber import CandleSubscriber
 from custom.custom_functions import Helper
+from custom.candle_store import CandleStore
+from custom.trading_calendar import TradingCalendar
+from custom.transport import Transport
+from custom.profiling import Profiler
+import custom.custom_exceptions as ce
 
 
 class IMOEX(BaseIndex):
     """
-    Class for working with IMOEX.
+    Class for working with IMOEX. Constituents are available by attributes and by keys: `imoex.SBER`,
+        `imoex['SBER']`. Tickers of the historical composition are available too.
     """
+    __slots__: tuple = (
+        '__composition_data',
+        '__composition_index',
+        '__composition_history',
+        '__constituents'
+    )
 
     def __init__(self,
                  last_trade_day: str,
-                 weekends: list[str],
-                 workdays: list[str]
+                 calendar: TradingCalendar,
+                 candle_store: CandleStore,
+                 transport: Transport,
+                 profiler: Profiler | None = None
                  ) -> None:
         super().__init__(
             tech_name='IMOEX',
             last_trade_day=last_trade_day,
-            weekends=weekends,
-            workdays=workdays
+            calendar=calendar,
+            candle_store=candle_store,
+            transport=transport,
+            profiler=profiler
         )
-        additional_params: dict[str, list[str]] = {
-            'COMPOSITION_INFO': [self.tech_type, self.tech_name],
-        }
-        urls: dict[str, str] = {
-            url_name: url for url_name, url in MOEX_REQUESTS.items() if url_name in additional_params.keys()
+        self.__composition_data: list[list[str]] | None = None
+        self.__composition_index: dict[str, dict[str, dict[str, str]] | list[str]] | None = None
+        self.__composition_history: CompositionHistory | None = None
+        self.__constituents: Constituents | None = None
+
+    def __getattr__(self, name: str) -> SharesIMOEX:
+        if name.startswith('_'):
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+        try:
+            return self.constituents[name]
+        except KeyError:
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}') from None
+
+    def __getitem__(self, ticker_name: str) -> SharesIMOEX:
+        return self.constituents[ticker_name]
+
+    def __dir__(self) -> list[str]:
+        return [*super().__dir__(), *(self.__constituents or ())]
+
+    async def load_async(self, last_detail_info: bool = True) -> None:
+        """
+        Async function for concurrent loading of all not yet loaded information of the index including composition.
+
+        Args:
+            last_detail_info: flag for loading the last candle of the index.
+
+        Returns:
+            None
+        """
+        loaders: list[Coroutine] = [super().load_async(last_detail_info)]
+        if self.__composition_index is None:
+            loaders.append(self.load_composition_async())
+        await asyncio.gather(*loaders)
+
+    async def load_composition_async(self) -> None:
+        """
+        Async function for loading the composition of the index with all pages of the history. Pages are followed by
+            the cursor block of the response. Creates the registry of the constituents.
+
+        Returns:
+            None
+        """
+        tech_composition_data: list[list[str]] = await Helper.generate_paged_requests(
+            transport=self.transport,
+            url=MOEX_REQUESTS['COMPOSITION_INFO_PAGE'],
+            params=[self.tech_type, self.tech_name],
+            block='tickers',
+            page_size=None
+        )
+        self.restore_composition(tech_composition_data)
+
+    def restore_composition(self, tech_composition_data: list[list[str]]) -> None:
+        """
+        Function for restoring the composition of the index from the composition data. Creates the registry of the
+            constituents, objects of the SharesIMOEX class are created on the first access.
+
+        Args:
+            tech_composition_data: composition data of ISS MOEX.
+
+        Returns:
+            None
+        """
+        self.__composition_data: list[list[str]] = tech_composition_data
+        self.__composition_history: CompositionHistory | None = None
+        self.__composition_index: dict[str, dict[str, dict[str, str]] | list[str]] = Helper.get_composition_moex(
+            tech_composition_data
+        )
+        self.__constituents: Constituents = Constituents(
+            self.__composition_index['full_result'],
+            self.last_trade_day,
+            self.calendar,
+            self.candle_store,
+            self.transport,
+            self.profiler
+        )
+
+    def __get_composition_index(self) -> dict[str, dict[str, dict[str, str]] | list[str]]:
+        """
+        Function for getting the composition of the index. Loaded on the first access.
+
+        Returns:
+            composition of the index.
+        """
+        if self.__composition_index is None:
+            self.transport.run(self.load_composition_async())
+        return self.__composition_index
+
+    async def constituents_interval_async(self,
+                                          period_from: str,
+                                          period_to: str | None = None,
+                                          return_datetime_str: bool = True,
+                                          soft_search: None | str = None,
+                                          fetch_mode: str = 'range',
+                                          tickers: list[str] | None = None,
+                                          resolution: str = RESOLUTION.DEFAULT
+                                          ) -> dict[str, Interval]:
+        """
+        Async function for creating objects of the Interval class for the constituents of the index in one pass.
+            Requests of all tickers are scheduled together and share one pool of the transport.
+
+        Args:
+            period_from: start date of the period for calculating the interval.
+            period_to: end date of the period for calculating the interval.
+            return_datetime_str: flag for specifying the type of date to be returned.
+                True is a string, False is an object of the date class.
+            soft_search: If not None, the search will be applied until the next trading day.
+                `forward` - the closest forward, `back` - the closest from behind.
+            fetch_mode: `range` - one paginated request for the whole period, `day` - one request per trading day,
+                `stream` - pages are requested one by one and statistics are calculated online.
+            tickers: tickers of the constituents. If None, the actual composition of the index is used.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Returns:
+            objects of the Interval class by tickers.
+
+        Raises:
+            RequestsFailed: if some of the tickers failed. Intervals of the successful tickers are kept in the
+                exception by tickers.
+        """
+        if self.__composition_index is None:
+            await self.load_composition_async()
+        tickers: list[str] = tickers or self.actual_composition_index_tickers
+        intervals: list[Interval | BaseException] = await asyncio.gather(
+            *(
+                self[ticker_name].interval_async(
+                    period_from, period_to, return_datetime_str, soft_search, fetch_mode, resolution
+                ) for ticker_name in tickers
+            ),
+            return_exceptions=True
+        )
+        for interval in intervals:
+            if isinstance(interval, BaseException) and not isinstance(interval, ce.RequestsFailed):
+                raise interval
+        result: dict[str, Interval] = {
+            ticker_name: interval for ticker_name, interval in zip(tickers, intervals)
+            if not isinstance(interval, BaseException)
         }
-        self.__tech_full_info: dict[str, dict] = asyncio.run(
-            Helper.generate_requests(
-                urls=urls,
-                additional_params=additional_params
+        if failures := {
+            ticker_name: interval for ticker_name, interval in zip(tickers, intervals)
+            if isinstance(interval, BaseException)
+        }:
+            raise ce.RequestsFailed(
+                f'{len(failures)} of {len(tickers)} tickers failed: {", ".join(failures)}.',
+                responses=result,
+                failures=failures
+            )
+        return result
+
+    def constituents_interval(self,
+                              period_from: str,
+                              period_to: str | None = None,
+                              return_datetime_str: bool = True,
+                              soft_search: None | str = None,
+                              fetch_mode: str = 'range',
+                              tickers: list[str] | None = None,
+                              resolution: str = RESOLUTION.DEFAULT
+                              ) -> dict[str, Interval]:
+        """
+        Function for creating objects of the Interval class for the constituents of the index in one pass.
+            Requests of all tickers are scheduled together and share one pool of the transport.
+
+        Args:
+            period_from: start date of the period for calculating the interval.
+            period_to: end date of the period for calculating the interval.
+            return_datetime_str: flag for specifying the type of date to be returned.
+                True is a string, False is an object of the date class.
+            soft_search: If not None, the search will be applied until the next trading day.
+                `forward` - the closest forward, `back` - the closest from behind.
+            fetch_mode: `range` - one paginated request for the whole period, `day` - one request per trading day,
+                `stream` - pages are requested one by one and statistics are calculated online.
+            tickers: tickers of the constituents. If None, the actual composition of the index is used.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Returns:
+            objects of the Interval class by tickers.
+        """
+        return self.transport.run(
+            self.constituents_interval_async(
+                period_from, period_to, return_datetime_str, soft_search, fetch_mode, tickers, resolution
             )
         )
-        self.__tech_composition_data: list[list[str]] = (
-            self.__tech_full_info
-        )['COMPOSITION_INFO']['tickers']['data']
-        self.__composition_index: dict[str, dict[str, dict[str, str]] | list[str]] = Helper.get_composition_moex(
-            self.__tech_composition_data
+
+    async def dynamics_matrix_async(self,
+                                    tickers: list[str] | None = None,
+                                    periods: tuple[str | tuple[str, str], ...] = DYNAMICS.PERIODS,
+                                    period_to: str | None = None,
+                                    return_date_str: bool = True
+                                    ) -> DynamicsMatrix:
+        """
+        Async function for creating object of the DynamicsMatrix class for the constituents of the index. Bounds of
+            the periods are snapped to trading days, daily candles of every ticker are requested once for the union
+            of the periods.
+
+        Args:
+            tickers: tickers of the constituents. If None, the actual composition of the index is used.
+            periods: relative periods (`1D`, `1W`, `2W`, `1M`, `3M`, `6M`, `1Y`, `YTD`) or tuples with string values
+                of the start and end dates.
+            period_to: end date of the relative periods. If None, the last trading day is used.
+            return_date_str: flag for specifying the type of date to be returned.
+                True is a string, False is an object of the date class.
+
+        Returns:
+            object of the class DynamicsMatrix.
+
+        Raises:
+            RequestsFailed: if some of the tickers failed. Daily candles of the successful tickers are kept in the
+                exception by tickers.
+        """
+        if self.__composition_index is None:
+            await self.load_composition_async()
+        tickers: list[str] = tickers or self.actual_composition_index_tickers
+        try:
+            last_day: date = Helper.to_date(period_to or self.last_trade_day)
+        except ValueError as exc:
+            raise ce.IsNotValidDate(f'The specified value `{period_to=}` is not a valid date.') from exc
+        last_day: date = self.calendar.prev_trading_day(
+            min(last_day, Helper.to_date(self.last_trade_day)), inclusive=True
+        )
+        bounds: dict[str, tuple[date, date]] = {
+            period if isinstance(period, str) else ':'.join(period): Helper.get_period_bounds(
+                self.calendar, period, last_day
+            ) for period in periods
+        }
+        period_from: date = min(period_from for period_from, _ in bounds.values())
+        period_to: date = max(period_to for _, period_to in bounds.values())
+        daily: list[DailyCandles | BaseException] = await asyncio.gather(
+            *(self[ticker_name].daily_async(period_from, period_to) for ticker_name in tickers),
+            return_exceptions=True
         )
-        for ticker_name in self.actual_composition_index_tickers:
-            self.__setattr__(ticker_name, SharesIMOEX(ticker_name, last_trade_day, weekends, workdays))
+        for daily_candles in daily:
+            if isinstance(daily_candles, BaseException) and not isinstance(daily_candles, ce.RequestsFailed):
+                raise daily_candles
+        if failures := {
+            ticker_name: daily_candles for ticker_name, daily_candles in zip(tickers, daily)
+            if isinstance(daily_candles, BaseException)
+        }:
+            raise ce.RequestsFailed(
+                f'{len(failures)} of {len(tickers)} tickers failed: {", ".join(failures)}.',
+                responses={
+                    ticker_name: daily_candles for ticker_name, daily_candles in zip(tickers, daily)
+                    if not isinstance(daily_candles, BaseException)
+                },
+                failures=failures
+            )
+        return DynamicsMatrix.from_daily(dict(zip(tickers, daily)), bounds, return_date_str)
+
+    def dynamics_matrix(self,
+                        tickers: list[str] | None = None,
+                        periods: tuple[str | tuple[str, str], ...] = DYNAMICS.PERIODS,
+                        period_to: str | None = None,
+                        return_date_str: bool = True
+                        ) -> DynamicsMatrix:
+        """
+        Function for creating object of the DynamicsMatrix class for the constituents of the index. Bounds of the
+            periods are snapped to trading days, daily candles of every ticker are requested once for the union of
+            the periods.
+
+        Args:
+            tickers: tickers of the constituents. If None, the actual composition of the index is used.
+            periods: relative periods (`1D`, `1W`, `2W`, `1M`, `3M`, `6M`, `1Y`, `YTD`) or tuples with string values
+                of the start and end dates.
+            period_to: end date of the relative periods. If None, the last trading day is used.
+            return_date_str: flag for specifying the type of date to be returned.
+                True is a string, False is an object of the date class.
+
+        Returns:
+            object of the class DynamicsMatrix.
+        """
+        return self.transport.run(self.dynamics_matrix_async(tickers, periods, period_to, return_date_str))
+
+    def subscriber(self,
+                   tickers: list[str] | None = None,
+                   poll_interval: float = SUBSCRIBER.POLL_INTERVAL,
+                   queue: asyncio.Queue | None = None,
+                   since: datetime | None = None,
+                   closed_only: bool = True,
+                   resolution: str = RESOLUTION.DEFAULT
+                   ) -> CandleSubscriber:
+        """
+        Function for creating subscription to live candles of the constituents of the index.
+
+        Args:
+            tickers: tickers of the constituents. If None, the actual composition of the index is used.
+            poll_interval: interval between polls in seconds.
+            queue: queue which receives tuples of the ticker and its new candles.
+            since: moment from which the candles are published. If None, the start of the current day is used.
+            closed_only: flag for publishing only candles which have already ended.
+            resolution: resolution of candles. One of `1m`, `10m`, `1h`, `1d`, `1w`, `1M`.
+
+        Returns:
+            object of the class CandleSubscriber.
+        """
+        tickers: list[str] = tickers or self.actual_composition_index_tickers
+        return CandleSubscriber(
+            [self[ticker_name] for ticker_name in tickers],
+            self.transport,
+            self.calendar,
+            poll_interval=poll_interval,
+            queue=queue,
+            since=since,
+            closed_only=closed_only,
+            resolution=resolution
+        )
+
+    @property
+    def _composition_data(self) -> list[list[str]]:
+        """
+        Property for get composition data. Loaded on the first access.
+
+        Returns:
+            composition data of ISS MOEX.
+        """
+        self.__get_composition_index()
+        return self.__composition_data
+
+    @property
+    def constituents(self) -> Constituents:
+        """
+        Property for get constituents. Loaded on the first access.
+
+        Returns:
+            registry of the constituents of the actual and historical composition.
+        """
+        self.__get_composition_index()
+        return self.__constituents
+
+    @property
+    def composition_history(self) -> CompositionHistory:
+        """
+        Property for get composition_history. Created on the first access.
+
+        Returns:
+            history of the composition of the index.
+        """
+        if self.__composition_history is None:
+            self.__composition_history: CompositionHistory = CompositionHistory.from_rows(self._composition_data)
+        return self.__composition_history
 
     @property
     def initialcapitalization(self) -> float:
@@ -67,7 +408,7 @@ class IMOEX(BaseIndex):
         Returns:
             full_composition_index of index.
         """
-        return self.__composition_index['full_result']
+        return self.__get_composition_index()['full_result']
 
     @property
     def actual_composition_index(self) -> dict:
@@ -77,7 +418,7 @@ class IMOEX(BaseIndex):
         Returns:
             actual_composition_index of index.
         """
-        return self.__composition_index['actual_result']
+        return self.__get_composition_index()['actual_result']
 
     @property
     def actual_composition_index_tickers(self) -> list:
@@ -87,4 +428,4 @@ class IMOEX(BaseIndex):
         Returns:
             actual_composition_index_tickers of index.
         """
-        return self.__composition_index['ticker_names']
+        return self.__get_composition_index()['ticker_names']
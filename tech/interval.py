@@ -3,15 +3,200 @@ Module for working with interval.
 """
 
 # standard library imports
+from time import perf_counter
 from datetime import datetime
 from pathlib import Path
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
 
 # third party imports
-import matplotlib.pyplot as plt
+import numpy as np
 
 # local imports
+from tech.candles import Candles, DailyCandles
+from tech.plots import Plots
 from custom.custom_functions import Helper
-from values.constans import PLOTS
+from custom.metrics import metrics
+from custom.profiling import Profiler, default_profiler, profiled
+from values.constans import PLOTS, RESOLUTION
+import custom.custom_exceptions as ce
+
+if TYPE_CHECKING:
+    from tech.base_instrument import BaseInstrument
+
+
+class IntervalStats:
+    """
+    Class for calculating statistics of the interval online. Candles are passed by chronologically ordered chunks,
+        only the extreme candles, the sum and count of close values and the daily candles are kept. The last candle
+        may still be forming, so it is kept apart and replaced by the candle with the same begin.
+    """
+    __slots__: tuple = (
+        '__max_close',
+        '__max_begin',
+        '__max_end',
+        '__min_close',
+        '__min_begin',
+        '__min_end',
+        '__close_sum',
+        '__count',
+        '__last',
+        '__daily_chunks',
+        '__daily'
+    )
+
+    def __init__(self) -> None:
+        self.__max_close: float | None = None
+        self.__max_begin: np.datetime64 | None = None
+        self.__max_end: np.datetime64 | None = None
+        self.__min_close: float | None = None
+        self.__min_begin: np.datetime64 | None = None
+        self.__min_end: np.datetime64 | None = None
+        self.__close_sum: float = 0.0
+        self.__count: int = 0
+        self.__last: Candles = Candles.empty()
+        self.__daily_chunks: list[DailyCandles] = []
+        self.__daily: DailyCandles | None = DailyCandles.empty()
+
+    @classmethod
+    def from_candles(cls, candles: Candles) -> 'IntervalStats':
+        """
+        Function for calculating statistics of the candles.
+
+        Args:
+            candles: candles of the interval.
+
+        Returns:
+            object of the class IntervalStats.
+        """
+        stats: IntervalStats = cls()
+        stats.update(candles)
+        return stats
+
+    def __merge(self, candles: Candles) -> None:
+        """
+        Function for adding candles which will not be replaced to the statistics.
+
+        Args:
+            candles: chronologically ordered candles.
+
+        Returns:
+            None
+        """
+        if not len(candles):
+            return
+        max_index: int = int(np.argmax(candles.close))
+        min_index: int = int(np.argmin(candles.close))
+        if self.__max_close is None or candles.close[max_index] > self.__max_close:
+            self.__max_close: float = float(candles.close[max_index])
+            self.__max_begin: np.datetime64 = candles.begin[max_index]
+            self.__max_end: np.datetime64 = candles.end[max_index]
+        if self.__min_close is None or candles.close[min_index] < self.__min_close:
+            self.__min_close: float = float(candles.close[min_index])
+            self.__min_begin: np.datetime64 = candles.begin[min_index]
+            self.__min_end: np.datetime64 = candles.end[min_index]
+        self.__close_sum += float(candles.close.sum())
+        self.__count += len(candles)
+        self.__daily_chunks.append(candles.daily())
+        self.__daily: DailyCandles | None = None
+
+    def update(self, candles: Candles) -> None:
+        """
+        Function for updating statistics by the next chunk of candles. The chunk must not begin earlier than the last
+            candle. If the first candle of the chunk has the same begin as the last candle, it replaces the last one.
+
+        Args:
+            candles: next chunk of candles.
+
+        Returns:
+            None
+        """
+        if not len(candles):
+            return
+        if len(self.__last) and self.__last.begin[0] < candles.begin[0]:
+            self.__merge(self.__last)
+        self.__merge(candles[:-1])
+        self.__last: Candles = candles[-1:]
+
+    def __get_last_value(self) -> tuple[float, np.datetime64, np.datetime64] | None:
+        """
+        Function for getting the close value of the last candle with its begin and end.
+
+        Returns:
+            close value, begin and end. None if there are no candles.
+        """
+        if not len(self.__last):
+            return None
+        return float(self.__last.close[0]), self.__last.begin[0], self.__last.end[0]
+
+    @property
+    def max_value(self) -> tuple[float, np.datetime64, np.datetime64]:
+        """
+        Property for get max_value.
+
+        Returns:
+            maximum close value with the begin and the end of its candle.
+        """
+        last_value: tuple[float, np.datetime64, np.datetime64] | None = self.__get_last_value()
+        if last_value is not None and (self.__max_close is None or last_value[0] > self.__max_close):
+            return last_value
+        return self.__max_close, self.__max_begin, self.__max_end
+
+    @property
+    def min_value(self) -> tuple[float, np.datetime64, np.datetime64]:
+        """
+        Property for get min_value.
+
+        Returns:
+            minimum close value with the begin and the end of its candle.
+        """
+        last_value: tuple[float, np.datetime64, np.datetime64] | None = self.__get_last_value()
+        if last_value is not None and (self.__min_close is None or last_value[0] < self.__min_close):
+            return last_value
+        return self.__min_close, self.__min_begin, self.__min_end
+
+    @property
+    def avg_value(self) -> float:
+        """
+        Property for get avg_value.
+
+        Returns:
+            average close value.
+        """
+        return (self.__close_sum + float(self.__last.close.sum())) / self.count
+
+    @property
+    def count(self) -> int:
+        """
+        Property for get count.
+
+        Returns:
+            number of candles.
+        """
+        return self.__count + len(self.__last)
+
+    @property
+    def last_begin(self) -> np.datetime64 | None:
+        """
+        Property for get last_begin.
+
+        Returns:
+            begin of the last candle. None if there are no candles.
+        """
+        return self.__last.begin[0] if len(self.__last) else None
+
+    @property
+    def daily(self) -> DailyCandles:
+        """
+        Property for get daily.
+
+        Returns:
+            candles aggregated by trading days.
+        """
+        if self.__daily is None:
+            self.__daily: DailyCandles = DailyCandles.concat(self.__daily_chunks)
+            self.__daily_chunks: list[DailyCandles] = [self.__daily]
+        return DailyCandles.concat([self.__daily, self.__last.daily()])
 
 
 class Interval:
@@ -20,33 +205,82 @@ class Interval:
     """
     def __init__(self,
                  tech_name: str,
-                 interval_info: list[list],
+                 candles: Candles | None,
                  period: dict[str, datetime.date],
-                 return_datetime_str: bool
+                 return_datetime_str: bool,
+                 stats: IntervalStats | None = None,
+                 source: 'BaseInstrument | None' = None,
+                 resolution: str = RESOLUTION.DEFAULT
                  ) -> None:
+        started_at: float = perf_counter()
         self.__tech_name: str = tech_name
-        self.__interval_info: list[list] = interval_info
-        self.__max_item: list = max(interval_info, key=lambda x: x[1])
-        self.__min_item: list = min(interval_info, key=lambda x: x[1])
+        self.__candle_chunks: list[Candles] | None = [candles] if candles is not None else None
+        self.__stats: IntervalStats = stats or IntervalStats.from_candles(candles)
+        if not self.__stats.count:
+            raise ce.SomethingWentWrong(f'There are no candles of `{tech_name}` for the specified period.')
+        self.__period: dict[str, datetime.date] = period
+        self.__return_datetime_str: bool = return_datetime_str
+        self.__source: BaseInstrument | None = source
+        self.__resolution: str = resolution
 
         if return_datetime_str:
             self.__tech_data: dict[str, str] = {
-                'max_from': self.__max_item[6],
-                'max_to': self.__max_item[7],
-                'min_from': self.__min_item[6],
-                'min_to': self.__min_item[7],
                 'period_from': Helper.from_date(period['period_from']),
                 'period_to': Helper.from_date(period['period_to'])
             }
         else:
             self.__tech_data: dict[str, datetime] = {
-                'max_from': Helper.datetime_format(self.__max_item[6]),
-                'max_to': Helper.datetime_format(self.__max_item[7]),
-                'min_from': Helper.datetime_format(self.__min_item[6]),
-                'min_to': Helper.datetime_format(self.__min_item[7]),
                 'period_from': period['period_from'],
                 'period_to': period['period_to']
             }
+        if stats is None:
+            metrics.emit_compute('Interval', tech_name, perf_counter() - started_at, self.__stats.count)
+
+    def __format_datetime(self, value: np.datetime64) -> str | datetime:
+        """
+        Function for converting datetime of the candle to the returned type.
+
+        Args:
+            value: datetime of the candle.
+
+        Returns:
+            string datetime or object of datetime class.
+        """
+        return Candles.to_str(value) if self.__return_datetime_str else Candles.to_datetime(value)
+
+    @classmethod
+    async def from_stream(cls,
+                          tech_name: str,
+                          stream: AsyncIterator[Candles],
+                          period: dict[str, datetime.date],
+                          return_datetime_str: bool,
+                          source: 'BaseInstrument | None' = None,
+                          resolution: str = RESOLUTION.DEFAULT
+                          ) -> 'Interval':
+        """
+        Async function for creating object of the Interval class from the stream of candle chunks. Statistics are
+            updated as chunks arrive, chunks are not kept.
+
+        Args:
+            tech_name: technical name of the instrument.
+            stream: chronologically ordered chunks of candles.
+            period: start and end dates of the period.
+            return_datetime_str: flag for specifying the type of date to be returned.
+                True is a string, False is an object of the date class.
+            source: instrument from which new candles are requested by `refresh`.
+            resolution: resolution of the candles.
+
+        Returns:
+            object of the class Interval.
+        """
+        stats: IntervalStats = IntervalStats()
+        duration: float = 0.0
+        async for candles in stream:
+            started_at: float = perf_counter()
+            stats.update(candles)
+            duration += perf_counter() - started_at
+        metrics.emit_compute('Interval.from_stream', tech_name, duration, stats.count)
+        return cls(tech_name, None, period, return_datetime_str, stats, source, resolution)
 
     def __repr__(self):
         return (
@@ -56,11 +290,108 @@ class Interval:
             f'avg={self.avg_value["value"]})'
         )
 
+    def extend(self, candles: Candles) -> int:
+        """
+        Function for adding new candles to the interval. Candles are matched by begin: the candle with the same begin
+            as the last known candle replaces it, because the last candle may still be forming, candles beginning
+            later are added. Statistics are updated in O(new candles).
+
+        Args:
+            candles: new candles of the instrument.
+
+        Returns:
+            number of the added and replaced candles.
+        """
+        new_candles: Candles = candles[candles.begin >= self.__stats.last_begin]
+        if not len(new_candles):
+            return 0
+        if self.__candle_chunks is not None:
+            if new_candles.begin[0] == self.__stats.last_begin:
+                self.__candle_chunks[-1] = self.__candle_chunks[-1][:-1]
+            self.__candle_chunks.append(new_candles)
+        self.__stats.update(new_candles)
+        return len(new_candles)
+
+    async def refresh_async(self) -> int:
+        """
+        Async function for requesting candles from the begin of the last known candle up to the end of the period
+            and adding them to the interval. The last known candle is requested again, because it may still be forming.
+
+        Returns:
+            number of the added and replaced candles.
+        """
+        if self.__source is None:
+            raise ce.SomethingWentWrong('The interval is not bound to the instrument.')
+        return self.extend(
+            await self.__source.candles_since_async(
+                self.__stats.last_begin, self.__period['period_to'], self.__resolution
+            )
+        )
+
+    def refresh(self) -> int:
+        """
+        Function for requesting candles from the begin of the last known candle up to the end of the period and
+            adding them to the interval. The last known candle is requested again, because it may still be forming.
+
+        Returns:
+            number of the added and replaced candles.
+        """
+        if self.__source is None:
+            raise ce.SomethingWentWrong('The interval is not bound to the instrument.')
+        return self.__source.transport.run(self.refresh_async())
+
+    def daily(self) -> DailyCandles:
+        """
+        Function for aggregating candles of the interval by trading days.
+
+        Returns:
+            object of the class DailyCandles.
+        """
+        return self.__stats.daily
+
+    def get_plot_params(self,
+                        w_size: int = None,
+                        h_size: int = None,
+                        save_format: str = 'pdf',
+                        dpi: int = PLOTS.DPI
+                        ) -> dict:
+        """
+        Function for collecting parameters of the plot. Parameters contain only daily close values, so they are cheap
+            to pass to other processes.
+
+        Args:
+            w_size: width of the created plot.
+            h_size: height of the created plot.
+            save_format: extension in which the file will be saved. For example: `.png`, `.svg` etc.
+            dpi: resolution of the created plot.
+
+        Returns:
+            parameters of the plot.
+        """
+        daily: DailyCandles = self.daily()
+        file_name: str = (
+            f'{self.__tech_name}_'
+            f'{self.__tech_data["period_from"]}_'
+            f'{self.__tech_data["period_to"]}.'
+            f'{save_format}'
+        )
+        return {
+            'tech_name': self.__tech_name,
+            'dates': daily.days,
+            'values': daily.close,
+            'w_size': w_size or PLOTS.W_SIZE,
+            'h_size': h_size or PLOTS.H_SIZE,
+            'dpi': dpi,
+            'path': Path(PLOTS.DIRECTORY_NAME, file_name)
+        }
+
+    @profiled('get_plot')
     def get_plot(self,
                  w_size: int = None,
                  h_size: int = None,
-                 save_format: str = 'pdf'
-                 ) -> None:
+                 save_format: str = 'pdf',
+                 dpi: int = PLOTS.DPI
+                 ) -> Path:
         """
         Function for generating a plot.
 
@@ -68,44 +399,23 @@ class Interval:
             w_size: width of the created plot.
             h_size: height of the created plot.
             save_format: extension in which the file will be saved. For example: `.png`, `.svg` etc.
+            dpi: resolution of the created plot.
 
         Returns:
-            None
+            path of the saved file.
         """
-        dates: list[datetime.date] = Helper.get_unique_dates(self.__interval_info)
-        values: list[float] = Helper.get_close_values(self.__interval_info, dates)
-
-        min_line: list[float] = [round(min(values), 2)] * len(dates)
-        max_line: list[float] = [round(max(values), 2)] * len(dates)
-        avg_line: list[float] = [round(sum(values) / len(values), 2)] * len(dates)
-
-        plt.plot(dates, values, color='blue', marker='o', markersize=4, label=f'{self.__tech_name} {values[-1]}')
-        plt.plot(dates, min_line, color='red', label=f'min {min_line[-1]}')
-        plt.plot(dates, max_line, color='green', label=f'max {max_line[-1]}')
-        plt.plot(dates, avg_line, color='grey', label=f'avg {avg_line[-1]}')
-        plt.legend(loc='upper left')
-        plt.xlabel('Dates')
-        plt.ylabel('Values')
-        plt.grid(True)
-
-        figure: plt.figure = plt.gcf()
-        figure.set_size_inches(
-            w_size or PLOTS.W_SIZE,
-            h_size or PLOTS.H_SIZE
-        )
+        return Plots.render(self.get_plot_params(w_size, h_size, save_format, dpi))
 
-        file_name: str = (
-            f'{self.__tech_name}_'
-            f'{self.__tech_data['period_from']}_'
-            f'{self.__tech_data['period_to']}.'
-            f'{save_format}'
-        )
-        plot_dir = Path(PLOTS.DIRECTORY_NAME)
-        if not plot_dir.exists():
-            Path.mkdir(plot_dir)
-        path: Path = Path(plot_dir, file_name)
-        plt.savefig(path, dpi=300, bbox_inches='tight')
-        plt.close()
+    @property
+    def profiler(self) -> Profiler:
+        """
+        Property for get profiler.
+
+        Returns:
+            profiler of the instrument of the interval. Default profiler if the interval is not bound to the
+                instrument.
+        """
+        return self.__source.profiler if self.__source is not None else default_profiler
 
     @property
     def max_value(self):
@@ -115,10 +425,11 @@ class Interval:
         Returns:
             max_value of index.
         """
+        max_close, max_begin, max_end = self.__stats.max_value
         return {
-            'from': self.__tech_data['max_from'],
-            'to': self.__tech_data['max_to'],
-            'value': self.__max_item[1]
+            'from': self.__format_datetime(max_begin),
+            'to': self.__format_datetime(max_end),
+            'value': max_close
         }
 
     @property
@@ -129,10 +440,11 @@ class Interval:
         Returns:
             min_value of index.
         """
+        min_close, min_begin, min_end = self.__stats.min_value
         return {
-            'from': self.__tech_data['min_from'],
-            'to': self.__tech_data['min_to'],
-            'value': self.__min_item[1]
+            'from': self.__format_datetime(min_begin),
+            'to': self.__format_datetime(min_end),
+            'value': min_close
         }
 
     @property
@@ -146,5 +458,29 @@ class Interval:
         return {
             'from': self.__tech_data['period_from'],
             'to': self.__tech_data['period_to'],
-            'value': round(sum(info[1] for info in self.__interval_info) / len(self.__interval_info), 2)
+            'value': round(self.__stats.avg_value, 2)
         }
+
+    @property
+    def candles(self) -> Candles | None:
+        """
+        Property for get candles.
+
+        Returns:
+            candles of interval. None if the interval was created from the stream.
+        """
+        if self.__candle_chunks is None:
+            return None
+        if len(self.__candle_chunks) > 1:
+            self.__candle_chunks: list[Candles] = [Candles.concat(self.__candle_chunks)]
+        return self.__candle_chunks[0]
+
+    @property
+    def resolution(self) -> str:
+        """
+        Property for get resolution.
+
+        Returns:
+            resolution of candles of interval.
+        """
+        return self.__resolution
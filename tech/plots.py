@@ -0,0 +1,91 @@
+"""
+Module for rendering plots.
+"""
+
+# standard library imports
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Iterable
+
+# third party imports
+import numpy as np
+
+# local imports
+from values.constans import PLOTS
+
+
+class Plots:
+    """
+    Class for rendering plots. Matplotlib is imported on the first rendering. Every plot is drawn on the own figure
+        with the Agg canvas, so the global state of pyplot is not used and rendering is thread-safe.
+    """
+    @staticmethod
+    def render(plot_params: dict) -> Path:
+        """
+        Function for rendering a plot and saving it to the file.
+
+        Args:
+            plot_params: parameters of the plot created by `Interval.get_plot_params`.
+
+        Returns:
+            path of the saved file.
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        tech_name: str = plot_params['tech_name']
+        dates: np.ndarray = plot_params['dates']
+        values: np.ndarray = plot_params['values']
+
+        min_value: float = round(float(values.min()), 2)
+        max_value: float = round(float(values.max()), 2)
+        avg_value: float = round(float(values.mean()), 2)
+
+        figure: Figure = Figure(figsize=(plot_params['w_size'], plot_params['h_size']))
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        axes.plot(dates, values, color='blue', marker='o', markersize=4, label=f'{tech_name} {values[-1]}')
+        axes.axhline(min_value, color='red', label=f'min {min_value}')
+        axes.axhline(max_value, color='green', label=f'max {max_value}')
+        axes.axhline(avg_value, color='grey', label=f'avg {avg_value}')
+        axes.legend(loc='upper left')
+        axes.set_xlabel('Dates')
+        axes.set_ylabel('Values')
+        axes.grid(True)
+
+        path: Path = Path(plot_params['path'])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        figure.savefig(path, dpi=plot_params['dpi'], bbox_inches='tight')
+        return path
+
+    @classmethod
+    def render_many(cls,
+                    intervals: Iterable,
+                    w_size: int = None,
+                    h_size: int = None,
+                    save_format: str = 'pdf',
+                    dpi: int = PLOTS.DPI,
+                    max_workers: int | None = None
+                    ) -> list[Path]:
+        """
+        Function for rendering plots of several intervals in parallel in the process pool. Only daily close values
+            are passed to the worker processes.
+
+        Args:
+            intervals: objects of the Interval class. For example, values of `IMOEX.constituents_interval`.
+            w_size: width of the created plots.
+            h_size: height of the created plots.
+            save_format: extension in which the files will be saved. For example: `.png`, `.svg` etc.
+            dpi: resolution of the created plots.
+            max_workers: maximum number of worker processes. If None, the number of processors is used.
+
+        Returns:
+            paths of the saved files in the order of intervals.
+        """
+        plots_params: list[dict] = [
+            interval.get_plot_params(w_size, h_size, save_format, dpi) for interval in intervals
+        ]
+        if len(plots_params) < 2 or max_workers == 1:
+            return [cls.render(plot_params) for plot_params in plots_params]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(cls.render, plots_params))
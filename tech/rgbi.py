@@ -3,23 +3,31 @@ Module for working with RGBI.
 """
 
 # local imports
-
 from tech.base_index import BaseIndex
+from custom.candle_store import CandleStore
+from custom.trading_calendar import TradingCalendar
+from custom.transport import Transport
+from custom.profiling import Profiler
 
 
 class RGBI(BaseIndex):
     """
     Class for working with RGBI.
     """
+    __slots__: tuple = ()
 
     def __init__(self,
                  last_trade_day: str,
-                 weekends: list[str],
-                 workdays: list[str]
+                 calendar: TradingCalendar,
+                 candle_store: CandleStore,
+                 transport: Transport,
+                 profiler: Profiler | None = None
                  ) -> None:
         super().__init__(
             tech_name='RGBI',
             last_trade_day=last_trade_day,
-            weekends=weekends,
-            workdays=workdays
+            calendar=calendar,
+            candle_store=candle_store,
+            transport=transport,
+            profiler=profiler
         )
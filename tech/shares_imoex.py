@@ -2,25 +2,36 @@
 Module for working with MOEX shares.
 """
 
+# local imports
 from tech.base_instrument import BaseInstrument
+from custom.candle_store import CandleStore
+from custom.trading_calendar import TradingCalendar
+from custom.transport import Transport
+from custom.profiling import Profiler
 
 
 class SharesIMOEX(BaseInstrument):
     """
     Class for working with MOEX shares.
     """
+    __slots__: tuple = ()
+
     def __init__(self,
                  ticker_name: str,
                  last_trade_day: str,
-                 weekends: list[str],
-                 workdays: list[str]
+                 calendar: TradingCalendar,
+                 candle_store: CandleStore,
+                 transport: Transport,
+                 profiler: Profiler | None = None
                  ) -> None:
         super().__init__(
             tech_name=ticker_name,
             tech_type='shares',
             last_trade_day=last_trade_day,
-            weekends=weekends,
-            workdays=workdays
+            calendar=calendar,
+            candle_store=candle_store,
+            transport=transport,
+            profiler=profiler
         )
 
     def __repr__(self):
@@ -0,0 +1,269 @@
+"""
+Module for implementing subscription to live candles.
+"""
+
+# standard library imports
+import asyncio
+import inspect
+from datetime import datetime
+from collections.abc import Callable
+
+# third party imports
+import numpy as np
+
+# local imports
+from tech.base_instrument import BaseInstrument
+from tech.candles import Candles
+from custom.custom_functions import Helper
+from custom.transport import Transport
+from custom.trading_calendar import TradingCalendar
+from values.constans import CALENDAR, MOEX_REQUESTS, PAGINATION, RESOLUTION, SUBSCRIBER
+import custom.custom_exceptions as ce
+
+
+class CandleSubscriber:
+    """
+    Class for implementing subscription to live candles of several instruments. ISS MOEX is polled for all instruments
+        in one batch, only candles beginning from the last seen one are requested. Candles are matched by begin, so
+        the forming candle whose end moves with every trade is published once. New candles are passed to the
+        callbacks and to the queue. Polling stops after the end of the trading day.
+    """
+    def __init__(self,
+                 instruments: list[BaseInstrument],
+                 transport: Transport,
+                 calendar: TradingCalendar,
+                 poll_interval: float = SUBSCRIBER.POLL_INTERVAL,
+                 queue: asyncio.Queue | None = None,
+                 since: datetime | None = None,
+                 closed_only: bool = True,
+                 resolution: str = RESOLUTION.DEFAULT
+                 ) -> None:
+        self.__instruments: dict[str, BaseInstrument] = {
+            instrument.tech_name: instrument for instrument in instruments
+        }
+        self.__transport: Transport = transport
+        self.__calendar: TradingCalendar = calendar
+        self.__poll_interval: float = poll_interval
+        self.__queue: asyncio.Queue | None = queue
+        self.__closed_only: bool = closed_only
+        self.__candle_interval: int = Helper.get_candle_interval(resolution)
+        self.__duration: tuple[int, str] = RESOLUTION.DURATIONS[resolution]
+        self.__since: np.datetime64 = np.datetime64(
+            since or datetime.combine(datetime.today(), datetime.min.time()), 's'
+        )
+        self.__last_seen: dict[str, np.datetime64 | None] = dict.fromkeys(self.__instruments)
+        self.__callbacks: list[Callable] = []
+        self.__failures: dict[str, BaseException] = {}
+        self.__is_stopped: bool = False
+
+    def subscribe(self, callback: Callable) -> None:
+        """
+        Function for registering the callback which receives new candles. The callback is called with the technical
+            name of the instrument and its new candles and may be a coroutine function.
+
+        Args:
+            callback: function called for new candles.
+
+        Returns:
+            None
+        """
+        self.__callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable) -> None:
+        """
+        Function for removing the registered callback.
+
+        Args:
+            callback: function called for new candles.
+
+        Returns:
+            None
+        """
+        self.__callbacks.remove(callback)
+
+    def stop(self) -> None:
+        """
+        Function for stopping the polling after the current poll.
+
+        Returns:
+            None
+        """
+        self.__is_stopped = True
+
+    def is_day_over(self, moment: datetime | None = None) -> bool:
+        """
+        Function to determine the trading day is over at the specified moment. On days off the trading day is over
+            all day.
+
+        Args:
+            moment: moment for check. If None, the current moment is used.
+
+        Returns:
+            result of check.
+        """
+        moment: datetime = moment or datetime.now()
+        if not self.__calendar.is_trading_day(moment.date()):
+            return True
+        return moment.time() >= Helper.to_time(CALENDAR.TIME_DAY_OVER)
+
+    def get_closes(self, candles: Candles) -> np.ndarray:
+        """
+        Function for calculating moments when periods of the candles elapse.
+
+        Args:
+            candles: candles of the resolution of the subscriber.
+
+        Returns:
+            moments when the candles are closed.
+        """
+        count, unit = self.__duration
+        return (candles.begin.astype(f'datetime64[{unit}]') + np.timedelta64(count, unit)).astype('datetime64[s]')
+
+    async def __publish(self, tech_name: str, candles: Candles) -> None:
+        """
+        Async function for passing new candles to the callbacks and to the queue.
+
+        Args:
+            tech_name: technical name of the instrument.
+            candles: new candles of the instrument.
+
+        Returns:
+            None
+        """
+        for callback in self.__callbacks:
+            result = callback(tech_name, candles)
+            if inspect.isawaitable(result):
+                await result
+        if self.__queue is not None:
+            await self.__queue.put((tech_name, candles))
+
+    def __get_since(self, tech_name: str) -> np.datetime64:
+        """
+        Function for getting the moment from which candles of the instrument are requested.
+
+        Args:
+            tech_name: technical name of the instrument.
+
+        Returns:
+            begin of the last seen candle. Start moment if no candles have been seen yet.
+        """
+        last_seen: np.datetime64 | None = self.__last_seen[tech_name]
+        return self.__since if last_seen is None else last_seen
+
+    async def poll_async(self) -> dict[str, Candles]:
+        """
+        Async function for requesting candles beginning from the last seen one for all instruments in one batch.
+            Candles beginning later than the last seen one are new, they are published and the last seen begin is moved
+            forward. Before the first candle, candles beginning from the start moment are new. If only closed candles
+            are published, the candle is new after its period has elapsed. Pages of every instrument are followed until
+            the first incomplete page. Candles of the pages received before the failure are published, the rest is
+            requested again by the next poll.
+
+        Returns:
+            new candles by technical names of instruments.
+        """
+        today: str = Helper.from_date(datetime.today().date())
+        starts: dict[str, int] = dict.fromkeys(self.__instruments, 0)
+        rows: dict[str, list[list]] = {}
+        self.__failures: dict[str, BaseException] = {}
+        while starts:
+            try:
+                responses: dict[str, dict] = await Helper.generate_requests(
+                    transport=self.__transport,
+                    urls={tech_name: MOEX_REQUESTS['DETAIL_INFO_PAGE'] for tech_name in starts},
+                    additional_params={
+                        tech_name: [
+                            self.__instruments[tech_name].tech_type,
+                            tech_name,
+                            Candles.to_str(self.__get_since(tech_name)),
+                            today,
+                            self.__candle_interval,
+                            start
+                        ] for tech_name, start in starts.items()
+                    },
+                    cache=False
+                )
+            except ce.RequestsFailed as exc:
+                responses: dict[str, dict] = exc.responses
+                self.__failures.update(exc.failures)
+            for tech_name, response in responses.items():
+                page_data: list[list] = response['candles']['data']
+                rows.setdefault(tech_name, []).extend(page_data)
+                if len(page_data) == PAGINATION.PAGE_SIZE:
+                    starts[tech_name] += PAGINATION.PAGE_SIZE
+                else:
+                    del starts[tech_name]
+            for tech_name in self.__failures:
+                starts.pop(tech_name, None)
+
+        now: np.datetime64 = np.datetime64(datetime.now(), 's')
+        result: dict[str, Candles] = {}
+        for tech_name, tech_rows in rows.items():
+            candles: Candles = Candles.from_rows(tech_rows)
+            if (last_seen := self.__last_seen[tech_name]) is None:
+                is_new: np.ndarray = candles.begin >= self.__since
+            else:
+                is_new: np.ndarray = candles.begin > last_seen
+            if self.__closed_only:
+                is_new &= self.get_closes(candles) <= now
+            if not len(new_candles := candles[is_new]):
+                continue
+            self.__last_seen[tech_name] = new_candles.begin.max()
+            result[tech_name] = new_candles
+            await self.__publish(tech_name, new_candles)
+        return result
+
+    async def run_async(self) -> None:
+        """
+        Async function for polling ISS MOEX until the subscriber is stopped or the trading day is over. The last poll
+            is made after the end of the trading day.
+
+        Returns:
+            None
+        """
+        self.__is_stopped = False
+        while not self.__is_stopped:
+            is_day_over: bool = self.is_day_over()
+            await self.poll_async()
+            if is_day_over:
+                break
+            await asyncio.sleep(self.__poll_interval)
+
+    def run(self) -> None:
+        """
+        Function for polling ISS MOEX until the subscriber is stopped or the trading day is over.
+
+        Returns:
+            None
+        """
+        self.__transport.run(self.run_async())
+
+    @property
+    def tech_names(self) -> list[str]:
+        """
+        Property for get tech_names.
+
+        Returns:
+            technical names of the instruments.
+        """
+        return list(self.__instruments)
+
+    @property
+    def last_seen(self) -> dict[str, np.datetime64 | None]:
+        """
+        Property for get last_seen.
+
+        Returns:
+            begin of the last seen candle by technical names of instruments. None if no candles have been seen yet.
+        """
+        return dict(self.__last_seen)
+
+    @property
+    def failures(self) -> dict[str, BaseException]:
+        """
+        Property for get failures.
+
+        Returns:
+            errors of the instruments failed by the last poll.
+        """
+        return self.__failures
@@ -0,0 +1,91 @@
+"""
+Tests of the persistent candle store and of the migration of its schema.
+"""
+
+# standard library imports
+import json
+import sqlite3
+from pathlib import Path
+from datetime import date, timedelta
+
+# third party imports
+import pytest
+
+# local imports
+from custom.candle_store import CandleStore
+from values.constans import STORE
+
+ROW: list = [250.0, 250.2, 250.5, 249.5, 2500000.0, 10000.0, '2024-06-03 10:00:00', '2024-06-03 10:09:59']
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    candle_store.save('shares', 'SBER', {'2024-06-03': [ROW], '2024-06-04': []})
+    candle_store.save('shares', 'SBER', {'2024-06-03': [ROW, ROW]}, '1h')
+    assert candle_store.load('shares', 'SBER', ['2024-06-03', '2024-06-04', '2024-06-05']) == {
+        '2024-06-03': [ROW],
+        '2024-06-04': []
+    }
+    assert candle_store.load('shares', 'SBER', ['2024-06-03'], '1h') == {'2024-06-03': [ROW, ROW]}
+    assert candle_store.load('shares', 'GAZP', ['2024-06-03']) == {}
+    candle_store.close()
+
+
+def test_stored_days_in_chunks(tmp_path: Path) -> None:
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    days: list[str] = [str(date(2020, 1, 1) + timedelta(days=num)) for num in range(STORE.MAX_VARIABLES * 2 + 1)]
+    candle_store.save('shares', 'SBER', {day: [] for day in days[::2]})
+    assert candle_store.stored_days('shares', 'SBER', days) == set(days[::2])
+    assert candle_store.stored_days('shares', 'SBER', days, '1d') == set()
+    assert len(candle_store.load('shares', 'SBER', days)) == STORE.MAX_VARIABLES + 1
+    candle_store.close()
+
+
+def test_store_is_kept_between_connections(tmp_path: Path) -> None:
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    candle_store.save('shares', 'SBER', {'2024-06-03': [ROW]})
+    candle_store.close()
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    assert candle_store.load('shares', 'SBER', ['2024-06-03']) == {'2024-06-03': [ROW]}
+    candle_store.close()
+
+
+def test_migration_keeps_candles_as_default_resolution(tmp_path: Path) -> None:
+    path: Path = tmp_path / 'candles.sqlite3'
+    connection: sqlite3.Connection = sqlite3.connect(path)
+    connection.execute(
+        'CREATE TABLE candles (tech_type TEXT NOT NULL, tech_name TEXT NOT NULL, day TEXT NOT NULL, '
+        'data TEXT NOT NULL, PRIMARY KEY (tech_type, tech_name, day))'
+    )
+    connection.execute(
+        'INSERT INTO candles (tech_type, tech_name, day, data) VALUES (?, ?, ?, ?)',
+        ('shares', 'SBER', '2024-06-03', json.dumps([ROW]))
+    )
+    connection.commit()
+    connection.close()
+
+    candle_store: CandleStore = CandleStore(path)
+    assert candle_store.load('shares', 'SBER', ['2024-06-03'], '10m') == {'2024-06-03': [ROW]}
+    assert candle_store.load('shares', 'SBER', ['2024-06-03'], '1d') == {}
+    candle_store.save('shares', 'SBER', {'2024-06-03': []}, '1d')
+    candle_store.close()
+
+    connection: sqlite3.Connection = sqlite3.connect(path)
+    assert connection.execute('PRAGMA user_version').fetchone()[0] == STORE.SCHEMA_VERSION
+    assert connection.execute('SELECT COUNT(*) FROM candles').fetchone()[0] == 2
+    connection.close()
+
+
+def test_is_finished_day() -> None:
+    assert CandleStore.is_finished_day(date.today() - timedelta(days=1))
+    assert not CandleStore.is_finished_day(date.today())
+
+
+def test_default_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(STORE.ENV_VAR, raising=False)
+    assert CandleStore.get_default_path() == Path('~/.cache/moexbuilder/candles.sqlite3').expanduser()
+    monkeypatch.setenv(STORE.ENV_VAR, str(tmp_path / 'nested' / 'store.sqlite3'))
+    candle_store: CandleStore = CandleStore()
+    assert candle_store.path == tmp_path / 'nested' / 'store.sqlite3'
+    assert candle_store.path.exists()
+    candle_store.close()
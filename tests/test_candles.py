@@ -0,0 +1,130 @@
+"""
+Tests of aggregating candles by trading days against the brute-force grouping of rows.
+"""
+
+# standard library imports
+import random
+from datetime import date, datetime, timedelta
+
+# third party imports
+import numpy as np
+import pytest
+
+# local imports
+from tech.candles import Candles, DailyCandles
+from tech.dynamics import Dynamics
+import custom.custom_exceptions as ce
+
+
+def random_rows(seed: int, size: int) -> list[list]:
+    """
+    Function for generating chronologically ordered hourly candles with gaps of days and nights.
+    """
+    rng: random.Random = random.Random(seed)
+    rows: list[list] = []
+    moment: datetime = datetime(2025, 12, 29, 9, 50)
+    for _ in range(size):
+        moment += timedelta(hours=rng.choice((1, 1, 1, 15, 63)))
+        open_value, close_value = rng.randint(100, 200), rng.randint(100, 200)
+        rows.append([
+            open_value,
+            close_value,
+            max(open_value, close_value) + rng.randint(0, 10),
+            min(open_value, close_value) - rng.randint(0, 10),
+            rng.randint(0, 10 ** 6),
+            rng.randint(0, 10 ** 4),
+            moment.strftime('%Y-%m-%d %H:%M:%S'),
+            (moment + timedelta(minutes=rng.choice((59, 70)))).strftime('%Y-%m-%d %H:%M:%S')
+        ])
+    return rows
+
+
+def brute_daily(rows: list[list]) -> list[tuple]:
+    """
+    Function for aggregating rows by the day of their end one by one.
+    """
+    days: dict[str, list[list]] = {}
+    for row in rows:
+        days.setdefault(row[7][:10], []).append(row)
+    return [
+        (
+            day,
+            day_rows[0][0],
+            day_rows[-1][1],
+            max(row[2] for row in day_rows),
+            min(row[3] for row in day_rows),
+            sum(row[4] for row in day_rows),
+            sum(row[5] for row in day_rows),
+            day_rows[-1][7]
+        )
+        for day, day_rows in days.items()
+    ]
+
+
+def as_tuples(daily: DailyCandles) -> list[tuple]:
+    """
+    Function for converting daily candles to tuples comparable with the brute-force aggregation.
+    """
+    return [
+        (str(day), float(open_value), float(close_value), float(high), float(low), float(value), float(volume),
+         str(last_end).replace('T', ' '))
+        for day, open_value, close_value, high, low, value, volume, last_end in zip(
+            daily.days, daily.open, daily.close, daily.high, daily.low, daily.value, daily.volume, daily.last_end
+        )
+    ]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_daily_matches_brute_force(seed: int) -> None:
+    rows: list[list] = random_rows(seed, 300)
+    assert as_tuples(Candles.from_rows(rows).daily()) == brute_daily(rows)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_concat_of_chunks_merges_split_days(seed: int) -> None:
+    rows: list[list] = random_rows(seed, 300)
+    candles: Candles = Candles.from_rows(rows)
+    rng: random.Random = random.Random(seed)
+    bounds: list[int] = [0, *sorted(rng.sample(range(1, len(rows)), 20)), len(rows)]
+    chunks: list[DailyCandles] = [candles[start:stop].daily() for start, stop in zip(bounds, bounds[1:])]
+    chunks.insert(3, DailyCandles.empty())
+    assert as_tuples(DailyCandles.concat(chunks)) == brute_daily(rows)
+    assert as_tuples(DailyCandles.concat([candles[index:index + 1].daily() for index in range(len(rows))])) == (
+        brute_daily(rows)
+    )
+
+
+def test_year_boundary_and_empty() -> None:
+    rows: list[list] = [
+        [1, 2, 3, 0, 10, 1, '2025-12-31 18:00:00', '2025-12-31 18:59:59'],
+        [2, 3, 4, 1, 20, 2, '2025-12-31 23:30:00', '2026-01-01 00:29:59'],
+        [3, 4, 5, 2, 30, 3, '2026-01-01 10:00:00', '2026-01-01 10:59:59']
+    ]
+    assert as_tuples(Candles.from_rows(rows).daily()) == brute_daily(rows)
+    assert len(Candles.empty().daily()) == 0
+    assert len(DailyCandles.concat([])) == 0
+    assert len(DailyCandles.concat([DailyCandles.empty(), Candles.empty().daily()])) == 0
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_last_index_by_day(seed: int) -> None:
+    rows: list[list] = random_rows(seed, 200)
+    candles: Candles = Candles.from_rows(rows)
+    assert rows[candles.last_index()][7] == max(row[7] for row in rows)
+    for day, *_ in brute_daily(rows):
+        expected: list = max((row for row in rows if row[7][:10] == day), key=lambda row: row[7])
+        assert candles.get_last_value(np.datetime64(day).astype(object))['to'] == expected[7]
+
+
+def test_last_index_without_candles_on_day() -> None:
+    weekly: Candles = Candles.from_rows([
+        [1, 2, 3, 0, 10, 1, '2026-10-05 00:00:00', '2026-10-09 23:59:59'],
+        [2, 3, 4, 1, 20, 2, '2026-10-12 00:00:00', '2026-10-16 23:59:59']
+    ])
+    assert weekly.last_index(date(2026, 10, 16)) == 1
+    with pytest.raises(ce.NoCandlesOnDay):
+        weekly.last_index(date(2026, 10, 7))
+    with pytest.raises(ce.NoCandlesOnDay):
+        Candles.empty().last_index()
+    with pytest.raises(ce.NoCandlesOnDay):
+        Dynamics(weekly, (date(2026, 10, 7), date(2026, 10, 16)), return_date_str=True)
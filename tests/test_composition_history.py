@@ -0,0 +1,130 @@
+"""
+Tests of the history of the composition of the index against the brute-force scan of membership intervals.
+"""
+
+# standard library imports
+import random
+from datetime import date, timedelta
+
+# third party imports
+import pytest
+
+# local imports
+from tech.composition_history import CompositionHistory
+import custom.custom_exceptions as ce
+
+ROWS: list[list] = [
+    ['SBER', '2010-01-01', '2026-10-16', 1],
+    ['SBER', '2005-01-01', '2008-01-01', 1],
+    ['GAZP', '2010-01-01', '2026-10-16', 1],
+    ['YNDX', '2015-01-01', '2024-06-01', 1],
+    ['MTSS', '2012-03-15', '2013-12-31', 1],
+    ['MTSS', '2014-01-01', '2016-06-30', 1],
+    ['MTSS', '2019-12-20', '2026-10-16', 1],
+    ['AFLT', '2011-06-01', '2011-06-01', 1]
+]
+
+
+def brute_as_of(rows: list[list], day: date) -> list[str]:
+    """
+    Function for determining the composition as of the date by scanning all rows.
+    """
+    max_date_to: str = max(row[2] for row in rows)
+    return sorted({
+        ticker_name for ticker_name, from_dt, to_dt, *_ in rows
+        if date.fromisoformat(from_dt) <= day and (to_dt == max_date_to or day <= date.fromisoformat(to_dt))
+    })
+
+
+def brute_changes(rows: list[list], period_from: date, period_to: date) -> list[dict]:
+    """
+    Function for determining changes of the composition by comparing compositions of neighbouring days.
+    """
+    changes: list[dict] = []
+    previous: set[str] = set(brute_as_of(rows, period_from))
+    day: date = period_from + timedelta(days=1)
+    while day <= period_to:
+        current: set[str] = set(brute_as_of(rows, day))
+        if current != previous:
+            changes.append({
+                'date': str(day), 'added': sorted(current - previous), 'removed': sorted(previous - current)
+            })
+        previous: set[str] = current
+        day += timedelta(days=1)
+    return changes
+
+
+def bound_days(rows: list[list]) -> list[date]:
+    """
+    Function for collecting the dates around the bounds of all intervals.
+    """
+    days: set[date] = set()
+    for _, from_dt, to_dt, *_ in rows:
+        for bound in (date.fromisoformat(from_dt), date.fromisoformat(to_dt)):
+            days.update(bound + timedelta(days=shift) for shift in (-1, 0, 1))
+    return sorted(days)
+
+
+def random_rows(seed: int) -> list[list]:
+    """
+    Function for generating intervals of tickers which leave and re-enter the index.
+    """
+    rng: random.Random = random.Random(seed)
+    last_day: date = date(2026, 10, 16)
+    rows: list[list] = []
+    for num in range(12):
+        day: date = date(2015, 1, 1) + timedelta(days=rng.randrange(400))
+        while day < last_day:
+            till: date = min(day + timedelta(days=rng.randrange(0, 500)), last_day)
+            rows.append([f'T{num:02d}', str(day), str(till), rng.choice((1, 3))])
+            day: date = till + timedelta(days=rng.choice((1, 1, 2, 90, 400)))
+    rng.shuffle(rows)
+    return rows
+
+
+@pytest.mark.parametrize('rows', [ROWS, *(random_rows(seed) for seed in range(5))])
+def test_as_of_matches_brute_force(rows: list[list]) -> None:
+    history: CompositionHistory = CompositionHistory.from_rows(rows)
+    for day in [date(2000, 1, 1), date(2030, 1, 1), *bound_days(rows)]:
+        assert history.as_of(day) == brute_as_of(rows, day), day
+        assert history.as_of(str(day)) == brute_as_of(rows, day), day
+
+
+@pytest.mark.parametrize('rows', [ROWS, *(random_rows(seed) for seed in range(3))])
+def test_changes_match_brute_force(rows: list[list]) -> None:
+    history: CompositionHistory = CompositionHistory.from_rows(rows)
+    days: list[date] = bound_days(rows)
+    rng: random.Random = random.Random(0)
+    for _ in range(30):
+        period_from, period_to = sorted(rng.sample(days, 2))
+        assert history.changes(period_from, period_to) == brute_changes(rows, period_from, period_to)
+    assert history.changes('2000-01-01', '2030-01-01') == brute_changes(rows, date(2000, 1, 1), date(2030, 1, 1))
+
+
+def test_changes_apply_to_composition() -> None:
+    history: CompositionHistory = CompositionHistory.from_rows(ROWS)
+    composition: set[str] = set(history.as_of('2009-01-01'))
+    for change in history.changes('2009-01-01', '2025-01-01'):
+        composition: set[str] = (composition | set(change['added'])) - set(change['removed'])
+    assert sorted(composition) == history.as_of('2025-01-01')
+
+
+def test_exact_bounds() -> None:
+    history: CompositionHistory = CompositionHistory.from_rows(ROWS)
+    assert 'YNDX' not in history.as_of('2014-12-31')
+    assert 'YNDX' in history.as_of('2015-01-01')
+    assert 'YNDX' in history.as_of('2024-06-01')
+    assert 'YNDX' not in history.as_of('2024-06-02')
+    assert 'AFLT' in history.as_of('2011-06-01')
+    assert 'AFLT' not in history.as_of('2011-06-02')
+    assert 'MTSS' in history.as_of('2014-01-01')
+    for change in history.changes('2013-06-01', '2014-06-01'):
+        assert 'MTSS' not in change['added'] + change['removed']
+    assert history.as_of('2004-12-31') == []
+
+
+def test_empty_and_invalid() -> None:
+    assert CompositionHistory.from_rows([]).as_of('2020-01-01') == []
+    assert CompositionHistory.from_rows([]).changes('2020-01-01', '2021-01-01') == []
+    with pytest.raises(ce.IsNotValidDate):
+        CompositionHistory.from_rows(ROWS).as_of('2020-13-01')
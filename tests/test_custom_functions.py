@@ -0,0 +1,70 @@
+"""
+Tests of the composition of the index and of following pages of ISS MOEX.
+"""
+
+# standard library imports
+import asyncio
+
+# third party imports
+import pytest
+
+# local imports
+from custom.custom_functions import Helper
+
+
+def test_get_composition_moex_keeps_latest_interval() -> None:
+    composition: dict = Helper.get_composition_moex([
+        ['SBER', '2010-01-01', '2026-10-16', 1],
+        ['SBER', '2010-01-01', '2026-10-16', 3],
+        ['SBER', '2005-01-01', '2008-01-01', 1],
+        ['YNDX', '2015-01-01', '2024-06-01', 1],
+        ['GAZP', '2010-01-01', '2026-10-16', 1]
+    ])
+    assert composition['ticker_names'] == ['SBER', 'GAZP']
+    assert composition['full_result']['SBER'] == {'from': '2010-01-01', 'to': '2026-10-16'}
+    assert list(composition['actual_result']) == ['SBER', 'GAZP']
+    assert list(composition['full_result']) == ['SBER', 'YNDX', 'GAZP']
+
+
+def paged(monkeypatch: pytest.MonkeyPatch, rows: list[list], page_size: int, cursor: bool) -> list[str]:
+    """
+    Function for replacing requests by pages of the rows.
+
+    Returns:
+        list which receives the `start=` parameters of the requests.
+    """
+    starts: list[str] = []
+
+    async def generate_requests(transport, urls: dict, additional_params: dict, **_) -> dict[str, dict]:
+        pages: dict[str, dict] = {}
+        for task_name, params in additional_params.items():
+            start: int = params[-1]
+            starts.append(start)
+            pages[task_name] = {'tickers': {'data': rows[start:start + page_size]}}
+            if cursor:
+                pages[task_name]['tickers.cursor'] = {'data': [[start, len(rows), page_size]]}
+        return pages
+
+    monkeypatch.setattr(Helper, 'generate_requests', generate_requests)
+    return starts
+
+
+@pytest.mark.parametrize('total', [0, 1, 99, 100, 101, 250])
+def test_paged_requests_follow_cursor(monkeypatch: pytest.MonkeyPatch, total: int) -> None:
+    rows: list[list] = [[f'T{num}'] for num in range(total)]
+    paged(monkeypatch, rows, 100, cursor=True)
+    assert asyncio.run(Helper.generate_paged_requests(None, '{0}{1}', ['x'], 'tickers', page_size=None)) == rows
+
+
+@pytest.mark.parametrize('total', [0, 1, 99, 100, 101, 250])
+def test_paged_requests_without_cursor(monkeypatch: pytest.MonkeyPatch, total: int) -> None:
+    rows: list[list] = [[f'T{num}'] for num in range(total)]
+    paged(monkeypatch, rows, 100, cursor=False)
+    assert asyncio.run(Helper.generate_paged_requests(None, '{0}{1}', ['x'], 'tickers', page_size=None)) == rows
+
+
+@pytest.mark.parametrize('total', [0, 99, 100, 101, 1000])
+def test_paged_requests_by_page_size(monkeypatch: pytest.MonkeyPatch, total: int) -> None:
+    rows: list[list] = [[f'T{num}'] for num in range(total)]
+    paged(monkeypatch, rows, 100, cursor=False)
+    assert asyncio.run(Helper.generate_paged_requests(None, '{0}{1}', ['x'], 'tickers', page_size=100)) == rows
@@ -0,0 +1,123 @@
+"""
+Tests of IMOEX and its constituents against the local stand-in of ISS MOEX.
+"""
+
+# standard library imports
+import json
+import hashlib
+from pathlib import Path
+from datetime import date, timedelta
+from collections.abc import Iterator
+
+# third party imports
+import pytest
+
+# local imports
+from moex import MOEX
+from custom.candle_store import CandleStore
+from custom.transport import Transport
+from benchmarks.iss_stub import IssStub
+from values.constans import MOEX_REQUESTS
+import custom.custom_exceptions as ce
+
+PERIOD_FROM: str = str(date.today() - timedelta(days=20))
+
+
+@pytest.fixture
+def stub() -> Iterator[IssStub]:
+    with IssStub(tickers=6) as stub:
+        yield stub
+
+
+@pytest.fixture
+def moex(stub: IssStub, tmp_path: Path) -> Iterator[MOEX]:
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    with Transport(base_url=stub.base_url) as transport, MOEX(candle_store=candle_store, transport=transport) as moex:
+        yield moex
+    candle_store.close()
+
+
+def test_constituents_interval_matches_single_intervals(moex: MOEX) -> None:
+    intervals: dict = moex.imoex.constituents_interval(PERIOD_FROM, soft_search='back')
+    assert list(intervals) == moex.imoex.actual_composition_index_tickers
+    for ticker_name, interval in intervals.items():
+        single = moex.imoex[ticker_name].interval(PERIOD_FROM, soft_search='back', fetch_mode='day')
+        assert interval.max_value == single.max_value
+        assert interval.min_value == single.min_value
+        assert interval.avg_value == single.avg_value
+
+
+def test_constituents_interval_of_selected_tickers(moex: MOEX, stub: IssStub) -> None:
+    intervals: dict = moex.imoex.constituents_interval(PERIOD_FROM, soft_search='back', tickers=['SBER', 'LKOH'])
+    assert list(intervals) == ['SBER', 'LKOH']
+    requests: int = stub.requests
+    repeated: dict = moex.imoex.constituents_interval(PERIOD_FROM, soft_search='back', tickers=['SBER', 'LKOH'])
+    assert stub.requests - requests <= 2
+    assert repeated['SBER'].avg_value == intervals['SBER'].avg_value
+
+
+@pytest.mark.parametrize('resolution', ['1w', '1M'])
+def test_dynamics_rejects_candles_longer_than_day(moex: MOEX, resolution: str) -> None:
+    with pytest.raises(ce.SomethingWentWrong):
+        moex.imoex.dynamics(PERIOD_FROM, soft_search='back', resolution=resolution)
+
+
+@pytest.mark.parametrize('resolution', ['1h', '1d'])
+def test_dynamics_of_resolutions(moex: MOEX, resolution: str) -> None:
+    dynamics = moex.imoex.dynamics(PERIOD_FROM, soft_search='back', resolution=resolution)
+    reference = moex.imoex.dynamics(PERIOD_FROM, soft_search='back', resolution='10m')
+    assert dynamics.full_info[0]['period_from'] == reference.full_info[0]['period_from']
+    assert dynamics.full_info[1]['period_to'] == reference.full_info[1]['period_to']
+
+
+def test_dynamics_matrix_matches_single_dynamics(moex: MOEX) -> None:
+    periods: tuple = ('1D', '1W', '1M', (str(date.today() - timedelta(days=45)), PERIOD_FROM))
+    matrix = moex.imoex.dynamics_matrix(tickers=['SBER', 'GAZP', 'LKOH'], periods=periods)
+    assert matrix.tickers == ['SBER', 'GAZP', 'LKOH']
+    assert matrix.value.shape == matrix.percent.shape == (3, 4)
+    for row, ticker_name in enumerate(matrix.tickers):
+        for column, (period_from, period_to) in enumerate(matrix.periods.values()):
+            dynamics = moex.imoex[ticker_name].dynamics(period_from, period_to)
+            assert matrix.value[row, column] == dynamics.value
+            assert matrix.percent[row, column] == dynamics.percent
+
+
+def test_constituents_are_created_on_first_access(moex: MOEX, stub: IssStub) -> None:
+    assert moex.imoex.constituents.loaded == []
+    requests: int = stub.requests
+    assert moex.imoex.SBER is moex.imoex['SBER']
+    assert moex.imoex.SBER.tech_name == 'SBER'
+    assert moex.imoex.constituents.loaded == ['SBER']
+    assert {'GAZP', 'LKOH'} <= set(dir(moex.imoex))
+    assert stub.requests == requests
+
+
+def test_unknown_constituent(moex: MOEX) -> None:
+    with pytest.raises(AttributeError):
+        _ = moex.imoex.UNKNOWN
+    with pytest.raises(KeyError):
+        _ = moex.imoex['UNKNOWN']
+    assert 'UNKNOWN' not in moex.imoex.constituents
+
+
+def test_historical_constituent(tmp_path: Path) -> None:
+    today: str = str(date.today())
+    composition: list[list] = [
+        ['SBER', '2010-01-01', today, 1], ['GAZP', '2010-01-01', today, 1], ['YNDX', '2014-06-23', PERIOD_FROM, 1]
+    ]
+    url: str = MOEX_REQUESTS['COMPOSITION_INFO_PAGE'].format('index', 'IMOEX', 0).removeprefix('https://iss.moex.com')
+    fixture_path: Path = tmp_path / 'fixtures' / f'{hashlib.sha1(url.encode()).hexdigest()}.json'
+    fixture_path.parent.mkdir()
+    fixture_path.write_text(json.dumps({
+        'tickers': {'columns': ['ticker', 'from', 'till', 'tradingsession'], 'data': composition},
+        'tickers.cursor': {'columns': ['INDEX', 'TOTAL', 'PAGESIZE'], 'data': [[0, 3, 100]]}
+    }))
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    with IssStub(fixture_path.parent) as stub, Transport(base_url=stub.base_url) as transport:
+        with MOEX(candle_store=candle_store, transport=transport) as moex:
+            assert moex.imoex.actual_composition_index_tickers == ['SBER', 'GAZP']
+            assert moex.imoex.constituents.tickers == ['SBER', 'GAZP', 'YNDX']
+            assert moex.imoex.YNDX is moex.imoex['YNDX']
+            intervals: dict = moex.imoex.constituents_interval(PERIOD_FROM, soft_search='back', tickers=['YNDX'])
+            assert intervals['YNDX'].max_value == moex.imoex.YNDX.interval(PERIOD_FROM, soft_search='back').max_value
+    candle_store.close()
@@ -0,0 +1,163 @@
+"""
+Tests of the online statistics of the interval, of adding new candles to the interval and of streaming candles from
+    the local stand-in of ISS MOEX.
+"""
+
+# standard library imports
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+# third party imports
+import numpy as np
+import pytest
+
+# local imports
+from moex import MOEX
+from tech.candles import Candles
+from tech.interval import Interval
+from custom.candle_store import CandleStore
+from custom.transport import Transport
+from custom.metrics import ComputeEvent, MetricsHook, metrics
+from benchmarks.iss_stub import IssStub
+
+PERIOD: dict[str, date] = {'period_from': date(2026, 10, 12), 'period_to': date(2026, 10, 16)}
+
+
+def make_rows(closes: list[float], first_begin: datetime, minutes: int = 10) -> list[list]:
+    """
+    Function for creating rows of candles of ISS MOEX with the specified close values.
+    """
+    rows: list[list] = []
+    for num, close in enumerate(closes):
+        begin: datetime = first_begin + timedelta(minutes=minutes * num)
+        end: datetime = begin + timedelta(minutes=minutes, seconds=-1)
+        rows.append([close, close, close + 1, close - 1, 100.0 * close, 10, str(begin), str(end)])
+    return rows
+
+
+def make_interval(rows: list[list]) -> Interval:
+    """
+    Function for creating the interval from rows of candles.
+    """
+    return Interval('SBER', Candles.from_rows(rows), PERIOD, return_datetime_str=True)
+
+
+def assert_same(interval: Interval, rows: list[list]) -> None:
+    """
+    Function for comparing the interval with the interval calculated from scratch.
+    """
+    reference: Interval = make_interval(rows)
+    assert interval.max_value == reference.max_value
+    assert interval.min_value == reference.min_value
+    assert interval.avg_value == pytest.approx(reference.avg_value)
+    assert len(interval.candles) == len(rows)
+    np.testing.assert_array_equal(interval.candles.begin, reference.candles.begin)
+    np.testing.assert_array_equal(interval.candles.close, reference.candles.close)
+    for column in ('days', 'open', 'close', 'high', 'low', 'value', 'volume', 'last_end'):
+        np.testing.assert_array_equal(getattr(interval.daily(), column), getattr(reference.daily(), column))
+
+
+def test_extend_appends_later_candles() -> None:
+    rows: list[list] = make_rows([10, 12, 11, 9, 13], datetime(2026, 10, 15, 10))
+    interval: Interval = make_interval(rows[:3])
+    assert interval.extend(Candles.from_rows(rows[2:])) == 3
+    assert_same(interval, rows)
+
+
+def test_extend_ignores_earlier_candles() -> None:
+    rows: list[list] = make_rows([10, 12, 11], datetime(2026, 10, 15, 10))
+    interval: Interval = make_interval(rows)
+    assert interval.extend(Candles.from_rows(rows[:2])) == 0
+    assert_same(interval, rows)
+
+
+@pytest.mark.parametrize('updates', [[20.0], [5.0], [20.0, 15.0], [5.0, 30.0, 11.0]])
+def test_extend_replaces_forming_candle(updates: list[float]) -> None:
+    rows: list[list] = make_rows([10, 12, 11], datetime(2026, 10, 15, 10))
+    interval: Interval = make_interval(rows)
+    for num, close in enumerate(updates, 1):
+        forming: list = list(rows[-1])
+        forming[0:4] = [close, close, close + 1, close - 1]
+        forming[7] = str(datetime.fromisoformat(forming[6]) + timedelta(minutes=num))
+        rows[-1] = forming
+        assert interval.extend(Candles.from_rows([forming])) == 1
+        assert_same(interval, rows)
+
+
+def test_extend_replaces_forming_candle_and_appends_next_day() -> None:
+    rows: list[list] = make_rows([10, 12, 11], datetime(2026, 10, 15, 18, 10))
+    interval: Interval = make_interval(rows)
+    next_rows: list[list] = make_rows([7, 8], datetime(2026, 10, 16, 10))
+    rows[-1] = rows[-1][:1] + [25] + rows[-1][2:]
+    assert interval.extend(Candles.from_rows([rows[-1], *next_rows])) == 3
+    assert_same(interval, rows + next_rows)
+    assert len(interval.daily()) == 2
+
+
+def test_streamed_stats_match_candles() -> None:
+    rows: list[list] = make_rows([float(close) for close in np.random.default_rng(1).integers(1, 100, 97)],
+                                 datetime(2026, 10, 12, 10), minutes=60)
+    interval: Interval = make_interval(rows[:1])
+    for start in range(1, len(rows), 7):
+        interval.extend(Candles.from_rows(rows[start - 1:start + 7]))
+    assert_same(interval, rows)
+
+
+@pytest.mark.parametrize('resolution', ['1m', '10m', '1d'])
+def test_stream_mode_matches_range_mode(tmp_path: Path, resolution: str) -> None:
+    period_from: str = str(date.today() - timedelta(days=10))
+    stream_store: CandleStore = CandleStore(tmp_path / 'stream.sqlite3')
+    range_store: CandleStore = CandleStore(tmp_path / 'range.sqlite3')
+    with IssStub(tickers=3) as stub, Transport(base_url=stub.base_url) as transport:
+        with MOEX(candle_store=range_store, transport=transport) as moex:
+            reference: Interval = moex.imoex.SBER.interval(period_from, soft_search='back', resolution=resolution)
+        with MOEX(candle_store=stream_store, transport=transport) as moex:
+            for _ in range(2):
+                interval: Interval = moex.imoex.SBER.interval(
+                    period_from, soft_search='back', fetch_mode='stream', resolution=resolution
+                )
+                assert interval.max_value == reference.max_value
+                assert interval.min_value == reference.min_value
+                assert interval.avg_value == pytest.approx(reference.avg_value)
+                for column in ('days', 'open', 'close', 'high', 'low', 'value', 'volume', 'last_end'):
+                    np.testing.assert_array_equal(
+                        getattr(interval.daily(), column), getattr(reference.daily(), column)
+                    )
+            chunks: list[Candles] = list(
+                moex.imoex.SBER.candles_stream(period_from, soft_search='back', resolution=resolution)
+            )
+    np.testing.assert_array_equal(Candles.concat(chunks).begin, reference.candles.begin)
+    np.testing.assert_array_equal(Candles.concat(chunks).close, reference.candles.close)
+    stream_store.close()
+    range_store.close()
+
+
+class ComputeRecorder(MetricsHook):
+    """
+    Class for collecting events of calculations.
+    """
+    def __init__(self) -> None:
+        self.events: list[ComputeEvent] = []
+
+    def on_compute(self, event: ComputeEvent) -> None:
+        self.events.append(event)
+
+
+@pytest.mark.parametrize('fetch_mode', ['day', 'range', 'stream'])
+def test_interval_emits_conversion_of_candles(tmp_path: Path, fetch_mode: str) -> None:
+    period_from: str = str(date.today() - timedelta(days=10))
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    recorder: ComputeRecorder = ComputeRecorder()
+    with IssStub(tickers=3) as stub, Transport(base_url=stub.base_url) as transport:
+        with MOEX(candle_store=candle_store, transport=transport) as moex:
+            metrics.add_hook(recorder)
+            try:
+                moex.imoex.SBER.interval(period_from, soft_search='back', fetch_mode=fetch_mode)
+            finally:
+                metrics.remove_hook(recorder)
+    events: list[ComputeEvent] = [event for event in recorder.events if event.name == 'Candles.from_rows']
+    interval_event: ComputeEvent = next(event for event in recorder.events if event.name.startswith('Interval'))
+    assert events
+    assert {event.tech_name for event in events} == {'SBER'}
+    assert sum(event.rows for event in events) == interval_event.rows > 0
+    candle_store.close()
@@ -0,0 +1,99 @@
+"""
+Tests of MOEX and of its use from the event loop of the caller against the local stand-in of ISS MOEX.
+"""
+
+# standard library imports
+import asyncio
+from pathlib import Path
+from datetime import date, timedelta
+
+# third party imports
+import pytest
+
+# local imports
+from moex import AsyncMOEX, MOEX
+from custom.candle_store import CandleStore
+from custom.transport import Transport
+from benchmarks.iss_stub import IssStub
+import custom.custom_exceptions as ce
+
+
+def test_lazy_properties_raise_in_running_loop(tmp_path: Path) -> None:
+    async def main() -> None:
+        moex: AsyncMOEX = await AsyncMOEX.create(candle_store=candle_store, transport=transport, prefetch=False)
+        with pytest.raises(ce.EventLoopIsRunning):
+            _ = moex.imoex
+        with pytest.raises(ce.EventLoopIsRunning):
+            _ = moex.last_trade_day
+        await transport.close_async()
+
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    transport: Transport = Transport(base_url='http://127.0.0.1:9')
+    asyncio.run(main())
+    candle_store.close()
+
+
+def test_transport_run_closes_coroutine_in_running_loop() -> None:
+    async def never_awaited() -> None:
+        pass
+
+    async def main() -> None:
+        coroutine = never_awaited()
+        with pytest.raises(ce.EventLoopIsRunning):
+            transport.run(coroutine)
+        assert coroutine.cr_frame is None
+
+    transport: Transport = Transport()
+    asyncio.run(main())
+
+
+def test_async_loaders_without_prefetch(tmp_path: Path) -> None:
+    async def main() -> None:
+        async with Transport(base_url=stub.base_url) as transport:
+            moex: AsyncMOEX = await AsyncMOEX.create(candle_store=candle_store, transport=transport, prefetch=False)
+            imoex = await moex.get_imoex_async()
+            assert 'SBER' in imoex.actual_composition_index_tickers
+            assert imoex.SBER.tech_name == 'SBER'
+            assert (await moex.get_rgbi_async()).tech_name == 'RGBI'
+
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    with IssStub(tickers=5) as stub:
+        asyncio.run(main())
+    candle_store.close()
+
+
+def test_async_api_matches_sync_api(tmp_path: Path) -> None:
+    period_from: str = str(date.today() - timedelta(days=20))
+
+    async def main() -> tuple[list, list, list]:
+        async with Transport(base_url=stub.base_url) as transport:
+            async with await AsyncMOEX.create(candle_store=async_store, transport=transport) as moex:
+                intervals: list = await asyncio.gather(
+                    moex.imoex.interval_async(period_from, soft_search='back'),
+                    moex.imoex.SBER.interval_async(period_from, soft_search='back'),
+                    moex.imoex.GAZP.interval_async(period_from, soft_search='back')
+                )
+                dynamics = await moex.rgbi.dynamics_async(period_from, soft_search='back')
+        return (
+            [interval.max_value for interval in intervals],
+            [interval.avg_value for interval in intervals],
+            [dynamics.full_info]
+        )
+
+    sync_store: CandleStore = CandleStore(tmp_path / 'sync.sqlite3')
+    async_store: CandleStore = CandleStore(tmp_path / 'async.sqlite3')
+    with IssStub(tickers=5) as stub:
+        with Transport(base_url=stub.base_url) as transport, MOEX(candle_store=sync_store, transport=transport) as moex:
+            intervals = [
+                moex.imoex.interval(period_from, soft_search='back'),
+                moex.imoex.SBER.interval(period_from, soft_search='back'),
+                moex.imoex.GAZP.interval(period_from, soft_search='back')
+            ]
+            expected: tuple[list, list, list] = (
+                [interval.max_value for interval in intervals],
+                [interval.avg_value for interval in intervals],
+                [moex.rgbi.dynamics(period_from, soft_search='back').full_info]
+            )
+        assert asyncio.run(main()) == expected
+    sync_store.close()
+    async_store.close()
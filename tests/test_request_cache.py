@@ -0,0 +1,168 @@
+"""
+Tests of the cache of responses of ISS MOEX and of the policy of caching.
+"""
+
+# standard library imports
+import asyncio
+from datetime import date, timedelta
+from collections.abc import Callable, Coroutine
+
+# third party imports
+import pytest
+
+# local imports
+from custom.cache_policy import CachePolicy
+from custom.request_cache import RequestCache
+
+CANDLES_URL: str = (
+    'https://iss.moex.com/iss/engines/stock/markets/shares/securities/SBER/candles.json'
+    '?from={0}&till={0}&interval=10&iss.meta=off&iss.only=candles'
+)
+METADATA_URL: str = 'https://iss.moex.com/iss/securities/{0}.json?iss.meta=off&iss.only=description'
+
+
+def counting(response: dict | None = None, delay: float = 0.0) -> tuple[Callable[[], Coroutine], list[int]]:
+    """
+    Function for creating the fetch function which counts its calls.
+
+    Returns:
+        First element: fetch function. It raises ValueError if the response is None.
+
+        Second element: list which receives the number of every call.
+    """
+    calls: list[int] = []
+
+    async def fetch() -> dict:
+        calls.append(len(calls) + 1)
+        await asyncio.sleep(delay)
+        if response is None:
+            raise ValueError()
+        return response
+
+    return fetch, calls
+
+
+def test_concurrent_requests_share_one_fetch() -> None:
+    async def main() -> list[dict]:
+        return await asyncio.gather(*(cache.get(METADATA_URL.format('SBER'), fetch) for _ in range(5)))
+
+    cache: RequestCache = RequestCache()
+    fetch, calls = counting({'description': {'data': [[1]]}}, delay=0.01)
+    assert asyncio.run(main()) == [{'description': {'data': [[1]]}}] * 5
+    assert calls == [1]
+    assert cache.in_flight == 0
+    assert len(cache) == 1
+
+
+def test_failed_fetch_is_not_cached() -> None:
+    async def main() -> None:
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await cache.get(METADATA_URL.format('SBER'), fetch)
+
+    cache: RequestCache = RequestCache()
+    fetch, calls = counting()
+    asyncio.run(main())
+    assert calls == [1, 2]
+    assert len(cache) == 0
+
+
+def test_not_cached_request_is_not_saved() -> None:
+    async def main() -> None:
+        for _ in range(2):
+            await cache.get(METADATA_URL.format('SBER'), fetch, cache=False)
+
+    cache: RequestCache = RequestCache()
+    fetch, calls = counting({'description': {'data': []}})
+    asyncio.run(main())
+    assert calls == [1, 2]
+    assert len(cache) == 0
+    assert cache.stats['total'] == {'hits': 0, 'misses': 0, 'evictions': 0}
+
+
+def test_expired_responses_are_requested_and_removed() -> None:
+    async def main() -> None:
+        await cache.get(METADATA_URL.format('SBER'), fetch)
+        await cache.get(METADATA_URL.format('GAZP'), fetch)
+        assert METADATA_URL.format('SBER') in cache
+        await asyncio.sleep(0.06)
+        assert METADATA_URL.format('SBER') not in cache
+        await cache.get(METADATA_URL.format('LKOH'), fetch)
+        assert len(cache) == 1
+        await cache.get(METADATA_URL.format('LKOH'), fetch)
+
+    cache: RequestCache = RequestCache(CachePolicy(ttl={'metadata': 0.05}))
+    fetch, calls = counting({'description': {'data': [[1]]}})
+    asyncio.run(main())
+    assert calls == [1, 2, 3]
+    assert cache.stats['metadata'] == {'hits': 1, 'misses': 3, 'evictions': 0}
+
+
+def test_least_recently_used_response_is_evicted() -> None:
+    async def main() -> None:
+        for ticker_name in ('SBER', 'GAZP', 'SBER', 'LKOH'):
+            await cache.get(METADATA_URL.format(ticker_name), fetch)
+
+    cache: RequestCache = RequestCache(CachePolicy(max_size=2))
+    fetch, calls = counting({'description': {'data': [[1]]}})
+    asyncio.run(main())
+    assert calls == [1, 2, 3]
+    assert METADATA_URL.format('SBER') in cache
+    assert METADATA_URL.format('GAZP') not in cache
+    assert METADATA_URL.format('LKOH') in cache
+    assert cache.stats['metadata'] == {'hits': 1, 'misses': 3, 'evictions': 1}
+    assert cache.stats['total'] == cache.stats['metadata']
+
+
+def test_cache_is_bounded_by_size() -> None:
+    async def main() -> None:
+        for ticker_name in ('SBER', 'GAZP', 'LKOH'):
+            await cache.get(METADATA_URL.format(ticker_name), fetch)
+        await cache.get(METADATA_URL.format('LARGE'), large_fetch)
+
+    response: dict = {'description': {'data': [[num] for num in range(10)]}}
+    size: int = RequestCache.get_size(response)
+    cache: RequestCache = RequestCache(CachePolicy(max_bytes=size * 2))
+    fetch, _ = counting(response)
+    large_fetch, _ = counting({'description': {'data': [[num] for num in range(100)]}})
+    asyncio.run(main())
+    assert len(cache) == 2
+    assert cache.size == size * 2
+    assert METADATA_URL.format('SBER') not in cache
+    assert METADATA_URL.format('LARGE') not in cache
+    assert cache.stats['metadata']['evictions'] == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+@pytest.mark.parametrize('url, cache_class', [
+    (CANDLES_URL.format(date.today() - timedelta(days=1)), 'candles'),
+    (CANDLES_URL.format(date.today()), 'candles'),
+    ('https://iss.moex.com/iss/calendars/off_days.json?iss.meta=off', 'calendar'),
+    ('https://iss.moex.com/iss/statistics/engines/stock/markets/index/analytics/IMOEX/tickers.json', 'composition'),
+    (METADATA_URL.format('SBER'), 'metadata')
+])
+def test_classify(url: str, cache_class: str) -> None:
+    assert CachePolicy.classify(url) == cache_class
+
+
+def test_ttl_of_classes() -> None:
+    policy: CachePolicy = CachePolicy(ttl={'calendar': None, 'composition': 5})
+    assert policy.get_ttl('calendar') == float('inf')
+    assert policy.get_ttl('composition') == 5
+    assert policy.get_ttl('candles') == 0
+    assert policy.get_ttl('unknown') == 0
+
+
+def test_candles_are_not_saved() -> None:
+    async def main() -> None:
+        for _ in range(2):
+            await cache.get(CANDLES_URL.format(date.today() - timedelta(days=1)), fetch)
+
+    cache: RequestCache = RequestCache()
+    fetch, calls = counting({'candles': {'data': [[1]]}})
+    asyncio.run(main())
+    assert calls == [1, 2]
+    assert len(cache) == 0
@@ -0,0 +1,98 @@
+"""
+Tests of the scheduler of requests to ISS MOEX.
+"""
+
+# standard library imports
+import asyncio
+from time import perf_counter
+
+# third party imports
+import aiohttp
+import pytest
+
+# local imports
+from custom.scheduler import RequestScheduler
+from custom.transport import Transport
+from custom.custom_functions import Helper
+from benchmarks.iss_stub import IssStub
+from values.constans import MOEX_REQUESTS
+import custom.custom_exceptions as ce
+
+
+def test_every_attempt_is_queued_again() -> None:
+    attempts: list[tuple[float, float]] = []
+
+    async def request(queued_at: float) -> str:
+        attempts.append((queued_at, perf_counter()))
+        if len(attempts) < 3:
+            await asyncio.sleep(0.02)
+            raise aiohttp.ClientConnectionError()
+        return 'ok'
+
+    scheduler: RequestScheduler = RequestScheduler(retries=3, backoff_base=0.02, backoff_max=0.02)
+    assert asyncio.run(scheduler.run(request)) == 'ok'
+    assert len(attempts) == 3
+    for (_, previous_started_at), (queued_at, started_at) in zip(attempts, attempts[1:]):
+        assert queued_at > previous_started_at + 0.02
+        assert started_at - queued_at < 0.02
+
+
+def test_not_retryable_error_is_raised() -> None:
+    attempts: list[float] = []
+
+    async def request(queued_at: float) -> None:
+        attempts.append(queued_at)
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        asyncio.run(RequestScheduler(retries=3).run(request))
+    assert len(attempts) == 1
+
+
+def request_main_info(base_url: str, scheduler: RequestScheduler, tickers: int) -> dict[str, dict]:
+    """
+    Function for requesting main information of the tickers from the stand-in of ISS MOEX without the cache.
+
+    Returns:
+        responses by tickers.
+    """
+    async def main() -> dict[str, dict]:
+        async with Transport(base_url=base_url, scheduler=scheduler) as transport:
+            return await Helper.generate_requests(
+                transport=transport,
+                urls={f'T{num}': MOEX_REQUESTS['MAIN_INFO'] for num in range(tickers)},
+                additional_params={f'T{num}': [f'T{num}'] for num in range(tickers)},
+                cache=False
+            )
+
+    return asyncio.run(main())
+
+
+def test_throttled_requests_are_retried() -> None:
+    scheduler: RequestScheduler = RequestScheduler(
+        requests_per_second=1000, burst=1000, retries=10, backoff_base=0.1, backoff_max=0.5
+    )
+    with IssStub(rate_limit=20) as stub:
+        responses: dict[str, dict] = request_main_info(stub.base_url, scheduler, 30)
+    assert len(responses) == 30
+    assert responses['T7']['description']['data'][0][2] == 'T7'
+    assert stub.throttled > 0
+    assert stub.requests == 30 + stub.throttled
+
+
+def test_server_errors_are_retried() -> None:
+    scheduler: RequestScheduler = RequestScheduler(retries=3, backoff_base=0.01, backoff_max=0.01)
+    with IssStub(error_every=3) as stub:
+        responses: dict[str, dict] = request_main_info(stub.base_url, scheduler, 30)
+    assert len(responses) == 30
+    assert stub.errors > 0
+    assert stub.requests == 30 + stub.errors
+
+
+def test_server_errors_fail_without_retries() -> None:
+    with IssStub(error_every=3) as stub:
+        with pytest.raises(ce.RequestsFailed) as exc_info:
+            request_main_info(stub.base_url, RequestScheduler(retries=0), 30)
+    assert len(exc_info.value.failures) == stub.errors == 10
+    assert len(exc_info.value.responses) == 20
+    assert all(error.status == 503 for error in exc_info.value.failures.values())
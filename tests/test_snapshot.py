@@ -0,0 +1,128 @@
+"""
+Tests of the startup snapshot of MOEX and of restoring MOEX from it against the local stand-in of ISS MOEX.
+"""
+
+# standard library imports
+import json
+from pathlib import Path
+from datetime import datetime
+
+# third party imports
+import pytest
+
+# local imports
+from moex import MOEX
+from custom.snapshot import Snapshot
+from custom.candle_store import CandleStore
+from custom.transport import Transport
+from benchmarks.iss_stub import IssStub
+from custom.trading_calendar import TradingCalendar
+from values.constans import SNAPSHOT
+
+OFF_DAYS: list[list] = [
+    ['2024-06-12', 0, 0, 0],
+    ['2024-11-02', 1, 1, 1],
+    ['2024-11-04', 0, 0, 0]
+]
+MAIN_INFO: dict[str, dict[str, str]] = {'IMOEX': {'NAME': 'Индекс МосБиржи'}, 'RGBI': {'NAME': 'RGBI'}}
+COMPOSITION: dict[str, list[list]] = {'IMOEX': [['SBER', '2010-01-01', '2024-11-01', 1]]}
+
+
+@pytest.mark.parametrize('moment, valid_until', [
+    (datetime(2024, 6, 10, 9, 0), datetime(2024, 6, 10, 10, 1)),
+    (datetime(2024, 6, 10, 10, 1), datetime(2024, 6, 11, 10, 1)),
+    (datetime(2024, 6, 11, 19, 0), datetime(2024, 6, 13, 10, 1)),
+    (datetime(2024, 11, 1, 12, 0), datetime(2024, 11, 2, 10, 1)),
+    (datetime(2024, 11, 2, 12, 0), datetime(2024, 11, 5, 10, 1))
+])
+def test_valid_until_next_session(moment: datetime, valid_until: datetime) -> None:
+    assert Snapshot.get_valid_until(TradingCalendar(OFF_DAYS), moment) == valid_until
+
+
+def test_is_valid() -> None:
+    data: dict = {'valid_until': '2024-06-13 10:01:00'}
+    assert Snapshot.is_valid(data, datetime(2024, 6, 13, 10, 0, 59))
+    assert not Snapshot.is_valid(data, datetime(2024, 6, 13, 10, 1))
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    snapshot: Snapshot = Snapshot(tmp_path / 'nested' / 'snapshot.json')
+    data: dict = snapshot.save(OFF_DAYS, MAIN_INFO, COMPOSITION)
+    assert data['version'] == SNAPSHOT.VERSION
+    assert snapshot.load() == data
+    assert [path.name for path in snapshot.path.parent.iterdir()] == ['snapshot.json']
+
+
+@pytest.mark.parametrize('content', [
+    b'',
+    b'{"version": ',
+    b'[]',
+    json.dumps({'version': SNAPSHOT.VERSION + 1}).encode()
+])
+def test_load_rejects_damaged_or_other_version(tmp_path: Path, content: bytes) -> None:
+    snapshot: Snapshot = Snapshot(tmp_path / 'snapshot.json')
+    snapshot.path.write_bytes(content)
+    assert snapshot.load() is None
+    assert Snapshot(tmp_path / 'missing.json').load() is None
+
+
+def test_failed_save_keeps_previous_snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def dump(data: dict, file, **_) -> None:
+        file.write('{"version": ')
+        raise OSError('No space left on device')
+
+    snapshot: Snapshot = Snapshot(tmp_path / 'snapshot.json')
+    data: dict = snapshot.save(OFF_DAYS, MAIN_INFO, COMPOSITION)
+    monkeypatch.setattr(json, 'dump', dump)
+    with pytest.raises(OSError):
+        snapshot.save(OFF_DAYS, {}, {})
+    assert snapshot.load() == data
+
+
+def save_snapshot(stub: IssStub, candle_store: CandleStore, path: Path) -> None:
+    """
+    Function for saving the snapshot of MOEX loaded from the stand-in of ISS MOEX.
+
+    Returns:
+        None
+    """
+    with Transport(base_url=stub.base_url) as transport:
+        with MOEX(candle_store=candle_store, transport=transport, snapshot_path=path) as moex:
+            moex.save_snapshot()
+
+
+def test_restore_inside_valid_until(tmp_path: Path) -> None:
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    with IssStub(tickers=5) as stub:
+        save_snapshot(stub, candle_store, tmp_path / 'snapshot.json')
+        requests: int = stub.requests
+        with Transport(base_url=stub.base_url) as transport:
+            with MOEX(candle_store=candle_store, transport=transport, snapshot_path=tmp_path / 'snapshot.json') as moex:
+                assert moex.snapshot_refresh is None
+                assert moex.last_trade_day
+                assert moex.imoex.actual_composition_index_tickers == ['SBER', 'GAZP', 'LKOH', 'T000', 'T001']
+                assert moex.imoex.SBER.tech_name == 'SBER'
+                assert moex.imoex.initialcapitalization == 1000000000.0
+                assert moex.rgbi.name
+        assert stub.requests == requests
+    candle_store.close()
+
+
+def test_restore_outside_valid_until_is_refreshed(tmp_path: Path) -> None:
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    path: Path = tmp_path / 'snapshot.json'
+    with IssStub(tickers=5) as stub:
+        save_snapshot(stub, candle_store, path)
+        stale: dict = {**json.loads(path.read_bytes()), 'valid_until': '2024-01-03 10:01:00'}
+        path.write_text(json.dumps(stale), encoding='utf-8')
+        requests: int = stub.requests
+        with Transport(base_url=stub.base_url) as transport:
+            with MOEX(candle_store=candle_store, transport=transport, snapshot_path=path) as moex:
+                assert moex.imoex.actual_composition_index_tickers == ['SBER', 'GAZP', 'LKOH', 'T000', 'T001']
+                assert moex.snapshot_refresh is not None
+                moex.snapshot_refresh.join()
+        assert stub.requests > requests
+    refreshed: dict = Snapshot(path).load()
+    assert Snapshot.is_valid(refreshed)
+    assert refreshed['composition'] == stale['composition']
+    candle_store.close()
@@ -0,0 +1,146 @@
+"""
+Tests of publishing live candles by the subscriber, with scripted responses and against the local stand-in of ISS
+    MOEX.
+"""
+
+# standard library imports
+import asyncio
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+# third party imports
+import pytest
+
+# local imports
+import tech.subscriber
+from moex import MOEX
+from tech.subscriber import CandleSubscriber
+from custom.custom_functions import Helper
+from custom.candle_store import CandleStore
+from custom.transport import Transport
+from custom.trading_calendar import TradingCalendar
+from benchmarks.iss_stub import IssStub, make_candles
+from values.constans import PAGINATION
+
+CALENDAR: TradingCalendar = TradingCalendar([['2026-11-04', 0, 0, 0]])
+
+
+class Instrument:
+    """
+    Stand-in of the instrument which has only the names.
+    """
+    tech_name: str = 'SBER'
+    tech_type: str = 'shares'
+
+
+def make_row(begin: str, end: str, close: float = 100.0) -> list:
+    """
+    Function for creating the row of the candle of ISS MOEX.
+    """
+    return [close, close, close, close, 1000.0, 10, f'2026-10-16 {begin}', f'2026-10-16 {end}']
+
+
+def poll(monkeypatch: pytest.MonkeyPatch, subscriber: CandleSubscriber, now: str, rows: list[list]) -> list[str]:
+    """
+    Function for polling the subscriber at the moment with the scripted response.
+
+    Returns:
+        begins of the published candles.
+    """
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None) -> datetime:
+            return datetime.fromisoformat(f'2026-10-16 {now}')
+
+    async def generate_requests(**_) -> dict[str, dict]:
+        return {'SBER': {'candles': {'data': rows}}}
+
+    monkeypatch.setattr(tech.subscriber, 'datetime', FrozenDatetime)
+    monkeypatch.setattr(Helper, 'generate_requests', generate_requests)
+    published: dict = asyncio.run(subscriber.poll_async())
+    return [str(begin)[11:] for begin in published['SBER'].begin] if 'SBER' in published else []
+
+
+def make_subscriber(closed_only: bool, resolution: str = '10m') -> CandleSubscriber:
+    """
+    Function for creating the subscriber to one instrument from 10:00.
+    """
+    return CandleSubscriber(
+        [Instrument()], None, CALENDAR, since=datetime(2026, 10, 16, 10), closed_only=closed_only,
+        resolution=resolution
+    )
+
+
+def test_forming_candle_is_published_once_closed(monkeypatch: pytest.MonkeyPatch) -> None:
+    subscriber: CandleSubscriber = make_subscriber(closed_only=True)
+    closed: list[list] = [make_row('10:00:00', '10:09:59'), make_row('10:10:00', '10:19:59')]
+    assert poll(monkeypatch, subscriber, '10:25:00', [*closed, make_row('10:20:00', '10:23:10')]) == [
+        '10:00:00', '10:10:00'
+    ]
+    assert poll(monkeypatch, subscriber, '10:27:00', [closed[1], make_row('10:20:00', '10:26:40', 101)]) == []
+    assert poll(monkeypatch, subscriber, '10:31:00', [
+        make_row('10:20:00', '10:29:59', 102), make_row('10:30:00', '10:30:40')
+    ]) == ['10:20:00']
+    assert poll(monkeypatch, subscriber, '10:32:00', [make_row('10:20:00', '10:29:59', 102)]) == []
+
+
+def test_forming_candle_is_published_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    subscriber: CandleSubscriber = make_subscriber(closed_only=False)
+    assert poll(monkeypatch, subscriber, '10:05:00', [make_row('10:00:00', '10:04:10')]) == ['10:00:00']
+    assert poll(monkeypatch, subscriber, '10:08:00', [make_row('10:00:00', '10:07:50', 101)]) == []
+    assert poll(monkeypatch, subscriber, '10:11:00', [
+        make_row('10:00:00', '10:09:59', 102), make_row('10:10:00', '10:10:30')
+    ]) == ['10:10:00']
+
+
+def test_daily_candle_beginning_at_since(monkeypatch: pytest.MonkeyPatch) -> None:
+    subscriber: CandleSubscriber = CandleSubscriber(
+        [Instrument()], None, CALENDAR, since=datetime(2026, 10, 16), closed_only=False, resolution='1d'
+    )
+    assert poll(monkeypatch, subscriber, '12:00:00', [make_row('00:00:00', '11:59:00')]) == ['00:00:00']
+
+
+@pytest.mark.parametrize(('moment', 'expected'), [
+    (datetime(2026, 10, 16, 12), False),
+    (datetime(2026, 10, 16, 19), True),
+    (datetime(2026, 10, 17, 12), True),
+    (datetime(2026, 11, 4, 12), True),
+    (datetime(2026, 11, 5, 9), False)
+])
+def test_is_day_over(moment: datetime, expected: bool) -> None:
+    assert make_subscriber(closed_only=True).is_day_over(moment) is expected
+
+
+def test_run_stops_on_day_off(monkeypatch: pytest.MonkeyPatch) -> None:
+    subscriber: CandleSubscriber = make_subscriber(closed_only=True)
+    polls: list[datetime] = []
+
+    async def poll_async() -> dict:
+        polls.append(datetime.now())
+        return {}
+
+    monkeypatch.setattr(subscriber, 'is_day_over', lambda moment=None: True)
+    monkeypatch.setattr(subscriber, 'poll_async', poll_async)
+    asyncio.run(asyncio.wait_for(subscriber.run_async(), timedelta(seconds=5).total_seconds()))
+    assert len(polls) == 1
+
+
+def test_poll_follows_pages(tmp_path: Path) -> None:
+    candle_store: CandleStore = CandleStore(tmp_path / 'candles.sqlite3')
+    with IssStub(tickers=3) as stub, Transport(base_url=stub.base_url) as transport:
+        with MOEX(candle_store=candle_store, transport=transport) as moex:
+            since: datetime = datetime.combine(
+                moex.calendar.prev_trading_day(date.today() - timedelta(days=1), inclusive=True), datetime.min.time()
+            )
+            subscriber: CandleSubscriber = moex.imoex.subscriber(
+                tickers=['SBER', 'GAZP'], since=since, closed_only=False, resolution='1m'
+            )
+            published: dict = transport.run(subscriber.poll_async())
+            assert transport.run(subscriber.poll_async()) == {}
+    for ticker_name in ('SBER', 'GAZP'):
+        expected: list[str] = [
+            row[6] for row in make_candles(ticker_name, since.date(), date.today(), 1) if row[6] >= str(since)
+        ]
+        assert len(expected) > PAGINATION.PAGE_SIZE
+        assert [str(begin).replace('T', ' ') for begin in published[ticker_name].begin] == expected
+    candle_store.close()
@@ -0,0 +1,146 @@
+"""
+Tests of the trading calendar against the brute-force check of days one by one.
+"""
+
+# standard library imports
+import random
+from datetime import date, timedelta
+
+# third party imports
+import numpy as np
+import pytest
+
+# local imports
+from custom.trading_calendar import TradingCalendar
+
+OFF_DAYS: list[list] = [
+    ['2024-01-01', 0, 0, 0],
+    ['2024-01-02', 0, 0, 0],
+    ['2024-01-08', 0, 0, 0],
+    ['2024-02-23', 0, 0, 0],
+    ['2024-03-08', 0, 0, 0],
+    ['2024-04-27', 1, 1, 1],
+    ['2024-04-29', 0, 0, 0],
+    ['2024-04-30', 0, 0, 0],
+    ['2024-05-01', 0, 0, 0],
+    ['2024-05-09', 0, 0, 0],
+    ['2024-05-10', 0, 0, 0],
+    ['2024-06-12', 0, 0, 0],
+    ['2024-11-02', 1, 1, 1],
+    ['2024-11-04', 0, 0, 0],
+    ['2024-12-28', 1, 1, 1],
+    ['2024-12-30', 0, 0, 0],
+    ['2024-12-31', 0, 0, 0],
+    ['2025-01-01', 0, 0, 0],
+    ['2025-01-02', 0, 0, 0],
+    ['2025-01-03', 0, 0, 0],
+    ['2025-01-06', 0, 0, 0],
+    ['2025-01-07', 0, 0, 0],
+    ['2025-01-08', 0, 0, 0],
+    ['2025-05-01', 0, 0, 0],
+    ['2025-11-01', 1, 1, 1],
+    ['2025-12-31', 0, 0, 0]
+]
+COVERED_FROM: date = date(2024, 1, 1)
+COVERED_TO: date = date(2025, 12, 31)
+
+
+def brute_is_trading_day(day: date) -> bool:
+    """
+    Function for checking the day by the listed days off and working days, other days are trading from Monday to
+        Friday.
+    """
+    for listed_day, *_, currency in OFF_DAYS:
+        if listed_day == str(day):
+            return currency == 1
+    return day.weekday() < 5
+
+
+def brute_trading_days(period_from: date, period_to: date) -> list[date]:
+    """
+    Function for collecting trading days of the period by checking days one by one.
+    """
+    days: list[date] = []
+    day: date = period_from
+    while day <= period_to:
+        if brute_is_trading_day(day):
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def brute_next_trading_day(day: date, inclusive: bool) -> date:
+    """
+    Function for finding the closest trading day after the day by checking days one by one.
+    """
+    day: date = day if inclusive else day + timedelta(days=1)
+    while not brute_is_trading_day(day):
+        day += timedelta(days=1)
+    return day
+
+
+def brute_prev_trading_day(day: date, inclusive: bool) -> date:
+    """
+    Function for finding the closest trading day before the day by checking days one by one.
+    """
+    day: date = day if inclusive else day - timedelta(days=1)
+    while not brute_is_trading_day(day):
+        day -= timedelta(days=1)
+    return day
+
+
+def all_days(period_from: date = date(2023, 10, 1), period_to: date = date(2026, 3, 31)) -> list[date]:
+    """
+    Function for listing the days around the covered years.
+    """
+    return [period_from + timedelta(days=num) for num in range((period_to - period_from).days + 1)]
+
+
+@pytest.fixture(scope='module')
+def calendar() -> TradingCalendar:
+    return TradingCalendar(OFF_DAYS)
+
+
+def test_is_trading_day(calendar: TradingCalendar) -> None:
+    for day in all_days():
+        assert calendar.is_trading_day(day) == brute_is_trading_day(day), day
+
+
+@pytest.mark.parametrize('inclusive', [False, True])
+def test_next_and_prev_trading_day(calendar: TradingCalendar, inclusive: bool) -> None:
+    for day in all_days():
+        assert calendar.next_trading_day(day, inclusive) == brute_next_trading_day(day, inclusive), day
+        assert calendar.prev_trading_day(day, inclusive) == brute_prev_trading_day(day, inclusive), day
+
+
+def test_year_boundaries(calendar: TradingCalendar) -> None:
+    assert calendar.next_trading_day(date(2024, 12, 27)) == date(2024, 12, 28)
+    assert calendar.next_trading_day(date(2024, 12, 28)) == date(2025, 1, 9)
+    assert calendar.prev_trading_day(date(2025, 1, 9)) == date(2024, 12, 28)
+    assert calendar.next_trading_day(date(2025, 12, 30)) == date(2026, 1, 1)
+    assert calendar.prev_trading_day(date(2024, 1, 3)) == date(2023, 12, 29)
+    assert calendar.count_trading_days(date(2024, 12, 28), date(2025, 1, 9)) == 2
+
+
+def test_count_and_expand_periods(calendar: TradingCalendar) -> None:
+    days: list[date] = all_days()
+    bounds: list[date] = [
+        date(2023, 10, 1), date(2023, 12, 31), COVERED_FROM, date(2024, 12, 31), date(2025, 1, 1), COVERED_TO,
+        date(2026, 1, 1), date(2026, 3, 31)
+    ]
+    rng: random.Random = random.Random(0)
+    pairs: list[tuple[date, date]] = [(first, last) for first in bounds for last in bounds]
+    pairs += [tuple(sorted(rng.sample(days, 2))) for _ in range(300)]
+    for period_from, period_to in pairs:
+        expected: list[date] = brute_trading_days(period_from, period_to)
+        assert calendar.count_trading_days(period_from, period_to) == len(expected), (period_from, period_to)
+        assert list(calendar.trading_days(period_from, period_to).astype(date)) == expected, (period_from, period_to)
+
+
+def test_days_far_outside_covered_years(calendar: TradingCalendar) -> None:
+    period_from, period_to = date(2010, 1, 1), date(2030, 1, 1)
+    expected: list[date] = brute_trading_days(period_from, period_to)
+    assert calendar.count_trading_days(period_from, period_to) == len(expected)
+    assert np.array_equal(calendar.trading_days(period_from, period_to), np.array(expected, dtype='datetime64[D]'))
+    assert calendar.count_trading_days(date(2030, 1, 1), date(2010, 1, 1)) == 0
+    assert calendar.trading_days(date(2030, 1, 1), date(2010, 1, 1)).size == 0
@@ -8,12 +8,88 @@ from collections import namedtuple
 
 # Request
 MOEX_REQUESTS: dict[str, str] = {
-    'MAIN_INFO': 'https://iss.moex.com/iss/securities/{0}.json',
-    'COMPOSITION_INFO': 'https://iss.moex.com/iss/statistics/engines/stock/markets/{0}/analytics/{1}/tickers.json',
-    'DETAIL_INFO': 'https://iss.moex.com/iss/engines/stock/markets/{0}/securities/{1}/candles.json?from={2}&till={3}',
-    'CALENDAR': 'https://iss.moex.com/iss/calendars/off_days.json'
+    'MAIN_INFO': (
+        'https://iss.moex.com/iss/securities/{0}.json'
+        '?iss.meta=off&iss.only=description&description.columns=name,title,value'
+    ),
+    'COMPOSITION_INFO': (
+        'https://iss.moex.com/iss/statistics/engines/stock/markets/{0}/analytics/{1}/tickers.json'
+        '?iss.meta=off&iss.only=tickers,tickers.cursor'
+    ),
+    'COMPOSITION_INFO_PAGE': (
+        'https://iss.moex.com/iss/statistics/engines/stock/markets/{0}/analytics/{1}/tickers.json'
+        '?iss.meta=off&iss.only=tickers,tickers.cursor&start={2}'
+    ),
+    'DETAIL_INFO': (
+        'https://iss.moex.com/iss/engines/stock/markets/{0}/securities/{1}/candles.json'
+        '?from={2}&till={3}&interval={4}'
+        '&iss.meta=off&iss.only=candles&candles.columns=open,close,high,low,value,volume,begin,end'
+    ),
+    'DETAIL_INFO_PAGE': (
+        'https://iss.moex.com/iss/engines/stock/markets/{0}/securities/{1}/candles.json'
+        '?from={2}&till={3}&interval={4}'
+        '&iss.meta=off&iss.only=candles&candles.columns=open,close,high,low,value,volume,begin,end&start={5}'
+    ),
+    'CALENDAR': 'https://iss.moex.com/iss/calendars/off_days.json?iss.meta=off&iss.only=off_days'
 }
 
+# Transport
+__TRANSPORT: type = namedtuple(
+    'TRANSPORT',
+    ['BASE_URL', 'LIMIT', 'LIMIT_PER_HOST', 'TTL_DNS_CACHE', 'KEEPALIVE_TIMEOUT']
+)
+
+TRANSPORT: __TRANSPORT = __TRANSPORT(
+    BASE_URL='https://iss.moex.com',
+    LIMIT=100,
+    LIMIT_PER_HOST=30,
+    TTL_DNS_CACHE=600,
+    KEEPALIVE_TIMEOUT=60
+)
+
+# Scheduler
+__SCHEDULER: type = namedtuple(
+    'SCHEDULER',
+    [
+        'MAX_IN_FLIGHT', 'REQUESTS_PER_SECOND', 'BURST', 'TIMEOUT',
+        'RETRIES', 'BACKOFF_BASE', 'BACKOFF_MAX', 'RETRY_STATUSES'
+    ]
+)
+
+SCHEDULER: __SCHEDULER = __SCHEDULER(
+    MAX_IN_FLIGHT=20,
+    REQUESTS_PER_SECOND=25,
+    BURST=25,
+    TIMEOUT=30,
+    RETRIES=4,
+    BACKOFF_BASE=0.5,
+    BACKOFF_MAX=15,
+    RETRY_STATUSES=(429, 500, 502, 503, 504)
+)
+
+# Request cache
+__REQUEST_CACHE: type = namedtuple(
+    'REQUEST_CACHE',
+    ['TTL', 'MAX_SIZE', 'MAX_BYTES']
+)
+
+REQUEST_CACHE: __REQUEST_CACHE = __REQUEST_CACHE(
+    TTL={'candles': 0, 'calendar': 3600, 'composition': 3600, 'metadata': 86400},
+    MAX_SIZE=4096,
+    MAX_BYTES=64 * 1024 * 1024
+)
+
+# Pagination
+__PAGINATION: type = namedtuple(
+    'PAGINATION',
+    ['PAGE_SIZE', 'WAVE_SIZE']
+)
+
+PAGINATION: __PAGINATION = __PAGINATION(
+    PAGE_SIZE=500,
+    WAVE_SIZE=4
+)
+
 # Calendar
 __CALENDAR: type = namedtuple(
     'CALENDAR',
@@ -37,11 +113,84 @@ CALENDAR: __CALENDAR = __CALENDAR(
 # Plot
 __PLOTS: type = namedtuple(
     'PLOTS',
-    ['DIRECTORY_NAME', 'W_SIZE', 'H_SIZE']
+    ['DIRECTORY_NAME', 'W_SIZE', 'H_SIZE', 'DPI']
 )
 
 PLOTS: __PLOTS = __PLOTS(
     DIRECTORY_NAME='plots',
     W_SIZE=28,
-    H_SIZE=10
+    H_SIZE=10,
+    DPI=300
+)
+
+# Store
+__STORE: type = namedtuple(
+    'STORE',
+    ['ENV_VAR', 'DIRECTORY_NAME', 'FILE_NAME', 'MAX_VARIABLES', 'SCHEMA_VERSION']
+)
+
+STORE: __STORE = __STORE(
+    ENV_VAR='MOEX_STORE',
+    DIRECTORY_NAME='~/.cache/moexbuilder',
+    FILE_NAME='candles.sqlite3',
+    MAX_VARIABLES=500,
+    SCHEMA_VERSION=1
+)
+
+# Resolution
+__RESOLUTION: type = namedtuple(
+    'RESOLUTION',
+    ['INTERVALS', 'DURATIONS', 'DEFAULT', 'CLOSES', 'STORED']
+)
+
+RESOLUTION: __RESOLUTION = __RESOLUTION(
+    INTERVALS={'1m': 1, '10m': 10, '1h': 60, '1d': 24, '1w': 7, '1M': 31},
+    DURATIONS={'1m': (1, 'm'), '10m': (10, 'm'), '1h': (60, 'm'), '1d': (1, 'D'), '1w': (7, 'D'), '1M': (1, 'M')},
+    DEFAULT='10m',
+    CLOSES='1d',
+    STORED=('1m', '10m', '1h', '1d')
+)
+
+# Dynamics
+__DYNAMICS: type = namedtuple(
+    'DYNAMICS',
+    ['PERIODS', 'DAYS', 'MONTHS']
+)
+
+DYNAMICS: __DYNAMICS = __DYNAMICS(
+    PERIODS=('1D', '1W', '1M', '3M', 'YTD'),
+    DAYS={'1W': 7, '2W': 14},
+    MONTHS={'1M': 1, '3M': 3, '6M': 6, '1Y': 12}
+)
+
+# Snapshot
+__SNAPSHOT: type = namedtuple(
+    'SNAPSHOT',
+    ['VERSION']
+)
+
+SNAPSHOT: __SNAPSHOT = __SNAPSHOT(
+    VERSION=1
+)
+
+# Subscriber
+__SUBSCRIBER: type = namedtuple(
+    'SUBSCRIBER',
+    ['POLL_INTERVAL']
+)
+
+SUBSCRIBER: __SUBSCRIBER = __SUBSCRIBER(
+    POLL_INTERVAL=10
+)
+
+# Profiling
+__PROFILING: type = namedtuple(
+    'PROFILING',
+    ['ENV_VAR', 'TOP_N', 'FRAMES']
+)
+
+PROFILING: __PROFILING = __PROFILING(
+    ENV_VAR='MOEX_PROFILE',
+    TOP_N=25,
+    FRAMES=1
 )